@@ -15,14 +15,85 @@ class Settings(BaseSettings):
     port: int = 8000
 
     # LLM
+    llm_provider: str = "anthropic"  # "anthropic" | "fake"
     llm_model: str = "claude-sonnet-4-5-20250514"
+    llm_fast_model: str = "claude-haiku-4-5-20251001"
     llm_temperature: float = 0.4
     llm_max_tokens: int = 3000
 
+    # Per-request timeouts (seconds); reading types not listed use llm_timeout_seconds
+    llm_timeout_seconds: float = 90.0
+    llm_timeouts_by_type: dict[str, float] = {
+        "timing_now": 30.0,
+        "timing_best_hours": 45.0,
+        "daily": 30.0,
+    }
+    llm_max_retries: int = 0  # SDK-level retries; app.resilience retries instead
+
+    # Retry and circuit breaker (app.resilience)
+    llm_retry_attempts: int = 3
+    llm_retry_base_delay: float = 0.5
+    llm_retry_max_delay: float = 8.0
+    llm_breaker_failure_threshold: int = 5
+    llm_breaker_reset_seconds: float = 30.0
+    redis_breaker_failure_threshold: int = 3
+    redis_breaker_reset_seconds: float = 15.0
+
+    # LLM HTTP connection pool
+    llm_max_connections: int = 50
+    llm_max_keepalive_connections: int = 20
+    llm_keepalive_expiry: float = 30.0
+    llm_http2: bool = False  # needs the `http2` extra (h2)
+    llm_connect_timeout: float = 5.0
+    llm_pool_timeout: float = 10.0
+
+    # Outbound LLM concurrency (per model) and queue deadline
+    llm_concurrency_default: int = 32
+    llm_concurrency_by_model: dict[str, int] = {}
+    llm_queue_timeout_seconds: float = 10.0
+
+    # Time-to-first-token budgets (ms) after which a hedged request is sent
+    llm_hedge_budgets_ms: dict[str, int] = {"timing_now": 1500, "daily": 2000}
+
+    # Fake LLM provider (offline load testing, LLM_PROVIDER=fake)
+    fake_llm_latency_ms: float = 200.0  # time to first token
+    fake_llm_tokens_per_second: float = 50.0
+    fake_llm_error_rate: float = 0.0
+    fake_llm_output_tokens: int = 300
+    fake_llm_seed: int = 0
+
     # Cache TTL (seconds)
     cache_ttl_calculation: int = 86400  # 24 hours
     cache_ttl_interpretation: int = 3600  # 1 hour
     cache_ttl_fortune: int = 86400  # until end of target date
+    # Per-namespace cache key versions overriding app.services.cache_keys
+    cache_key_versions: dict[str, int] = {}
+
+    # Overnight pre-generation of next-day daily fortunes
+    daily_pregen_enabled: bool = False
+    daily_pregen_profiles_path: str = ""  # JSON Lines, one FortuneRequest body per line
+    daily_pregen_hour: int = 2  # server local time
+    daily_pregen_requests_per_minute: float = 60.0
+    daily_pregen_concurrency: int = 4
+    daily_pregen_lock_seconds: int = 600
+
+    # Celebrity dataset: CSV or columnar file (scripts/build_celebrity_store.py),
+    # empty for the bundled CSV. Polled for changes every reload interval (0 = off).
+    celebrity_dataset_path: str = ""
+    celebrity_reload_seconds: float = 60.0
+
+    # Gan-zhi calendar: days precomputed on each side of today
+    ganzhi_calendar_window_days: int = 730
+
+    # Luck timeline (대운/세운/월운) added to fortune, career, marriage and pet prompts
+    luck_timeline_years: int = 5
+    luck_timeline_months: int = 12
+    luck_timeline_cache_size: int = 4096  # charts x start months kept in memory
+
+    # Group compatibility matrix: mean pair score needed to join a cluster,
+    # and best/worst pairs reported
+    group_cluster_threshold: int = 60
+    group_pair_limit: int = 5
 
     # Service Token Authentication
     api_secret_key: str = ""
@@ -1,86 +1,118 @@
+"""K-pop celebrity database (public birth dates only, no birth times).
+
+Sources: official profiles, publicly available information.
+
+Entries live in celebrities.csv next to this module, or in the file set by
+CELEBRITY_DATASET_PATH: a CSV, or a columnar file built with
+scripts/build_celebrity_store.py, which is memory-mapped. Nothing is read at
+import time. The dataset is loaded on first use (or by load_celebrities at
+startup), and a changed file can be swapped in without a restart.
+"""
 from __future__ import annotations
 
+import os
+import threading
 from dataclasses import dataclass
+from pathlib import Path
+
+from app.data.celebrity_search import DEFAULT_SEARCH_LIMIT, CelebritySearchIndex
+from app.data.celebrity_store import Celebrity, CelebrityStore
+
+DEFAULT_DATASET_PATH = Path(__file__).with_name("celebrities.csv")
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
 
 
 @dataclass(frozen=True)
-class Celebrity:
-    id: str
-    name_ko: str
-    name_en: str
-    group: str
-    year: int
-    month: int
-    day: int
-    gender: str  # "male" | "female"
-
-
-# K-pop idol database (public birth dates only, no birth times)
-# Sources: official profiles, publicly available information
-CELEBRITIES: tuple[Celebrity, ...] = (
-    # aespa
-    Celebrity("karina-aespa", "카리나", "Karina", "aespa", 2000, 4, 11, "female"),
-    Celebrity("winter-aespa", "윈터", "Winter", "aespa", 2001, 1, 1, "female"),
-    Celebrity("giselle-aespa", "지젤", "Giselle", "aespa", 2000, 10, 30, "female"),
-    Celebrity("ningning-aespa", "닝닝", "Ningning", "aespa", 2002, 10, 23, "female"),
-    # BLACKPINK
-    Celebrity("jisoo-blackpink", "지수", "Jisoo", "BLACKPINK", 1995, 1, 3, "female"),
-    Celebrity("jennie-blackpink", "제니", "Jennie", "BLACKPINK", 1996, 1, 16, "female"),
-    Celebrity("rose-blackpink", "로제", "Rose", "BLACKPINK", 1997, 2, 11, "female"),
-    Celebrity("lisa-blackpink", "리사", "Lisa", "BLACKPINK", 1997, 3, 27, "female"),
-    # BTS
-    Celebrity("rm-bts", "RM", "RM", "BTS", 1994, 9, 12, "male"),
-    Celebrity("jin-bts", "진", "Jin", "BTS", 1992, 12, 4, "male"),
-    Celebrity("suga-bts", "슈가", "Suga", "BTS", 1993, 3, 9, "male"),
-    Celebrity("jhope-bts", "제이홉", "J-Hope", "BTS", 1994, 2, 18, "male"),
-    Celebrity("jimin-bts", "지민", "Jimin", "BTS", 1995, 10, 13, "male"),
-    Celebrity("v-bts", "뷔", "V", "BTS", 1995, 12, 30, "male"),
-    Celebrity("jungkook-bts", "정국", "Jungkook", "BTS", 1997, 9, 1, "male"),
-    # NewJeans
-    Celebrity("minji-newjeans", "민지", "Minji", "NewJeans", 2004, 5, 7, "female"),
-    Celebrity("hanni-newjeans", "하니", "Hanni", "NewJeans", 2004, 10, 6, "female"),
-    Celebrity("danielle-newjeans", "다니엘", "Danielle", "NewJeans", 2005, 4, 11, "female"),
-    Celebrity("haerin-newjeans", "해린", "Haerin", "NewJeans", 2006, 5, 15, "female"),
-    Celebrity("hyein-newjeans", "혜인", "Hyein", "NewJeans", 2008, 4, 21, "female"),
-    # IVE
-    Celebrity("yujin-ive", "유진", "Yujin", "IVE", 2003, 9, 1, "female"),
-    Celebrity("wonyoung-ive", "원영", "Wonyoung", "IVE", 2004, 8, 31, "female"),
-    Celebrity("gaeul-ive", "가을", "Gaeul", "IVE", 2002, 9, 24, "female"),
-    Celebrity("rei-ive", "레이", "Rei", "IVE", 2004, 2, 3, "female"),
-    Celebrity("liz-ive", "리즈", "Liz", "IVE", 2004, 11, 21, "female"),
-    Celebrity("leeseo-ive", "이서", "Leeseo", "IVE", 2007, 2, 21, "female"),
-    # SEVENTEEN
-    Celebrity("scoups-seventeen", "에스쿱스", "S.Coups", "SEVENTEEN", 1995, 8, 8, "male"),
-    Celebrity("mingyu-seventeen", "민규", "Mingyu", "SEVENTEEN", 1997, 4, 6, "male"),
-    Celebrity("wonwoo-seventeen", "원우", "Wonwoo", "SEVENTEEN", 1996, 7, 17, "male"),
-    # Stray Kids
-    Celebrity("bangchan-straykids", "방찬", "Bang Chan", "Stray Kids", 1997, 10, 3, "male"),
-    Celebrity("hyunjin-straykids", "현진", "Hyunjin", "Stray Kids", 2000, 3, 20, "male"),
-    Celebrity("felix-straykids", "필릭스", "Felix", "Stray Kids", 2000, 9, 15, "male"),
-)
-
-# O(1) lookup by ID
-_CELEBRITY_BY_ID: dict[str, Celebrity] = {c.id: c for c in CELEBRITIES}
+class CelebrityDataset:
+    """One loaded version of the dataset file with its search index."""
+
+    path: Path
+    stamp: tuple[int, int]  # (mtime_ns, size) of the file when loaded
+    store: CelebrityStore
+    search_index: CelebritySearchIndex
+
+    @classmethod
+    def load(cls, path: str | Path) -> CelebrityDataset:
+        path = Path(path)
+        stamp = _file_stamp(path)
+        store = CelebrityStore.open(path)
+        return cls(path, stamp, store, CelebritySearchIndex(store))
+
+
+_lock = threading.Lock()
+_path = DEFAULT_DATASET_PATH
+_dataset: CelebrityDataset | None = None
+
+
+def activate_dataset(dataset: CelebrityDataset) -> None:
+    """Make dataset the one served by the lookup functions."""
+    global _dataset, _path
+    with _lock:
+        _dataset = dataset
+        _path = dataset.path
+
+
+def load_celebrities(path: str | Path | None = None) -> CelebrityDataset:
+    """Load the dataset at path (default: the bundled CSV) and serve it."""
+    dataset = CelebrityDataset.load(path or DEFAULT_DATASET_PATH)
+    activate_dataset(dataset)
+    return dataset
+
+
+def current_dataset() -> CelebrityDataset:
+    global _dataset
+    dataset = _dataset
+    if dataset is None:
+        with _lock:
+            if _dataset is None:
+                _dataset = CelebrityDataset.load(_path)
+            dataset = _dataset
+    return dataset
+
+
+def check_for_update() -> CelebrityDataset | None:
+    """Load the dataset file again if it changed since it was loaded.
+
+    The new version is returned without being served, so callers can prepare
+    anything derived from it before calling activate_dataset().
+    """
+    dataset = current_dataset()
+    if _file_stamp(dataset.path) == dataset.stamp:
+        return None
+    return CelebrityDataset.load(dataset.path)
+
+
+def reload_if_changed() -> bool:
+    """Serve the dataset file's new version if it changed. Returns True if it did."""
+    dataset = check_for_update()
+    if dataset is None:
+        return False
+    activate_dataset(dataset)
+    return True
 
 
 def get_celebrity_by_id(celebrity_id: str) -> Celebrity | None:
     """Get a celebrity by their unique ID. Returns None if not found."""
-    return _CELEBRITY_BY_ID.get(celebrity_id)
+    return current_dataset().store.get(celebrity_id)
 
 
-def search_celebrities(query: str) -> tuple[Celebrity, ...]:
+def search_celebrities(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> tuple[Celebrity, ...]:
     """Search celebrities by Korean name, English name, or group name.
 
-    Case-insensitive partial matching.
-    Returns matching celebrities as an immutable tuple.
+    Case-insensitive prefix/substring matching; Korean names also match by
+    jamo ("정구") and choseong ("ㅈㄱ"). Single-character queries match
+    prefixes only.
+    Returns up to `limit` matches, best first, as an immutable tuple.
     """
-    if not query or not query.strip():
-        return ()
-
-    q = query.strip().lower()
-    return tuple(
-        c for c in CELEBRITIES
-        if q in c.name_ko.lower()
-        or q in c.name_en.lower()
-        or q in c.group.lower()
-    )
+    return current_dataset().search_index.search(query, limit)
+
+
+def __getattr__(name: str):
+    # CELEBRITIES is materialized on access so importing this module stays cheap
+    if name == "CELEBRITIES":
+        return tuple(current_dataset().store)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
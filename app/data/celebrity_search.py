@@ -0,0 +1,177 @@
+"""N-gram search index over celebrity names and groups.
+
+Built once when the celebrity data is loaded, so a query only touches the
+postings of its own n-grams instead of scanning every entry:
+
+    - every searchable key is indexed by its characters, bigrams and
+      trigrams, so queries of any length match prefixes and substrings
+    - Korean names are also indexed as jamo sequences, so a query typed
+      halfway through a syllable ("정구" for 정국) still matches, and as
+      choseong strings, so "ㅈㄱ" finds 정국
+
+Results are ranked: exact match, then prefix, then substring, names before
+groups, and jamo/choseong matches last. Ties keep database order.
+"""
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.data.celebrity_store import Celebrity
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = (
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+_SYLLABLE_FIRST = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+
+# Key kinds, in ranking order
+_NAME, _GROUP, _JAMO, _CHOSEONG_KIND = range(4)
+_PLAIN_KINDS = (_NAME, _GROUP)
+_JAMO_KINDS = (_JAMO,)
+_CHOSEONG_KINDS = (_CHOSEONG_KIND,)
+
+# Match quality, best first
+_EXACT, _PREFIX, _SUBSTRING = range(3)
+
+DEFAULT_SEARCH_LIMIT = 20
+
+
+def _is_syllable(ch: str) -> bool:
+    return _SYLLABLE_FIRST <= ord(ch) <= _SYLLABLE_LAST
+
+
+def decompose_jamo(text: str) -> str:
+    """Split Hangul syllables into their jamo (정국 -> ㅈㅓㅇㄱㅜㄱ)."""
+    out = []
+    for ch in text:
+        if _is_syllable(ch):
+            index = ord(ch) - _SYLLABLE_FIRST
+            out.append(_CHOSEONG[index // 588])
+            out.append(_JUNGSEONG[index % 588 // 28])
+            out.append(_JONGSEONG[index % 28])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def choseong(text: str) -> str:
+    """Return the initial consonants of the Hangul syllables in text (정국 -> ㅈㄱ)."""
+    return "".join(_CHOSEONG[(ord(ch) - _SYLLABLE_FIRST) // 588] for ch in text if _is_syllable(ch))
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _grams(key: str) -> set[str]:
+    grams: set[str] = set()
+    for n in (1, 2, 3):
+        grams.update(key[i:i + n] for i in range(len(key) - n + 1))
+    return grams
+
+
+def _query_grams(query: str) -> list[str]:
+    if len(query) <= 3:
+        return [query]
+    return sorted({query[i:i + 3] for i in range(len(query) - 2)})
+
+
+class CelebritySearchIndex:
+    """Immutable search index over a sequence of celebrities."""
+
+    def __init__(self, celebrities: Sequence[Celebrity]):
+        self._celebrities = celebrities
+        self._keys: list[tuple[tuple[int, str], ...]] = []
+        postings: dict[str, list[int]] = {}
+
+        for doc, celebrity in enumerate(self._celebrities):
+            keys = self._keys_for(celebrity)
+            self._keys.append(keys)
+            grams: set[str] = set()
+            for _, key in keys:
+                grams |= _grams(key)
+            for gram in grams:
+                postings.setdefault(gram, []).append(doc)
+
+        # Doc ids are appended in order, so every posting list is sorted
+        self._postings = {gram: array("I", docs) for gram, docs in postings.items()}
+
+    @staticmethod
+    def _keys_for(celebrity: Celebrity) -> tuple[tuple[int, str], ...]:
+        keys = {
+            (_NAME, _normalize(celebrity.name_ko)),
+            (_NAME, _normalize(celebrity.name_en)),
+            (_GROUP, _normalize(celebrity.group)),
+        }
+        for text in (celebrity.name_ko, celebrity.group):
+            normalized = _normalize(text)
+            if any(_is_syllable(ch) for ch in normalized):
+                keys.add((_JAMO, decompose_jamo(normalized)))
+                keys.add((_CHOSEONG_KIND, choseong(normalized)))
+        return tuple(sorted((kind, key) for kind, key in keys if key))
+
+    def __len__(self) -> int:
+        return len(self._celebrities)
+
+    def _candidates(self, query: str) -> set[int]:
+        lists = [self._postings.get(gram) for gram in _query_grams(query)]
+        if not lists or any(docs is None for docs in lists):
+            return set()
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for docs in lists[1:]:
+            candidates.intersection_update(docs)
+            if not candidates:
+                break
+        return candidates
+
+    def _rank(
+        self, doc: int, query: str, kinds: tuple[int, ...],
+    ) -> tuple[bool, int, int, int] | None:
+        best = None
+        for kind, key in self._keys[doc]:
+            if kind not in kinds:
+                continue
+            if key == query:
+                quality = _EXACT
+            elif key.startswith(query):
+                quality = _PREFIX
+            elif query in key:
+                quality = _SUBSTRING
+            else:
+                continue
+            rank = (kind >= _JAMO, quality, kind, doc)
+            if best is None or rank < best:
+                best = rank
+        return best
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> tuple[Celebrity, ...]:
+        """Return up to `limit` celebrities matching query, best first."""
+        q = _normalize(query)
+        if not q or limit <= 0:
+            return ()
+
+        if all(ch in _CHOSEONG_SET for ch in q.replace(" ", "")):
+            forms = [(q.replace(" ", ""), _CHOSEONG_KINDS)]
+        else:
+            forms = [(q, _PLAIN_KINDS)]
+            if any(_is_syllable(ch) for ch in q):
+                forms.append((decompose_jamo(q), _JAMO_KINDS))
+
+        ranked: dict[int, tuple[bool, int, int, int]] = {}
+        for form, kinds in forms:
+            for doc in self._candidates(form):
+                rank = self._rank(doc, form, kinds)
+                if rank is not None and (doc not in ranked or rank < ranked[doc]):
+                    ranked[doc] = rank
+
+        best = heapq.nsmallest(limit, ranked.values())
+        return tuple(self._celebrities[rank[-1]] for rank in best)
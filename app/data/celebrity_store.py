@@ -0,0 +1,186 @@
+"""Columnar on-disk storage for the celebrity dataset.
+
+The source of truth is a CSV file (id,name_ko,name_en,group,year,month,day,
+gender). For large datasets it is compiled once into a binary columnar file
+(scripts/build_celebrity_store.py) that is memory-mapped at load time, so
+loading costs a few page faults instead of parsing every row, and rows are
+only turned into Celebrity objects when they are read.
+
+Layout (little-endian):
+
+    header   "CELB" magic, u16 version, u32 row count
+    numeric  year u16[n], month u8[n], day u8[n], gender u8[n]
+    strings  for id, name_ko, name_en, group: u32 byte length, u32 offsets[n+1],
+             UTF-8 blob
+    id order u32[n] row numbers sorted by id, for binary search by id
+"""
+from __future__ import annotations
+
+import csv
+import mmap
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+_MAGIC = b"CELB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_U32 = struct.Struct("<I")
+_GENDERS = ("male", "female")
+_STRING_COLUMNS = ("id", "name_ko", "name_en", "group")
+
+
+@dataclass(frozen=True)
+class Celebrity:
+    id: str
+    name_ko: str
+    name_en: str
+    group: str
+    year: int
+    month: int
+    day: int
+    gender: str  # "male" | "female"
+
+
+def read_celebrities_csv(path: str | Path) -> list[Celebrity]:
+    """Parse a celebrity CSV file (header row required)."""
+    with open(path, encoding="utf-8", newline="") as f:
+        return [
+            Celebrity(
+                id=row["id"],
+                name_ko=row["name_ko"],
+                name_en=row["name_en"],
+                group=row["group"],
+                year=int(row["year"]),
+                month=int(row["month"]),
+                day=int(row["day"]),
+                gender=row["gender"],
+            )
+            for row in csv.DictReader(f)
+        ]
+
+
+def encode_celebrities(celebrities: Iterable[Celebrity]) -> bytes:
+    """Encode celebrities into the columnar binary layout."""
+    rows = list(celebrities)
+    ids = [c.id for c in rows]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Duplicate celebrity IDs in dataset")
+
+    parts = [
+        _HEADER.pack(_MAGIC, _VERSION, len(rows)),
+        struct.pack(f"<{len(rows)}H", *(c.year for c in rows)),
+        bytes(c.month for c in rows),
+        bytes(c.day for c in rows),
+        bytes(_GENDERS.index(c.gender) for c in rows),
+    ]
+    for column in _STRING_COLUMNS:
+        encoded = [getattr(c, column).encode("utf-8") for c in rows]
+        offsets = [0]
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        blob = b"".join(encoded)
+        parts += [_U32.pack(len(blob)), struct.pack(f"<{len(offsets)}I", *offsets), blob]
+    id_order = sorted(range(len(rows)), key=ids.__getitem__)
+    parts.append(struct.pack(f"<{len(id_order)}I", *id_order))
+    return b"".join(parts)
+
+
+def write_celebrity_store(celebrities: Iterable[Celebrity], path: str | Path) -> None:
+    """Write the columnar file atomically, so a running reader never sees a partial file."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(encode_celebrities(celebrities))
+    tmp.replace(path)
+
+
+class CelebrityStore(Sequence[Celebrity]):
+    """Read-only view over the columnar layout, backed by bytes or an mmap."""
+
+    def __init__(self, buffer: bytes | mmap.mmap):
+        magic, version, count = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a celebrity store file")
+        self._buffer = buffer
+        self._count = count
+
+        pos = _HEADER.size
+        self._year_pos = pos
+        pos += 2 * count
+        self._month_pos = pos
+        pos += count
+        self._day_pos = pos
+        pos += count
+        self._gender_pos = pos
+        pos += count
+
+        # column -> (offsets position, blob position)
+        self._strings: dict[str, tuple[int, int]] = {}
+        for column in _STRING_COLUMNS:
+            (blob_len,) = _U32.unpack_from(buffer, pos)
+            offsets_pos = pos + _U32.size
+            blob_pos = offsets_pos + 4 * (count + 1)
+            self._strings[column] = (offsets_pos, blob_pos)
+            pos = blob_pos + blob_len
+        self._id_order_pos = pos
+
+    @classmethod
+    def open(cls, path: str | Path) -> CelebrityStore:
+        """Open a dataset file: .csv is parsed into memory, anything else is memory-mapped."""
+        path = Path(path)
+        if path.suffix.lower() == ".csv":
+            return cls(encode_celebrities(read_celebrities_csv(path)))
+        with open(path, "rb") as f:
+            # The mapping stays valid after the file is closed or replaced
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _string(self, column: str, row: int) -> str:
+        offsets_pos, blob_pos = self._strings[column]
+        start, end = struct.unpack_from("<II", self._buffer, offsets_pos + 4 * row)
+        return bytes(self._buffer[blob_pos + start:blob_pos + end]).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(self._count))]
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError("celebrity row out of range")
+        buffer = self._buffer
+        return Celebrity(
+            id=self._string("id", row),
+            name_ko=self._string("name_ko", row),
+            name_en=self._string("name_en", row),
+            group=self._string("group", row),
+            year=struct.unpack_from("<H", buffer, self._year_pos + 2 * row)[0],
+            month=buffer[self._month_pos + row],
+            day=buffer[self._day_pos + row],
+            gender=_GENDERS[buffer[self._gender_pos + row]],
+        )
+
+    def __iter__(self) -> Iterator[Celebrity]:
+        for row in range(self._count):
+            yield self[row]
+
+    def row_of(self, celebrity_id: str) -> int | None:
+        """Binary search the id order column. Returns the row number or None."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (row,) = _U32.unpack_from(self._buffer, self._id_order_pos + 4 * mid)
+            current = self._string("id", row)
+            if current == celebrity_id:
+                return row
+            if current < celebrity_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def get(self, celebrity_id: str) -> Celebrity | None:
+        row = self.row_of(celebrity_id)
+        return None if row is None else self[row]
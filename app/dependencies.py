@@ -5,41 +5,81 @@ import logging
 from anthropic import AsyncAnthropic
 
 from app.config import settings
+from app.data.celebrities import load_celebrities
 from app.engine.calculator import SajuCalculator
+from app.engine.ganzhi_calendar import GanZhiCalendar
 from app.llm.client import LLMClient
+from app.llm.http_pool import build_http_client
+from app.llm.providers import AnthropicProvider, FakeProvider, LLMProvider
+from app.services.bundle_service import ReadingBundleService
 from app.services.cache_service import CacheService
-from app.services.celebrity_service import CelebrityService
+from app.services.celebrity_index import CelebrityChartIndex
+from app.services.celebrity_service import CelebrityDatasetWatcher, CelebrityService
 from app.services.compatibility_service import CompatibilityService
 from app.services.fortune_service import FortuneService
+from app.services.pregeneration_service import (
+    DailyFortunePregenerator,
+    DailyPregenerationScheduler,
+)
 from app.services.saju_service import SajuService
 
 logger = logging.getLogger(__name__)
 
 # Singletons
 _calculator: SajuCalculator | None = None
+_calendar: GanZhiCalendar | None = None
 _llm_client: LLMClient | None = None
 _cache_service: CacheService | None = None
 _saju_service: SajuService | None = None
 _compatibility_service: CompatibilityService | None = None
 _fortune_service: FortuneService | None = None
 _celebrity_service: CelebrityService | None = None
+_bundle_service: ReadingBundleService | None = None
+_pregeneration_scheduler: DailyPregenerationScheduler | None = None
+_celebrity_watcher: CelebrityDatasetWatcher | None = None
+
+
+def _build_llm_provider() -> LLMProvider | None:
+    """Create the LLM provider selected by settings.llm_provider."""
+    if settings.llm_provider == "fake":
+        logger.warning("Using fake LLM provider. Responses are simulated.")
+        return FakeProvider(
+            latency_ms=settings.fake_llm_latency_ms,
+            tokens_per_second=settings.fake_llm_tokens_per_second,
+            error_rate=settings.fake_llm_error_rate,
+            output_tokens=settings.fake_llm_output_tokens,
+            seed=settings.fake_llm_seed,
+        )
+
+    if settings.anthropic_api_key:
+        http_client, pool_metrics = build_http_client(settings)
+        client = AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=http_client,
+            max_retries=settings.llm_max_retries,
+        )
+        logger.info(
+            "Anthropic client initialized (max_connections=%d, http2=%s)",
+            settings.llm_max_connections, settings.llm_http2,
+        )
+        return AnthropicProvider(client, pool_metrics)
+
+    logger.warning("ANTHROPIC_API_KEY not set. LLM features will be unavailable.")
+    return None
 
 
 async def init_dependencies() -> None:
     """Initialize all dependencies on app startup."""
-    global _calculator, _llm_client, _cache_service
-    global _saju_service, _compatibility_service, _fortune_service, _celebrity_service
+    global _calculator, _calendar, _llm_client, _cache_service
+    global _saju_service, _compatibility_service, _fortune_service, _celebrity_service, _bundle_service
+    global _pregeneration_scheduler, _celebrity_watcher
 
     _calculator = SajuCalculator()
+    _calendar = GanZhiCalendar(window_days=settings.ganzhi_calendar_window_days)
+    _calendar.warm()
 
     # LLM client
-    anthropic_client = None
-    if settings.anthropic_api_key:
-        anthropic_client = AsyncAnthropic(api_key=settings.anthropic_api_key)
-        logger.info("Anthropic client initialized")
-    else:
-        logger.warning("ANTHROPIC_API_KEY not set. LLM features will be unavailable.")
-    _llm_client = LLMClient(anthropic_client)
+    _llm_client = LLMClient(_build_llm_provider())
 
     # Redis (optional)
     redis_client = None
@@ -58,18 +98,67 @@ async def init_dependencies() -> None:
     # Services
     _saju_service = SajuService(_calculator, _llm_client, _cache_service)
     _compatibility_service = CompatibilityService(_calculator, _llm_client, _cache_service)
-    _fortune_service = FortuneService(_calculator, _llm_client, _cache_service)
-    _celebrity_service = CelebrityService(_compatibility_service)
-
+    _fortune_service = FortuneService(_calculator, _llm_client, _cache_service, _calendar)
+    _bundle_service = ReadingBundleService(_saju_service, _fortune_service, _compatibility_service)
+    celebrities = load_celebrities(settings.celebrity_dataset_path or None)
+    _celebrity_service = CelebrityService(
+        _compatibility_service,
+        CelebrityChartIndex.build(_compatibility_service.calculate_person, celebrities.store),
+    )
+    if settings.celebrity_reload_seconds > 0:
+        _celebrity_watcher = CelebrityDatasetWatcher(
+            _celebrity_service, interval_seconds=settings.celebrity_reload_seconds,
+        )
+        _celebrity_watcher.start()
+
+    if settings.daily_pregen_enabled:
+        _pregeneration_scheduler = _build_pregeneration_scheduler()
+
+
+def build_daily_pregenerator() -> DailyFortunePregenerator:
+    assert _fortune_service is not None and _cache_service is not None
+    return DailyFortunePregenerator(
+        _fortune_service,
+        _cache_service,
+        requests_per_minute=settings.daily_pregen_requests_per_minute,
+        concurrency=settings.daily_pregen_concurrency,
+    )
+
+
+def _build_pregeneration_scheduler() -> DailyPregenerationScheduler | None:
+    if not settings.daily_pregen_profiles_path:
+        logger.warning("DAILY_PREGEN_ENABLED set without DAILY_PREGEN_PROFILES_PATH. Pre-generation disabled.")
+        return None
+    scheduler = DailyPregenerationScheduler(
+        build_daily_pregenerator(),
+        _cache_service,
+        settings.daily_pregen_profiles_path,
+        hour=settings.daily_pregen_hour,
+        lock_seconds=settings.daily_pregen_lock_seconds,
+    )
+    scheduler.start()
+    logger.info("Daily fortune pre-generation scheduled at %02d:00", settings.daily_pregen_hour)
+    return scheduler
 
 
 async def shutdown_dependencies() -> None:
     """Cleanup on shutdown."""
+    if _pregeneration_scheduler is not None:
+        await _pregeneration_scheduler.stop()
+    if _celebrity_watcher is not None:
+        await _celebrity_watcher.stop()
+    if _llm_client is not None:
+        await _llm_client.aclose()
     if _cache_service and _cache_service.available and _cache_service._redis:
         await _cache_service._redis.aclose()
         logger.info("Redis connection closed")
 
 
+def get_llm_client() -> LLMClient:
+    assert _llm_client is not None
+    return _llm_client
+
+
 def get_saju_service() -> SajuService:
     assert _saju_service is not None
     return _saju_service
@@ -88,3 +177,8 @@ def get_fortune_service() -> FortuneService:
 def get_celebrity_service() -> CelebrityService:
     assert _celebrity_service is not None
     return _celebrity_service
+
+
+def get_bundle_service() -> ReadingBundleService:
+    assert _bundle_service is not None
+    return _bundle_service
@@ -0,0 +1,189 @@
+"""Rule-based chart analysis: the judgements a reading is built on.
+
+Day-master strength, a useful-god (용신) candidate, the dominant ten gods and
+the 합·충·형·파·해 inside the chart follow fixed rules, so they are computed
+here once instead of being re-derived (and restated) by the LLM.
+format_saju_for_prompt passes the result as settled facts and the model only
+writes the narrative around them.
+
+Rules used:
+
+    strength   Every character except the day stem is weighted (month branch
+               3, day branch 2, everything else 1) and counts as support when
+               its element is the day master's own (비겁) or generates it
+               (인성). The supported share, moved 10 points by the day
+               master's 12운성 at the month branch, gives a 0-100 score:
+               >= 60 신강, <= 40 신약, otherwise 중화.
+    용신       억부 rule. 신강: 재성 when 인성 outweighs 비겁, otherwise 관성.
+               신약: 비겁 when 재성 is the heaviest drain, otherwise 인성.
+               중화: the scarcest element. 희신 is the element generating 용신.
+    ten gods   Counted over the visible stems and the main hidden stem (본기)
+               of each branch.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.engine.constants import CHEON_GAN_TO_OH_HAENG, JI_JI_TO_OH_HAENG, OH_HAENG_HANJA
+from app.engine.models import PillarInfo, SajuData
+from app.engine.relations import (
+    ELEMENT_INDEX,
+    GENERATES,
+    Interaction,
+    chart_interactions,
+    stem_element,
+)
+
+STRONG, BALANCED, WEAK = "신강", "중화", "신약"
+
+# Ten-god families, in the order they are reported
+TEN_GOD_GROUPS: dict[str, tuple[str, str]] = {
+    "비겁": ("비견", "겁재"),
+    "식상": ("식신", "상관"),
+    "재성": ("편재", "정재"),
+    "관성": ("칠살", "정관"),
+    "인성": ("편인", "정인"),
+}
+TEN_GOD_ORDER = tuple(god for gods in TEN_GOD_GROUPS.values() for god in gods)
+
+# Main hidden stem (본기) of each branch, 子 first
+BRANCH_MAIN_STEMS = "癸己甲乙戊丙丁己庚辛戊壬"
+
+_STRONG_SCORE = 60
+_WEAK_SCORE = 40
+_MONTH_STAGE_SHIFT = 10
+# 12운성 of the day master at the month branch
+_STRONG_STAGES = frozenset({"장생", "관대", "임관", "제왕"})
+_WEAK_STAGES = frozenset({"병", "사", "묘", "절"})
+
+# Weights of the stems and branches, in pillar order
+_STEM_WEIGHTS = (1, 1, 0, 1)  # the day stem is the day master itself
+_BRANCH_WEIGHTS = (1, 3, 2, 1)
+
+
+@dataclass(frozen=True)
+class ChartAnalysis:
+    """Deterministic interpretation facts for one chart."""
+
+    strength: str  # 신강 / 중화 / 신약
+    strength_score: int  # 0-100, share of support for the day master
+    useful_element: str  # 용신 candidate (hanja element)
+    favorable_element: str  # 희신: the element generating the 용신
+    useful_reason: str
+    ten_god_counts: dict[str, int]  # every ten god, in TEN_GOD_ORDER
+    group_counts: dict[str, int]  # 비겁/식상/재성/관성/인성
+    dominant_ten_gods: tuple[str, ...]
+    missing_groups: tuple[str, ...]
+    excess_elements: tuple[str, ...]  # three or more
+    missing_elements: tuple[str, ...]
+    relations: tuple[Interaction, ...]  # 합·충·형·파·해 inside the chart
+
+
+def ten_god_of(day_stem: int, stem: int) -> str:
+    """Ten god of a stem seen from a day master, e.g. (甲, 辛) -> 정관."""
+    offset = (stem_element(stem) - stem_element(day_stem)) % 5
+    same, other = tuple(TEN_GOD_GROUPS.values())[offset]
+    return same if stem % 2 == day_stem % 2 else other
+
+
+def _pillars(saju: SajuData) -> tuple[PillarInfo | None, ...]:
+    return saju.year_pillar, saju.month_pillar, saju.day_pillar, saju.time_pillar
+
+
+def _group_elements(day_element: int) -> dict[str, int]:
+    """Element index of each ten-god family for a day master element."""
+    return {
+        "비겁": day_element,
+        "식상": GENERATES[day_element],
+        "재성": GENERATES[GENERATES[day_element]],
+        "관성": GENERATES[GENERATES[GENERATES[day_element]]],
+        "인성": GENERATES.index(day_element),
+    }
+
+
+def _weighted_groups(saju: SajuData, group_elements: dict[str, int]) -> dict[str, int]:
+    group_of_element = {element: group for group, element in group_elements.items()}
+    weights = dict.fromkeys(TEN_GOD_GROUPS, 0)
+    for pillar, stem_weight, branch_weight in zip(_pillars(saju), _STEM_WEIGHTS, _BRANCH_WEIGHTS):
+        if pillar is None:
+            continue
+        weights[group_of_element[ELEMENT_INDEX[CHEON_GAN_TO_OH_HAENG[pillar.gan]]]] += stem_weight
+        weights[group_of_element[ELEMENT_INDEX[JI_JI_TO_OH_HAENG[pillar.zhi]]]] += branch_weight
+    return weights
+
+
+def _strength_score(weights: dict[str, int], month_stage: str) -> int:
+    total = sum(weights.values())
+    score = round(100 * (weights["비겁"] + weights["인성"]) / total)
+    if month_stage in _STRONG_STAGES:
+        score += _MONTH_STAGE_SHIFT
+    elif month_stage in _WEAK_STAGES:
+        score -= _MONTH_STAGE_SHIFT
+    return max(0, min(100, score))
+
+
+def _useful_group(strength: str, weights: dict[str, int]) -> tuple[str | None, str]:
+    if strength == STRONG:
+        if weights["인성"] > weights["비겁"]:
+            return "재성", "신강하고 인성이 많아 재성으로 인성을 누른다"
+        return "관성", "신강하고 비겁이 많아 관성으로 일간을 제어한다"
+    if strength == WEAK:
+        drains = {group: weights[group] for group in ("식상", "재성", "관성")}
+        if max(drains, key=lambda group: (drains[group], group == "재성")) == "재성":
+            return "비겁", "신약하고 재성이 많아 비겁으로 재성을 감당한다"
+        return "인성", "신약하여 인성으로 일간을 돕는다"
+    return None, "중화에 가까워 가장 부족한 오행을 보완한다"
+
+
+def _ten_god_counts(saju: SajuData) -> dict[str, int]:
+    counts = dict.fromkeys(TEN_GOD_ORDER, 0)
+    for pillar in _pillars(saju):
+        if pillar is None:
+            continue
+        for god in (pillar.shi_shen_gan, pillar.shi_shen_zhi[0] if pillar.shi_shen_zhi else None):
+            if god in counts:  # the day stem reads 日主
+                counts[god] += 1
+    return counts
+
+
+def analyze_chart(saju: SajuData) -> ChartAnalysis:
+    """Compute the rule-based interpretation facts for a chart."""
+    day_element = ELEMENT_INDEX[saju.day_master_element]
+    group_elements = _group_elements(day_element)
+    weights = _weighted_groups(saju, group_elements)
+
+    score = _strength_score(weights, saju.month_pillar.di_shi)
+    if score >= _STRONG_SCORE:
+        strength = STRONG
+    elif score <= _WEAK_SCORE:
+        strength = WEAK
+    else:
+        strength = BALANCED
+
+    group, reason = _useful_group(strength, weights)
+    if group is None:
+        # Scarcest element; ties go to the earlier element in 木火土金水 order
+        useful = min(range(5), key=lambda e: saju.element_counts[OH_HAENG_HANJA[e]])
+    else:
+        useful = group_elements[group]
+    favorable = GENERATES.index(useful)
+
+    ten_gods = _ten_god_counts(saju)
+    groups = {group: sum(ten_gods[god] for god in gods) for group, gods in TEN_GOD_GROUPS.items()}
+    top = max(ten_gods.values())
+    dominant = tuple(god for god in TEN_GOD_ORDER if top >= 2 and ten_gods[god] == top)
+
+    return ChartAnalysis(
+        strength=strength,
+        strength_score=score,
+        useful_element=OH_HAENG_HANJA[useful],
+        favorable_element=OH_HAENG_HANJA[favorable],
+        useful_reason=reason,
+        ten_god_counts=ten_gods,
+        group_counts=groups,
+        dominant_ten_gods=dominant,
+        missing_groups=tuple(group for group, count in groups.items() if count == 0),
+        excess_elements=tuple(e for e in OH_HAENG_HANJA if saju.element_counts[e] >= 3),
+        missing_elements=tuple(e for e in OH_HAENG_HANJA if saju.element_counts[e] == 0),
+        relations=chart_interactions(saju),
+    )
@@ -0,0 +1,266 @@
+"""Rule-based date selection (택일) over a range of days.
+
+A day is scored against one or more charts with fixed weights:
+
+    day branch vs chart day branch (일지)   육합 +3, 삼합 +2, 충 -4, 형 -2, 파 -1, 해 -1
+    day branch vs chart year branch (띠)    육합/삼합 +1, 충 -2
+    day stem vs chart day stem (일간)       합 +2, 충 -2
+    day stem/branch element                 용신 +2, 희신 +1 each
+    month branch vs chart day branch        육합/삼합 +1, 충 -2
+    월파 (day branch clashes month branch)   -3
+    손 없는 날 (lunar day 9, 10, 19, 20, 29, 30) +1
+
+normalized to 0-100. The chart terms depend only on the day or month pillar,
+so each chart is turned into two 60-entry rows once, and every day of the
+range costs a few lookups over the calendar's byte columns.
+
+Hours (택시) reuse the day-pillar row for the hour pillar and add:
+
+    ten god of the hour stem (십신)          +1 when it is the kind the day
+                                            master's strength calls for
+                                            (신강: 식상/재성/관성, 신약:
+                                            비겁/인성), -1 for the other kind
+    hour branch vs the day's branch (일진)   육합/삼합 +1, 충 -2
+"""
+from __future__ import annotations
+
+import heapq
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from app.engine.analysis import STRONG, TEN_GOD_GROUPS, WEAK, analyze_chart, ten_god_of
+from app.engine.constants import CHEON_GAN_TO_OH_HAENG, JI_JI_TO_OH_HAENG
+from app.engine.ganzhi_calendar import GANZHI_60, GanZhiCalendar, lunar_day_column
+from app.engine.models import SajuData
+from app.engine.relations import (
+    BRANCH_CHUNG_BIT,
+    BRANCH_HAE_BIT,
+    BRANCH_HYUNG_BIT,
+    BRANCH_INDEX,
+    BRANCH_MASK_LABELS,
+    BRANCH_MASKS,
+    BRANCH_PA_BIT,
+    BRANCH_SAMHAP_BIT,
+    BRANCH_YUKHAP_BIT,
+    STEM_CHUNG_BIT,
+    STEM_HAP_BIT,
+    STEM_INDEX,
+    STEM_MASK_LABELS,
+    STEM_MASKS,
+)
+
+_DAY_BRANCH_WEIGHTS = {
+    BRANCH_YUKHAP_BIT: 3, BRANCH_SAMHAP_BIT: 2, BRANCH_CHUNG_BIT: -4,
+    BRANCH_HYUNG_BIT: -2, BRANCH_PA_BIT: -1, BRANCH_HAE_BIT: -1,
+}
+_YEAR_BRANCH_WEIGHTS = {BRANCH_YUKHAP_BIT: 1, BRANCH_SAMHAP_BIT: 1, BRANCH_CHUNG_BIT: -2}
+_STEM_WEIGHTS = {STEM_HAP_BIT: 2, STEM_CHUNG_BIT: -2}
+_MONTH_BRANCH_WEIGHTS = {BRANCH_YUKHAP_BIT: 1, BRANCH_SAMHAP_BIT: 1, BRANCH_CHUNG_BIT: -2}
+_USEFUL_WEIGHT = 2
+_FAVORABLE_WEIGHT = 1
+_WOLPA_WEIGHT = -3
+_SON_EOMNEUN_WEIGHT = 1
+_SON_EOMNEUN_DAYS = frozenset({9, 10, 19, 20, 29, 30})
+_TEN_GOD_WEIGHT = 1
+_DAY_PILLAR_WEIGHTS = {BRANCH_YUKHAP_BIT: 1, BRANCH_SAMHAP_BIT: 1, BRANCH_CHUNG_BIT: -2}
+# Ten-god families a strong / weak day master benefits from
+_WANTED_GROUPS = {
+    STRONG: frozenset({"식상", "재성", "관성"}),
+    WEAK: frozenset({"비겁", "인성"}),
+}
+
+
+@dataclass(frozen=True)
+class DayScore:
+    date: date
+    day_pillar: str  # e.g. "甲子"
+    score: int  # 0-100
+    notes: tuple[str, ...]  # rules behind the score
+
+
+def _mask_weight(mask: int, weights: dict[int, int]) -> int:
+    return sum(weight for bit, weight in weights.items() if mask & bit)
+
+
+class _ChartRows:
+    """Score of every day pillar and month pillar (by sexagenary index) for one chart."""
+
+    def __init__(self, saju: SajuData, label: str):
+        self.label = label
+        self.saju = saju
+        self.day_branch = BRANCH_INDEX[saju.day_pillar.zhi]
+        self.year_branch = BRANCH_INDEX[saju.year_pillar.zhi]
+        self.day_stem = STEM_INDEX[saju.day_pillar.gan]
+        analysis = analyze_chart(saju)
+        self.useful = analysis.useful_element
+        self.favorable = analysis.favorable_element
+        self.day = [self._day_score(i) for i in range(60)]
+        self.month = [
+            _mask_weight(BRANCH_MASKS[self.day_branch][i % 12], _MONTH_BRANCH_WEIGHTS) for i in range(60)
+        ]
+
+    def _element_score(self, element: str) -> int:
+        if element == self.useful:
+            return _USEFUL_WEIGHT
+        if element == self.favorable:
+            return _FAVORABLE_WEIGHT
+        return 0
+
+    def _day_score(self, index: int) -> int:
+        stem, branch = index % 10, index % 12
+        ganzhi = GANZHI_60[index]
+        return (
+            _mask_weight(BRANCH_MASKS[self.day_branch][branch], _DAY_BRANCH_WEIGHTS)
+            + _mask_weight(BRANCH_MASKS[self.year_branch][branch], _YEAR_BRANCH_WEIGHTS)
+            + _mask_weight(STEM_MASKS[self.day_stem][stem], _STEM_WEIGHTS)
+            + self._element_score(CHEON_GAN_TO_OH_HAENG[ganzhi[0]])
+            + self._element_score(JI_JI_TO_OH_HAENG[ganzhi[1]])
+        )
+
+    def pillar_notes(self, day: int) -> list[str]:
+        """Notes behind day[index] (also used for hour pillars)."""
+        found = []
+        prefix = f"{self.label} " if self.label else ""
+        ganzhi = GANZHI_60[day]
+        mask = BRANCH_MASKS[self.day_branch][day % 12]
+        if mask:
+            found.append(f"{prefix}일지 {self.saju.day_pillar.zhi}{ganzhi[1]} {'·'.join(BRANCH_MASK_LABELS[mask])}")
+        mask = BRANCH_MASKS[self.year_branch][day % 12] & (BRANCH_YUKHAP_BIT | BRANCH_SAMHAP_BIT | BRANCH_CHUNG_BIT)
+        if mask:
+            found.append(f"{prefix}띠 {self.saju.year_pillar.zhi}{ganzhi[1]} {'·'.join(BRANCH_MASK_LABELS[mask])}")
+        mask = STEM_MASKS[self.day_stem][day % 10]
+        if mask:
+            found.append(f"{prefix}일간 {self.saju.day_pillar.gan}{ganzhi[0]} {'·'.join(STEM_MASK_LABELS[mask])}")
+        elements = {CHEON_GAN_TO_OH_HAENG[ganzhi[0]], JI_JI_TO_OH_HAENG[ganzhi[1]]}
+        if self.useful in elements:
+            found.append(f"{prefix}용신 {self.useful}")
+        elif self.favorable in elements:
+            found.append(f"{prefix}희신 {self.favorable}")
+        return found
+
+    def notes(self, day: int, month: int) -> list[str]:
+        found = self.pillar_notes(day)
+        if BRANCH_MASKS[self.day_branch][month % 12] & BRANCH_CHUNG_BIT:
+            prefix = f"{self.label} " if self.label else ""
+            found.append(f"{prefix}일지 {self.saju.day_pillar.zhi}{GANZHI_60[month][1]} 월건 충")
+        return found
+
+
+# _WOLPA[day branch][month branch]
+_WOLPA = tuple(
+    tuple(_WOLPA_WEIGHT if BRANCH_MASKS[a][b] & BRANCH_CHUNG_BIT else 0 for b in range(12)) for a in range(12)
+)
+_SON_EOMNEUN = tuple(_SON_EOMNEUN_WEIGHT if day in _SON_EOMNEUN_DAYS else 0 for day in range(31))
+
+
+class DateScorer:
+    """Scores days against a fixed set of charts (e.g. both partners)."""
+
+    def __init__(self, charts: Sequence[SajuData], labels: Sequence[str] | None = None):
+        labels = labels or ([""] if len(charts) == 1 else [f"사람{i + 1}" for i in range(len(charts))])
+        self._rows = [_ChartRows(saju, label) for saju, label in zip(charts, labels)]
+        # Combined rows: one lookup per day for all charts
+        self._day = [sum(rows.day[i] for rows in self._rows) for i in range(60)]
+        self._month = [sum(rows.month[i] for rows in self._rows) for i in range(60)]
+        self._low = min(self._day) + min(self._month) + _WOLPA_WEIGHT
+        self._high = max(self._day) + max(self._month) + _SON_EOMNEUN_WEIGHT
+
+    def _raw_scores(self, days: bytes, months: bytes, lunar_days: bytes) -> list[int]:
+        day_row, month_row, wolpa, son = self._day, self._month, _WOLPA, _SON_EOMNEUN
+        return [
+            day_row[d] + month_row[m] + wolpa[d % 12][m % 12] + son[lunar]
+            for d, m, lunar in zip(days, months, lunar_days)
+        ]
+
+    def _normalize(self, raw: int) -> int:
+        return round(100 * (raw - self._low) / (self._high - self._low))
+
+    def _day_score(self, when: date, day: int, month: int, lunar_day: int, raw: int) -> DayScore:
+        notes = [note for rows in self._rows for note in rows.notes(day, month)]
+        if _WOLPA[day % 12][month % 12]:
+            notes.append(f"월파 ({GANZHI_60[month][1]}{GANZHI_60[day][1]} 충)")
+        if _SON_EOMNEUN[lunar_day]:
+            notes.append("손 없는 날")
+        return DayScore(when, GANZHI_60[day], self._normalize(raw), tuple(notes))
+
+    def rank(
+        self,
+        calendar: GanZhiCalendar,
+        start: date,
+        end: date,
+        *,
+        months: Collection[int] | None = None,
+        limit: int = 10,
+    ) -> list[DayScore]:
+        """The `limit` best days in start..end, best first (ties keep date order).
+
+        months restricts the candidates to those solar months. 월파 days are
+        never proposed.
+        """
+        days, month_column = calendar.columns(start, end)
+        lunar_days = lunar_day_column(start, end)
+        raw = self._raw_scores(days, month_column, lunar_days)
+        positions = [i for i in range(len(raw)) if not _WOLPA[days[i] % 12][month_column[i] % 12]]
+        if months:
+            positions = [i for i in positions if (start + timedelta(days=i)).month in months]
+        best = heapq.nsmallest(limit, positions, key=lambda i: (-raw[i], i))
+        return [
+            self._day_score(start + timedelta(days=i), days[i], month_column[i], lunar_days[i], raw[i])
+            for i in best
+        ]
+
+    def score(self, calendar: GanZhiCalendar, when: date) -> DayScore:
+        """Score a single day."""
+        days, months = calendar.columns(when, when)
+        lunar_days = lunar_day_column(when, when)
+        raw = self._raw_scores(days, months, lunar_days)[0]
+        return self._day_score(when, days[0], months[0], lunar_days[0], raw)
+
+
+@dataclass(frozen=True)
+class HourScore:
+    shi_chen: int  # 0 = 자시 ... 11 = 해시
+    hour_pillar: str  # e.g. "甲子"
+    ten_god: str  # of the hour stem, e.g. "정관"
+    score: int  # 0-100
+    notes: tuple[str, ...]
+
+
+class HourScorer:
+    """Scores the 12 hour pillars of a day against one chart."""
+
+    def __init__(self, saju: SajuData):
+        self._rows = _ChartRows(saju, "")
+        strength = analyze_chart(saju).strength
+        wanted = _WANTED_GROUPS.get(strength)
+        group_of = {god: group for group, gods in TEN_GOD_GROUPS.items() for god in gods}
+        self._ten_gods = [ten_god_of(self._rows.day_stem, stem) for stem in range(10)]
+        self._ten_god_row = [
+            0 if wanted is None else (_TEN_GOD_WEIGHT if group_of[god] in wanted else -_TEN_GOD_WEIGHT)
+            for god in self._ten_gods
+        ]
+        # Hour pillar row without the day's own branch
+        self._hour = [self._rows.day[i] + self._ten_god_row[i % 10] for i in range(60)]
+        self._low = min(self._hour) + min(_DAY_PILLAR_WEIGHTS.values())
+        self._high = max(self._hour) + max(_DAY_PILLAR_WEIGHTS.values())
+
+    def score(self, day_pillar: str, hour_pillars: Sequence[str]) -> list[HourScore]:
+        """Score each hour pillar of a day, in the given (shi-chen) order."""
+        day_branch = BRANCH_INDEX[day_pillar[1]]
+        scores = []
+        for shi_chen, pillar in enumerate(hour_pillars):
+            index = GANZHI_60.index(pillar)
+            mask = BRANCH_MASKS[day_branch][index % 12]
+            raw = self._hour[index] + _mask_weight(mask, _DAY_PILLAR_WEIGHTS)
+            notes = self._rows.pillar_notes(index)
+            if self._ten_god_row[index % 10] > 0:
+                notes.append(f"십신 {self._ten_gods[index % 10]}")
+            mask &= BRANCH_YUKHAP_BIT | BRANCH_SAMHAP_BIT | BRANCH_CHUNG_BIT
+            if mask:
+                notes.append(f"일진 {day_pillar[1]}{pillar[1]} {'·'.join(BRANCH_MASK_LABELS[mask])}")
+            scores.append(HourScore(
+                shi_chen, pillar, self._ten_gods[index % 10],
+                round(100 * (raw - self._low) / (self._high - self._low)), tuple(notes),
+            ))
+        return scores
@@ -0,0 +1,34 @@
+"""Canonical chart fingerprint for sharing interpretations between births.
+
+Every birth inside the same two-hour branch on the same day produces the
+same eight characters and Da Yun, and format_saju_for_prompt renders them
+into the same prompt. The fingerprint covers exactly the chart facts that
+reach the prompt, so births with equal fingerprints can share one cached
+LLM reading. Gender is not included on its own: it only reaches the prompt
+through the direction of the Da Yun sequence.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+
+from app.engine.models import SajuData
+
+
+def chart_fingerprint(saju: SajuData) -> str:
+    """Return a short stable hash identifying the chart's prompt-relevant facts."""
+    pillars = [
+        f"{p.gan}{p.zhi}" if p is not None else ""
+        for p in (saju.year_pillar, saju.month_pillar, saju.day_pillar, saju.time_pillar)
+    ]
+    payload = {
+        "pillars": pillars,
+        "solar": [saju.solar_year, saju.solar_month, saju.solar_day],
+        "lunar": [saju.lunar_year, saju.lunar_month, saju.lunar_day, saju.is_leap_month],
+        "da_yun_start_age": saju.da_yun_start_age,
+        "da_yun": [[dy.start_age, dy.start_year, dy.gan_zhi] for dy in saju.da_yun_list],
+        "true_solar_time": saju.used_true_solar_time,
+        "time_unknown": saju.birth_time_unknown,
+    }
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()[:20]
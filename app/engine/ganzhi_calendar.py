@@ -0,0 +1,232 @@
+"""Precomputed gan-zhi (간지) calendar for date-only lookups.
+
+Year, month, day and hour pillars of a date do not depend on the user, so
+they are computed once per day for a date range and kept in compact tables
+(one sexagenary index per byte):
+
+    day   - from the Julian day number, no lunar_python call needed
+    time  - from the day stem and the shi-chen branch (五鼠遁)
+    year/month - change only at the 12 solar-term (節) moments a year; one
+                 lunar_python call per transition covers every day between
+
+GanZhiCalendar keeps a rolling window around today hot in memory and falls
+back to lunar_python for dates outside it. Results match EightChar with the
+default sect (day pillar changes at midnight, 23:00 uses the next day's stem).
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from lunar_python import Lunar, LunarYear, Solar
+
+from app.engine.constants import CHEON_GAN_HANJA, JI_JI_HANJA
+
+# Sexagenary cycle: index i has stem i % 10 and branch i % 12
+GANZHI_60 = tuple(CHEON_GAN_HANJA[i % 10] + JI_JI_HANJA[i % 12] for i in range(60))
+_GANZHI_INDEX = {name: i for i, name in enumerate(GANZHI_60)}
+
+# Julian day number at noon of date.toordinal() == 1, minus lunar_python's offset of 11
+_DAY_OFFSET = 1721425 - 11
+
+# Solar terms that start a saju month (節), as keyed in Lunar.getJieQiTable()
+_JIE_NAMES = Lunar.JIE_QI_IN_USE[::2]
+
+# Representative hours of the 12 shi-chen, 자시 first
+SHI_CHEN_HOURS = (0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20, 22)
+
+_NO_SWITCH = 24
+
+
+@dataclass(frozen=True)
+class DatePillars:
+    """Year/month/day/hour pillars (hanja, e.g. "丙午") at a date and hour."""
+
+    year: str
+    month: str
+    day: str
+    time: str
+
+
+def _ganzhi_index(stem: int, branch: int) -> int:
+    return (6 * stem - 5 * branch) % 60
+
+
+def _time_index(day_stem: int, hour: int) -> int:
+    branch = (hour + 1) // 2 % 12
+    return _ganzhi_index((day_stem % 5 * 2 + branch) % 10, branch)
+
+
+def _direct_pillars(d: date, hour: int) -> DatePillars:
+    """Compute pillars with lunar_python (used outside the precomputed window)."""
+    ec = Solar.fromYmdHms(d.year, d.month, d.day, hour, 0, 0).getLunar().getEightChar()
+    return DatePillars(ec.getYear(), ec.getMonth(), ec.getDay(), ec.getTime())
+
+
+def _jie_transitions(first_year: int, last_year: int) -> list[tuple[datetime, int, int]]:
+    """Return (moment, year_index, month_index) for every 節 between the years."""
+    moments: set[str] = set()
+    for year in range(first_year - 1, last_year + 2):
+        table = Solar.fromYmd(year, 6, 1).getLunar().getJieQiTable()
+        moments.update(table[name].toYmdHms() for name in _JIE_NAMES)
+
+    transitions = []
+    for ymd_hms in sorted(moments):
+        moment = datetime.strptime(ymd_hms, "%Y-%m-%d %H:%M:%S")
+        ec = Solar.fromYmdHms(
+            moment.year, moment.month, moment.day, moment.hour, moment.minute, moment.second,
+        ).getLunar().getEightChar()
+        transitions.append((moment, _GANZHI_INDEX[ec.getYear()], _GANZHI_INDEX[ec.getMonth()]))
+    return transitions
+
+
+class GanZhiTable:
+    """Immutable pillar table for the solar dates start..end (inclusive)."""
+
+    def __init__(self, start: date, end: date):
+        self.start = start
+        self.end = end
+        days = (end - start).days + 1
+        self._first_ordinal = start.toordinal()
+
+        self._day = bytearray(days)
+        # Year/month at 00:00, and after the day's 節 switch hour (if any)
+        self._year = bytearray(days)
+        self._month = bytearray(days)
+        self._year_after = bytearray(days)
+        self._month_after = bytearray(days)
+        self._switch_hour = bytearray([_NO_SWITCH]) * days
+
+        transitions = _jie_transitions(start.year, end.year)
+        pos = 0
+        for i in range(days):
+            current = start + timedelta(days=i)
+            day_start = datetime(current.year, current.month, current.day)
+            while pos + 1 < len(transitions) and transitions[pos + 1][0] <= day_start:
+                pos += 1
+
+            self._day[i] = (self._first_ordinal + i + _DAY_OFFSET) % 60
+            _, self._year[i], self._month[i] = transitions[pos]
+            self._year_after[i], self._month_after[i] = self._year[i], self._month[i]
+
+            if pos + 1 < len(transitions):
+                moment, year_after, month_after = transitions[pos + 1]
+                # Lookups are at HH:00, so the switch applies from the next full hour
+                offset = moment - day_start
+                switch = -(-offset.seconds // 3600) if offset.days == 0 else _NO_SWITCH
+                if switch < _NO_SWITCH:
+                    self._switch_hour[i] = switch
+                    self._year_after[i], self._month_after[i] = year_after, month_after
+
+    def covers(self, d: date) -> bool:
+        return self.start <= d <= self.end
+
+    def columns(self, start: date, end: date) -> tuple[bytes, bytes]:
+        """Day and midday month sexagenary indices for start..end, one byte per day."""
+        i = start.toordinal() - self._first_ordinal
+        j = end.toordinal() - self._first_ordinal + 1
+        months = bytes(
+            after if switch <= 12 else before
+            for before, after, switch in zip(self._month[i:j], self._month_after[i:j], self._switch_hour[i:j])
+        )
+        return bytes(self._day[i:j]), months
+
+    def pillars(self, d: date, hour: int) -> DatePillars:
+        i = d.toordinal() - self._first_ordinal
+        day = self._day[i]
+        if hour >= self._switch_hour[i]:
+            year, month = self._year_after[i], self._month_after[i]
+        else:
+            year, month = self._year[i], self._month[i]
+        # The late 자시 (23:00) takes its stem from the following day
+        time_stem = (day + 1) % 10 if hour == 23 else day % 10
+        return DatePillars(
+            GANZHI_60[year], GANZHI_60[month], GANZHI_60[day],
+            GANZHI_60[_time_index(time_stem, hour)],
+        )
+
+
+class GanZhiCalendar:
+    """Gan-zhi lookups served from a rolling window of precomputed days.
+
+    The window spans `window_days` on each side of today and is rebuilt once
+    today drifts more than `refresh_days` from its centre. Dates outside the
+    window are computed directly with lunar_python.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_days: int = 730,
+        refresh_days: int = 30,
+        today: Callable[[], date] = date.today,
+    ):
+        self._window_days = window_days
+        self._refresh_days = refresh_days
+        self._today = today
+        self._table: GanZhiTable | None = None
+        self._center: date | None = None
+        self._lock = threading.Lock()
+
+    def warm(self) -> None:
+        """Build the window now instead of on the first lookup."""
+        self._current_table()
+
+    def _current_table(self) -> GanZhiTable:
+        today = self._today()
+        center = self._center
+        if center is None or abs((today - center).days) > self._refresh_days:
+            with self._lock:
+                if self._center is None or abs((today - self._center).days) > self._refresh_days:
+                    span = timedelta(days=self._window_days)
+                    self._table = GanZhiTable(today - span, today + span)
+                    self._center = today
+        return self._table
+
+    def pillars(self, year: int, month: int, day: int, hour: int = 12) -> DatePillars:
+        """Return the pillars of a solar date at HH:00."""
+        target = date(year, month, day)
+        table = self._current_table()
+        if table.covers(target):
+            return table.pillars(target, hour)
+        return _direct_pillars(target, hour)
+
+    def columns(self, start: date, end: date) -> tuple[bytes, bytes]:
+        """Day and midday month sexagenary indices for start..end (see GanZhiTable.columns)."""
+        table = self._current_table()
+        if not (table.covers(start) and table.covers(end)):
+            table = GanZhiTable(start, end)
+        return table.columns(start, end)
+
+    def shi_chen_pillars(self, year: int, month: int, day: int) -> list[str]:
+        """Return the hour pillar of each of the 12 shi-chen, 자시 first."""
+        return [self.pillars(year, month, day, hour).time for hour in SHI_CHEN_HOURS]
+
+    def snapshot(self) -> dict:
+        table = self._table
+        if table is None:
+            return {"start": None, "end": None}
+        return {"start": table.start.isoformat(), "end": table.end.isoformat()}
+
+
+def lunar_day_column(start: date, end: date) -> bytes:
+    """Lunar day of month (1-30) for start..end, one byte per day.
+
+    Built from the first day of each lunar month, so a year costs a couple of
+    lunar_python calls rather than one per day.
+    """
+    first_days: list[int] = []
+    for year in range(start.year - 1, end.year + 1):
+        first_days.extend(month.getFirstJulianDay() for month in LunarYear.fromYear(year).getMonths())
+    first_days = sorted(set(first_days))
+
+    column = bytearray()
+    pos = 0
+    for ordinal in range(start.toordinal(), end.toordinal() + 1):
+        julian_day = ordinal + _DAY_OFFSET + 11
+        while pos + 1 < len(first_days) and first_days[pos + 1] <= julian_day:
+            pos += 1
+        column.append(julian_day - first_days[pos] + 1)
+    return bytes(column)
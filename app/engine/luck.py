@@ -0,0 +1,97 @@
+"""Luck timeline: Da Yun (대운), yearly (세운) and monthly (월운) pillars of a chart.
+
+Every period over a horizon is read in one pass, with the ten gods of its
+stem and of its branch's main hidden stem (본기) as seen from the day master,
+and its 합·충·형·파·해 with the chart's pillars. Prompts for fortune, career,
+marriage and pet readings share the result (see FortuneService.luck_timeline)
+instead of each deriving one mid-month date.
+
+Yearly pillars change at 입춘 and monthly pillars at each month's 절기; the
+month pillar is the one in force on the 15th of the solar month.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.engine.analysis import BRANCH_MAIN_STEMS, ten_god_of
+from app.engine.ganzhi_calendar import GANZHI_60, GanZhiCalendar
+from app.engine.models import SajuData
+from app.engine.relations import BRANCH_INDEX, STEM_INDEX, Interaction, date_interactions
+
+DA_YUN, SE_UN, WOL_UN = "대운", "세운", "월운"
+
+# Day of the solar month whose month pillar stands for the whole month
+_MONTH_PILLAR_DAY = 15
+
+
+@dataclass(frozen=True)
+class LuckPeriod:
+    """One Da Yun, year or month of the timeline."""
+
+    kind: str  # 대운 / 세운 / 월운
+    year: int  # first year of a 대운, or the year
+    month: int | None  # solar month, 월운 only
+    gan_zhi: str  # e.g. "丙午"
+    stem_ten_god: str
+    branch_ten_god: str  # of the branch's main hidden stem
+    relations: tuple[Interaction, ...]  # with the chart's pillars
+
+
+@dataclass(frozen=True)
+class LuckTimeline:
+    start_year: int
+    start_month: int
+    da_yun: tuple[LuckPeriod, ...]  # periods overlapping the yearly horizon
+    years: tuple[LuckPeriod, ...]
+    months: tuple[LuckPeriod, ...]
+
+
+def _period(saju: SajuData, kind: str, year: int, month: int | None, gan_zhi: str) -> LuckPeriod:
+    day_stem = STEM_INDEX[saju.day_pillar.gan]
+    main_stem = BRANCH_MAIN_STEMS[BRANCH_INDEX[gan_zhi[1]]]
+    return LuckPeriod(
+        kind=kind,
+        year=year,
+        month=month,
+        gan_zhi=gan_zhi,
+        stem_ten_god=ten_god_of(day_stem, STEM_INDEX[gan_zhi[0]]),
+        branch_ten_god=ten_god_of(day_stem, STEM_INDEX[main_stem]),
+        relations=date_interactions(saju, [(kind, gan_zhi)]),
+    )
+
+
+def year_ganzhi(year: int) -> str:
+    """Year pillar in force from 입춘 of a year, e.g. 2026 -> 丙午."""
+    return GANZHI_60[(year - 4) % 60]
+
+
+def luck_timeline(
+    saju: SajuData,
+    calendar: GanZhiCalendar,
+    start_year: int,
+    start_month: int = 1,
+    *,
+    years: int = 5,
+    months: int = 12,
+) -> LuckTimeline:
+    """Da Yun, `years` yearly and `months` monthly periods from start_year/start_month."""
+    last_year = start_year + years - 1
+    da_yun = []
+    for i, dy in enumerate(saju.da_yun_list):
+        following = saju.da_yun_list[i + 1].start_year if i + 1 < len(saju.da_yun_list) else None
+        if dy.start_year <= last_year and (following is None or following > start_year):
+            da_yun.append(_period(saju, DA_YUN, dy.start_year, None, dy.gan_zhi))
+
+    yearly = [
+        _period(saju, SE_UN, year, None, year_ganzhi(year))
+        for year in range(start_year, last_year + 1)
+    ]
+
+    monthly = []
+    for offset in range(months):
+        year, month = divmod(start_month - 1 + offset, 12)
+        year, month = start_year + year, month + 1
+        gan_zhi = calendar.pillars(year, month, _MONTH_PILLAR_DAY).month
+        monthly.append(_period(saju, WOL_UN, year, month, gan_zhi))
+
+    return LuckTimeline(start_year, start_month, tuple(da_yun), tuple(yearly), tuple(monthly))
@@ -0,0 +1,199 @@
+"""Pairwise stem/branch relations (합·충·형·파·해) as index lookup tables.
+
+Stems and branches are addressed by their index in CHEON_GAN_HANJA and
+JI_JI_HANJA, so a relation check is a single tuple lookup.
+
+STEM_RELATIONS/BRANCH_RELATIONS give one main relation per pair, for scoring.
+STEM_MASKS/BRANCH_MASKS give every relation of a pair as a bitmask (巳申 is
+육합, 형 and 파 at once), for listing interactions within a chart, between
+two charts, or between a chart and the pillars of a date.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from itertools import combinations
+
+from app.engine.constants import CHEON_GAN_HANJA, JI_JI_HANJA, OH_HAENG_HANJA
+from app.engine.models import PillarInfo, SajuData
+
+STEM_INDEX = {gan: i for i, gan in enumerate(CHEON_GAN_HANJA)}
+BRANCH_INDEX = {zhi: i for i, zhi in enumerate(JI_JI_HANJA)}
+ELEMENT_INDEX = {element: i for i, element in enumerate(OH_HAENG_HANJA)}
+
+# Stem relations
+STEM_NONE, STEM_HAP, STEM_CHUNG = range(3)
+# Branch relations
+BRANCH_NONE, BRANCH_YUKHAP, BRANCH_SAMHAP, BRANCH_CHUNG = range(4)
+
+
+def _stem_relation(a: int, b: int) -> int:
+    if (a - b) % 10 == 5:
+        return STEM_HAP  # 甲己, 乙庚, 丙辛, 丁壬, 戊癸
+    if abs(a - b) == 6:
+        return STEM_CHUNG  # 甲庚, 乙辛, 丙壬, 丁癸
+    return STEM_NONE
+
+
+def _branch_relation(a: int, b: int) -> int:
+    if (a + b) % 12 == 1:
+        return BRANCH_YUKHAP  # 子丑, 寅亥, 卯戌, 辰酉, 巳申, 午未
+    if (a - b) % 12 == 6:
+        return BRANCH_CHUNG  # 子午, 丑未, 寅申, 卯酉, 辰戌, 巳亥
+    if a != b and a % 4 == b % 4:
+        return BRANCH_SAMHAP  # 申子辰, 亥卯未, 寅午戌, 巳酉丑
+    return BRANCH_NONE
+
+
+# STEM_RELATIONS[a][b], BRANCH_RELATIONS[a][b]
+STEM_RELATIONS = tuple(tuple(_stem_relation(a, b) for b in range(10)) for a in range(10))
+BRANCH_RELATIONS = tuple(tuple(_branch_relation(a, b) for b in range(12)) for a in range(12))
+
+# Element a generates element GENERATES[a] (木->火->土->金->水->木)
+GENERATES = tuple((i + 1) % 5 for i in range(5))
+
+
+def stem_element(stem: int) -> int:
+    """Element index of a stem (甲乙 木, 丙丁 火, ...)."""
+    return stem // 2
+
+
+STEM_RELATION_LABELS = {STEM_HAP: "합", STEM_CHUNG: "충"}
+BRANCH_RELATION_LABELS = {BRANCH_YUKHAP: "육합", BRANCH_SAMHAP: "삼합", BRANCH_CHUNG: "충"}
+
+
+# Relation bits
+STEM_HAP_BIT = 1 << 0
+STEM_CHUNG_BIT = 1 << 1
+
+BRANCH_YUKHAP_BIT = 1 << 0
+BRANCH_SAMHAP_BIT = 1 << 1
+BRANCH_CHUNG_BIT = 1 << 2
+BRANCH_HYUNG_BIT = 1 << 3
+BRANCH_PA_BIT = 1 << 4
+BRANCH_HAE_BIT = 1 << 5
+
+_BRANCH_HYUNG = (
+    "寅巳", "巳申", "寅申",  # 무은지형
+    "丑戌", "戌未", "丑未",  # 지세지형
+    "子卯",  # 무례지형
+    "辰辰", "午午", "酉酉", "亥亥",  # 자형
+)
+_BRANCH_PA = ("子酉", "丑辰", "寅亥", "卯午", "巳申", "未戌")
+_BRANCH_HAE = ("子未", "丑午", "寅巳", "卯辰", "申亥", "酉戌")
+
+_STEM_RELATION_BITS = {STEM_HAP: STEM_HAP_BIT, STEM_CHUNG: STEM_CHUNG_BIT}
+_BRANCH_RELATION_BITS = {
+    BRANCH_YUKHAP: BRANCH_YUKHAP_BIT,
+    BRANCH_SAMHAP: BRANCH_SAMHAP_BIT,
+    BRANCH_CHUNG: BRANCH_CHUNG_BIT,
+}
+
+
+def _pair_set(pairs: Iterable[str]) -> frozenset[tuple[int, int]]:
+    found = set()
+    for a, b in pairs:
+        a, b = BRANCH_INDEX[a], BRANCH_INDEX[b]
+        found.update(((a, b), (b, a)))
+    return frozenset(found)
+
+
+_BRANCH_EXTRA_BITS = (
+    (BRANCH_HYUNG_BIT, _pair_set(_BRANCH_HYUNG)),
+    (BRANCH_PA_BIT, _pair_set(_BRANCH_PA)),
+    (BRANCH_HAE_BIT, _pair_set(_BRANCH_HAE)),
+)
+
+
+def _branch_mask(a: int, b: int) -> int:
+    mask = _BRANCH_RELATION_BITS.get(BRANCH_RELATIONS[a][b], 0)
+    for bit, pairs in _BRANCH_EXTRA_BITS:
+        if (a, b) in pairs:
+            mask |= bit
+    return mask
+
+
+# STEM_MASKS[a][b], BRANCH_MASKS[a][b]: OR of the relation bits of a pair
+STEM_MASKS = tuple(
+    tuple(_STEM_RELATION_BITS.get(STEM_RELATIONS[a][b], 0) for b in range(10)) for a in range(10)
+)
+BRANCH_MASKS = tuple(tuple(_branch_mask(a, b) for b in range(12)) for a in range(12))
+
+STEM_BIT_LABELS = ((STEM_HAP_BIT, "합"), (STEM_CHUNG_BIT, "충"))
+BRANCH_BIT_LABELS = (
+    (BRANCH_YUKHAP_BIT, "육합"),
+    (BRANCH_SAMHAP_BIT, "삼합"),
+    (BRANCH_CHUNG_BIT, "충"),
+    (BRANCH_HYUNG_BIT, "형"),
+    (BRANCH_PA_BIT, "파"),
+    (BRANCH_HAE_BIT, "해"),
+)
+
+
+def _labels_by_mask(bit_labels: tuple[tuple[int, str], ...]) -> tuple[tuple[str, ...], ...]:
+    size = 1 << len(bit_labels)
+    return tuple(tuple(label for bit, label in bit_labels if mask & bit) for mask in range(size))
+
+
+# STEM_MASK_LABELS[mask]: relation names of a mask, in bit order
+STEM_MASK_LABELS = _labels_by_mask(STEM_BIT_LABELS)
+BRANCH_MASK_LABELS = _labels_by_mask(BRANCH_BIT_LABELS)
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """Relations found between two stems or two branches."""
+
+    positions: str  # e.g. "일지-시지", "일지-상대 일지", "일지-일진 지지"
+    characters: str  # e.g. "巳申"
+    relations: tuple[str, ...]  # e.g. ("육합", "형", "파")
+
+
+# (stem position, branch position, stem, branch) of one pillar
+_Slot = tuple[str, str, str, str]
+
+_PILLAR_LABELS = ("연", "월", "일", "시")
+
+
+def _chart_slots(saju: SajuData, prefix: str = "") -> list[_Slot]:
+    pillars: tuple[PillarInfo | None, ...] = (
+        saju.year_pillar, saju.month_pillar, saju.day_pillar, saju.time_pillar,
+    )
+    return [
+        (f"{prefix}{label}간", f"{prefix}{label}지", p.gan, p.zhi)
+        for label, p in zip(_PILLAR_LABELS, pillars)
+        if p is not None
+    ]
+
+
+def _interactions(pairs: Iterable[tuple[_Slot, _Slot]]) -> tuple[Interaction, ...]:
+    # Stem relations first, then branch relations, each in pair order
+    stems, branches = [], []
+    for a, b in pairs:
+        stem_mask = STEM_MASKS[STEM_INDEX[a[2]]][STEM_INDEX[b[2]]]
+        if stem_mask:
+            stems.append(Interaction(f"{a[0]}-{b[0]}", a[2] + b[2], STEM_MASK_LABELS[stem_mask]))
+        branch_mask = BRANCH_MASKS[BRANCH_INDEX[a[3]]][BRANCH_INDEX[b[3]]]
+        if branch_mask:
+            branches.append(Interaction(f"{a[1]}-{b[1]}", a[3] + b[3], BRANCH_MASK_LABELS[branch_mask]))
+    return tuple(stems + branches)
+
+
+def chart_interactions(saju: SajuData) -> tuple[Interaction, ...]:
+    """Relations between the pillars of one chart."""
+    return _interactions(combinations(_chart_slots(saju), 2))
+
+
+def pair_interactions(saju: SajuData, other: SajuData) -> tuple[Interaction, ...]:
+    """Relations between every pillar of saju and every pillar of other ("상대")."""
+    others = _chart_slots(other, "상대 ")
+    return _interactions((a, b) for a in _chart_slots(saju) for b in others)
+
+
+def date_interactions(saju: SajuData, pillars: Sequence[tuple[str, str]]) -> tuple[Interaction, ...]:
+    """Relations between a chart and the pillars of a date or period.
+
+    pillars are (label, gan-zhi) pairs, e.g. [("세운", "丙午"), ("일진", "甲子")].
+    """
+    targets = [(f"{label} 천간", f"{label} 지지", ganzhi[0], ganzhi[1]) for label, ganzhi in pillars]
+    return _interactions((a, b) for b in targets for a in _chart_slots(saju))
@@ -0,0 +1,142 @@
+"""Table-driven sinsal (신살) lookup.
+
+Each sinsal is read from one character of the chart (the day stem, the year
+or day branch, the month branch or a whole pillar) through a fixed table, so
+the list is computed here instead of being left to the LLM:
+
+    day stem        천을귀인, 문창귀인, 금여, 양인, 홍염 (found in any branch)
+    year/day branch 도화, 역마, 화개, 겁살 via the 삼합 frame of the branch
+                    (found in the other branches)
+    month branch    천덕귀인 (any stem or branch), 월덕귀인 (any stem)
+    pillars         괴강 (day pillar), 백호 (any pillar), 공망 (branches void
+                    in the day pillar's 旬), 원진 (branch pairs)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+
+from app.engine.constants import JI_JI_HANJA
+from app.engine.ganzhi_calendar import GANZHI_60
+from app.engine.models import PillarInfo, SajuData
+
+GOOD, BAD, SPECIAL = "길신", "흉신", "특수"
+
+# name -> (kind, {day stem: branches})
+_DAY_STEM_RULES: dict[str, tuple[str, dict[str, str]]] = {
+    "천을귀인": (GOOD, {
+        "甲": "丑未", "乙": "子申", "丙": "亥酉", "丁": "亥酉", "戊": "丑未",
+        "己": "子申", "庚": "丑未", "辛": "寅午", "壬": "巳卯", "癸": "巳卯",
+    }),
+    "문창귀인": (GOOD, {
+        "甲": "巳", "乙": "午", "丙": "申", "丁": "酉", "戊": "申",
+        "己": "酉", "庚": "亥", "辛": "子", "壬": "寅", "癸": "卯",
+    }),
+    "금여": (GOOD, {
+        "甲": "辰", "乙": "巳", "丙": "未", "丁": "申", "戊": "未",
+        "己": "申", "庚": "戌", "辛": "亥", "壬": "丑", "癸": "寅",
+    }),
+    "양인": (BAD, {"甲": "卯", "丙": "午", "戊": "午", "庚": "酉", "壬": "子"}),
+    "홍염": (SPECIAL, {
+        "甲": "午", "乙": "午", "丙": "寅", "丁": "未", "戊": "辰",
+        "己": "辰", "庚": "戌", "辛": "酉", "壬": "子", "癸": "申",
+    }),
+}
+
+# 삼합 frame of each branch
+_FRAMES = ("申子辰", "寅午戌", "巳酉丑", "亥卯未")
+_FRAME_OF = {branch: frame for frame in _FRAMES for branch in frame}
+
+# name -> (kind, {frame: branch})
+_FRAME_RULES: dict[str, tuple[str, dict[str, str]]] = {
+    "도화": (SPECIAL, {"申子辰": "酉", "寅午戌": "卯", "巳酉丑": "午", "亥卯未": "子"}),
+    "역마": (SPECIAL, {"申子辰": "寅", "寅午戌": "申", "巳酉丑": "亥", "亥卯未": "巳"}),
+    "화개": (SPECIAL, {"申子辰": "辰", "寅午戌": "戌", "巳酉丑": "丑", "亥卯未": "未"}),
+    "겁살": (BAD, {"申子辰": "巳", "寅午戌": "亥", "巳酉丑": "寅", "亥卯未": "申"}),
+}
+
+# month branch -> stem or branch
+_CHEON_DEOK = {
+    "子": "巳", "丑": "庚", "寅": "丁", "卯": "申", "辰": "壬", "巳": "辛",
+    "午": "亥", "未": "甲", "申": "癸", "酉": "寅", "戌": "丙", "亥": "乙",
+}
+# month branch frame -> stem
+_WOL_DEOK = {"寅午戌": "丙", "申子辰": "壬", "亥卯未": "甲", "巳酉丑": "庚"}
+
+_GOEGANG = frozenset({"庚辰", "庚戌", "壬辰", "壬戌", "戊戌"})
+_BAEKHO = frozenset({"甲辰", "乙未", "丙戌", "丁丑", "戊辰", "壬戌", "癸丑"})
+_WONJIN = frozenset(
+    frozenset(pair) for pair in ("子未", "丑午", "寅酉", "卯申", "辰亥", "巳戌")
+)
+
+_PILLAR_LABELS = ("연", "월", "일", "시")
+
+
+@dataclass(frozen=True)
+class Sinsal:
+    """One sinsal found in a chart."""
+
+    name: str  # e.g. "천을귀인"
+    kind: str  # 길신 / 흉신 / 특수
+    positions: tuple[str, ...]  # where it sits, e.g. ("연지", "시지")
+    basis: str  # what it is read from, e.g. "일간 甲"
+
+
+def _labelled(saju: SajuData) -> list[tuple[str, PillarInfo]]:
+    pillars = (saju.year_pillar, saju.month_pillar, saju.day_pillar, saju.time_pillar)
+    return [(label, p) for label, p in zip(_PILLAR_LABELS, pillars) if p is not None]
+
+
+def void_branches(day_ganzhi: str) -> str:
+    """The two branches left out of a day pillar's 旬 (공망), e.g. 甲子 -> 戌亥."""
+    start = GANZHI_60.index(day_ganzhi) // 10 * 10
+    first = JI_JI_HANJA.index(GANZHI_60[start][1])
+    return JI_JI_HANJA[(first + 10) % 12] + JI_JI_HANJA[(first + 11) % 12]
+
+
+def find_sinsal(saju: SajuData) -> tuple[Sinsal, ...]:
+    """Every sinsal in the chart, in the order of the rule tables."""
+    pillars = _labelled(saju)
+    day = saju.day_pillar
+    found: list[Sinsal] = []
+
+    def add(name: str, kind: str, positions: list[str], basis: str) -> None:
+        if positions:
+            found.append(Sinsal(name, kind, tuple(positions), basis))
+
+    for name, (kind, table) in _DAY_STEM_RULES.items():
+        targets = table.get(day.gan, "")
+        add(name, kind, [f"{label}지" for label, p in pillars if p.zhi in targets], f"일간 {day.gan}")
+
+    for name, (kind, table) in _FRAME_RULES.items():
+        for base_label, base in pillars:
+            if base_label not in ("연", "일"):
+                continue
+            target = table[_FRAME_OF[base.zhi]]
+            positions = [f"{label}지" for label, p in pillars if label != base_label and p.zhi == target]
+            add(name, kind, positions, f"{base_label}지 {base.zhi}")
+
+    month = saju.month_pillar.zhi
+    cheon_deok = _CHEON_DEOK[month]
+    add("천덕귀인", GOOD, [
+        f"{label}{part}" for label, p in pillars
+        for part, char in (("간", p.gan), ("지", p.zhi)) if char == cheon_deok
+    ], f"월지 {month}")
+    wol_deok = _WOL_DEOK[_FRAME_OF[month]]
+    add("월덕귀인", GOOD, [f"{label}간" for label, p in pillars if p.gan == wol_deok], f"월지 {month}")
+
+    if day.gan + day.zhi in _GOEGANG:
+        add("괴강", SPECIAL, ["일주"], f"일주 {day.gan}{day.zhi}")
+    add("백호", BAD, [f"{label}주" for label, p in pillars if p.gan + p.zhi in _BAEKHO], "각 기둥")
+
+    void = void_branches(day.gan + day.zhi)
+    add("공망", BAD, [
+        f"{label}지" for label, p in pillars if label != "일" and p.zhi in void
+    ], f"일주 {day.gan}{day.zhi} ({void} 공망)")
+
+    wonjin = [
+        f"{label_a}지-{label_b}지" for (label_a, a), (label_b, b) in combinations(pillars, 2)
+        if frozenset((a.zhi, b.zhi)) in _WONJIN
+    ]
+    add("원진", BAD, wonjin, "지지 쌍")
+    return tuple(found)
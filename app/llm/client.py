@@ -3,21 +3,73 @@ from __future__ import annotations
 import logging
 from collections.abc import AsyncIterator
 
-from anthropic import AsyncAnthropic
-
 from app.config import settings
-from app.llm.model_router import get_model_for_type
+from app.llm.hedging import HedgeMetrics, run_hedged
+from app.llm.model_router import (
+    get_hedge_model_for_type,
+    get_model_for_type,
+    get_timeout_for_type,
+)
 from app.llm.prompts.system import SYSTEM_PROMPT
-from app.middleware.error_handler import LLMError
+from app.llm.providers import LLMProvider
+from app.llm.scheduler import LLMScheduler
+from app.middleware.error_handler import CircuitOpenError, LLMError
+from app.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    call_with_resilience,
+    create_breaker,
+    stream_with_resilience,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class LLMClient:
-    """Async Anthropic Claude client wrapper."""
+    """Async LLM client wrapper over a pluggable provider backend."""
+
+    def __init__(
+        self,
+        provider: LLMProvider | None = None,
+        scheduler: LLMScheduler | None = None,
+        *,
+        breaker: CircuitBreaker | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        self._provider = provider
+        self._scheduler = scheduler or LLMScheduler.from_settings()
+        self._breaker = breaker or create_breaker(
+            "llm",
+            failure_threshold=settings.llm_breaker_failure_threshold,
+            reset_timeout=settings.llm_breaker_reset_seconds,
+        )
+        self._retry_policy = retry_policy or RetryPolicy(
+            attempts=settings.llm_retry_attempts,
+            base_delay=settings.llm_retry_base_delay,
+            max_delay=settings.llm_retry_max_delay,
+        )
+        self.hedge_metrics = HedgeMetrics()
 
-    def __init__(self, client: AsyncAnthropic | None = None):
-        self._client = client
+    @property
+    def provider_name(self) -> str | None:
+        return self._provider.name if self._provider is not None else None
+
+    async def aclose(self) -> None:
+        """Close the provider's underlying HTTP connections, if any."""
+        close = getattr(self._provider, "aclose", None)
+        if close is not None:
+            await close()
+
+    def metrics_snapshot(self) -> dict:
+        """Return hedging and connection pool metrics for monitoring."""
+        pool_metrics = getattr(self._provider, "pool_metrics", None)
+        return {
+            "provider": self.provider_name,
+            "hedging": self.hedge_metrics.snapshot(),
+            "pool": pool_metrics.snapshot() if pool_metrics is not None else None,
+            "scheduler": self._scheduler.snapshot(),
+            "breaker": self._breaker.snapshot(),
+        }
 
     @staticmethod
     def _apply_language(prompt: str, language: str) -> str:
@@ -30,6 +82,45 @@ class LLMClient:
         """Return the custom prompt if provided, otherwise the default."""
         return custom_system_prompt if custom_system_prompt else SYSTEM_PROMPT
 
+    async def _create(
+        self, model: str, reading_type: str, system_prompt: str, user_prompt: str,
+    ) -> str:
+        """Provider call with retries, holding a scheduler slot for `model`."""
+        async with self._scheduler.slot(model, reading_type):
+            return await call_with_resilience(
+                lambda: self._provider.create(
+                    model=model,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    max_tokens=settings.llm_max_tokens,
+                    temperature=settings.llm_temperature,
+                    timeout=get_timeout_for_type(reading_type),
+                ),
+                breaker=self._breaker,
+                policy=self._retry_policy,
+                is_retryable=self._provider.is_retryable,
+            )
+
+    async def _stream(
+        self, model: str, reading_type: str, system_prompt: str, user_prompt: str,
+    ) -> AsyncIterator[str]:
+        """Provider stream with retries, holding a scheduler slot until exhausted."""
+        async with self._scheduler.slot(model, reading_type):
+            async for text in stream_with_resilience(
+                lambda: self._provider.stream(
+                    model=model,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    max_tokens=settings.llm_max_tokens,
+                    temperature=settings.llm_temperature,
+                    timeout=get_timeout_for_type(reading_type),
+                ),
+                breaker=self._breaker,
+                policy=self._retry_policy,
+                is_retryable=self._provider.is_retryable,
+            ):
+                yield text
+
     async def generate(
         self,
         user_prompt: str,
@@ -38,29 +129,29 @@ class LLMClient:
         language: str = "ko",
         custom_system_prompt: str | None = None,
     ) -> str:
-        """Generate a complete response (non-streaming)."""
-        if self._client is None:
-            raise LLMError("Anthropic client not configured. Set ANTHROPIC_API_KEY.")
+        """Generate a complete response (non-streaming).
+
+        Reading types listed in settings.llm_hedge_budgets_ms are hedged to the
+        fast model when the primary misses its time-to-first-token budget.
+        """
+        if self._provider is None:
+            raise LLMError("LLM provider not configured. Set ANTHROPIC_API_KEY.")
 
         model = get_model_for_type(reading_type)
         final_prompt = self._apply_language(user_prompt, language)
         system_prompt = self._resolve_system_prompt(custom_system_prompt)
+        budget_ms = settings.llm_hedge_budgets_ms.get(reading_type)
         try:
-            response = await self._client.messages.create(
-                model=model,
-                max_tokens=settings.llm_max_tokens,
-                temperature=settings.llm_temperature,
-                system=[
-                    {
-                        "type": "text",
-                        "text": system_prompt,
-                        "cache_control": {"type": "ephemeral"},
-                    }
-                ],
-                messages=[{"role": "user", "content": final_prompt}],
-            )
-            return response.content[0].text
-        except LLMError:
+            if budget_ms:
+                return await run_hedged(
+                    lambda m: self._stream(m, reading_type, system_prompt, final_prompt),
+                    primary_model=model,
+                    hedge_model=get_hedge_model_for_type(reading_type),
+                    budget_seconds=budget_ms / 1000,
+                    metrics=self.hedge_metrics,
+                )
+            return await self._create(model, reading_type, system_prompt, final_prompt)
+        except (LLMError, CircuitOpenError):
             raise
         except Exception as exc:
             logger.error("LLM generation failed", exc_info=True)
@@ -75,29 +166,16 @@ class LLMClient:
         custom_system_prompt: str | None = None,
     ) -> AsyncIterator[str]:
         """Generate a streaming response, yielding text chunks."""
-        if self._client is None:
-            raise LLMError("Anthropic client not configured. Set ANTHROPIC_API_KEY.")
+        if self._provider is None:
+            raise LLMError("LLM provider not configured. Set ANTHROPIC_API_KEY.")
 
         model = get_model_for_type(reading_type)
         final_prompt = self._apply_language(user_prompt, language)
         system_prompt = self._resolve_system_prompt(custom_system_prompt)
         try:
-            async with self._client.messages.stream(
-                model=model,
-                max_tokens=settings.llm_max_tokens,
-                temperature=settings.llm_temperature,
-                system=[
-                    {
-                        "type": "text",
-                        "text": system_prompt,
-                        "cache_control": {"type": "ephemeral"},
-                    }
-                ],
-                messages=[{"role": "user", "content": final_prompt}],
-            ) as stream:
-                async for text in stream.text_stream:
-                    yield text
-        except LLMError:
+            async for text in self._stream(model, reading_type, system_prompt, final_prompt):
+                yield text
+        except (LLMError, CircuitOpenError):
             raise
         except Exception as exc:
             logger.error("LLM streaming failed", exc_info=True)
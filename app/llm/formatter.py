@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from app.engine.analysis import ChartAnalysis, analyze_chart
+from app.engine.auspicious import DayScore, HourScore
+from app.engine.luck import DA_YUN, SE_UN, LuckPeriod, LuckTimeline
 from app.engine.models import SajuData
+from app.engine.relations import Interaction, date_interactions, pair_interactions
+from app.engine.sinsal import Sinsal
+from app.models.request import CareerInfo, RelationshipInfoInput
+
+if TYPE_CHECKING:
+    from app.services.group_match import GroupMatrix, GroupPair
+
 
+def format_saju_for_prompt(
+    data: SajuData,
+    *,
+    partner: SajuData | None = None,
+    target: Sequence[tuple[str, str]] = (),
+    luck: LuckTimeline | None = None,
+) -> str:
+    """Format SajuData into a structured text block for LLM prompts.
 
-def format_saju_for_prompt(data: SajuData) -> str:
-    """Format SajuData into a structured text block for LLM prompts."""
+    With partner, the relations between the two charts are appended; with
+    target, the relations to those (label, gan-zhi) pillars of a date or
+    period, e.g. [("세운", "丙午"), ("일진", "甲子")]; with luck, the
+    upcoming 대운/세운/월운 (see app.engine.luck).
+    """
     lines = [
         f"생년월일: {data.solar_year}년 {data.solar_month}월 {data.solar_day}일 (양력)",
     ]
 
     if not data.birth_time_unknown:
-        lines.append(f"출생시각: {data.solar_hour}시 {data.solar_minute}분")
+        # Only the hour branch shapes the chart. Leaving out the exact minute
+        # lets births with the same chart share a prompt (see chart_fingerprint).
+        tp = data.time_pillar
+        lines.append(f"출생시각: {tp.zhi_kor}시({tp.zhi}時)")
         if data.used_true_solar_time:
             lines.append("(진태양시 적용: KST 기준 서울 경도 127도E 보정, 약 -32분)")
     else:
@@ -69,9 +96,7 @@ def format_saju_for_prompt(data: SajuData) -> str:
 
     # Element counts
     lines.append("## 오행 분포")
-    for element, count in data.element_counts.items():
-        bar = "■" * count + "□" * (4 - count)
-        lines.append(f"- {element}: {count}개 {bar}")
+    lines.append(", ".join(f"{element} {count}" for element, count in data.element_counts.items()))
     lines.append("")
 
     # Ten gods
@@ -103,10 +128,212 @@ def format_saju_for_prompt(data: SajuData) -> str:
     lines.append(f"- 신궁(身宮): {data.shen_gong} ({data.shen_gong_na_yin})")
     lines.append("")
 
+    lines.extend(format_analysis(analyze_chart(data)))
+    lines.append("")
+
     # Da Yun
     lines.append("## 대운(大運)")
     lines.append(f"대운 시작: {data.da_yun_start_age}세")
     for dy in data.da_yun_list:
         lines.append(f"- {dy.start_age}세 ({dy.start_year}년~): {dy.gan_zhi}")
 
+    if partner is not None:
+        lines.append("")
+        lines.extend(format_partner_interactions(data, partner))
+    if target:
+        lines.append("")
+        lines.extend(format_target_interactions(data, target))
+    if luck is not None:
+        lines.append("")
+        lines.extend(format_luck_timeline(luck))
+
+    return "\n".join(lines)
+
+
+def format_analysis(analysis: ChartAnalysis) -> list[str]:
+    """Render the rule-based analysis as settled facts for the prompt."""
+    lines = ["## 규칙 기반 분석 (확정)"]
+    lines.append(f"- 신강약: {analysis.strength} ({analysis.strength_score}/100)")
+    lines.append(
+        f"- 용신 후보: {analysis.useful_element}, 희신: {analysis.favorable_element} ({analysis.useful_reason})"
+    )
+    groups = ", ".join(f"{group} {count}" for group, count in analysis.group_counts.items())
+    lines.append(f"- 십신 분포: {groups}")
+    if analysis.dominant_ten_gods:
+        lines.append(f"- 두드러진 십신: {', '.join(analysis.dominant_ten_gods)}")
+    if analysis.missing_groups:
+        lines.append(f"- 없는 십신: {', '.join(analysis.missing_groups)}")
+    if analysis.excess_elements:
+        lines.append(f"- 과다 오행: {', '.join(analysis.excess_elements)}")
+    if analysis.missing_elements:
+        lines.append(f"- 없는 오행: {', '.join(analysis.missing_elements)}")
+    if analysis.relations:
+        relations = ", ".join(_interaction_text(i) for i in analysis.relations)
+        lines.append(f"- 합충형파해: {relations}")
+    return lines
+
+
+def _interaction_text(interaction: Interaction) -> str:
+    return f"{interaction.positions} {interaction.characters} {'·'.join(interaction.relations)}"
+
+
+def _interaction_lines(interactions: tuple[Interaction, ...]) -> list[str]:
+    if not interactions:
+        return ["- 없음"]
+    return [f"- {_interaction_text(i)}" for i in interactions]
+
+
+def _luck_line(period: LuckPeriod) -> str:
+    if period.kind == DA_YUN:
+        when = f"{period.year}년~"
+    elif period.kind == SE_UN:
+        when = f"{period.year}년"
+    else:
+        when = f"{period.year}년 {period.month}월"
+    line = f"- {period.kind} {when} {period.gan_zhi} ({period.stem_ten_god}/{period.branch_ten_god})"
+    if period.relations:
+        # Only the chart side is named; the other side is the period itself
+        relations = ", ".join(
+            f"{i.positions.split('-')[0]} {i.characters} {'·'.join(i.relations)}" for i in period.relations
+        )
+        line += f": {relations}"
+    return line
+
+
+def format_luck_timeline(timeline: LuckTimeline) -> list[str]:
+    """Render the upcoming 대운/세운/월운 with their ten gods (천간/지지) and relations."""
+    lines = ["## 운세 흐름 (대운·세운·월운, 확정, 괄호는 천간/지지 십신)"]
+    lines.extend(_luck_line(p) for p in (*timeline.da_yun, *timeline.years, *timeline.months))
+    return lines
+
+
+def format_partner_interactions(data: SajuData, partner: SajuData) -> list[str]:
+    """Render the 합·충·형·파·해 between data and partner ("상대")."""
+    return ["## 상대 사주와의 합충형파해 (확정)", *_interaction_lines(pair_interactions(data, partner))]
+
+
+def format_target_interactions(data: SajuData, target: Sequence[tuple[str, str]]) -> list[str]:
+    """Render the 합·충·형·파·해 between data and the target pillars."""
+    pillars = ", ".join(f"{label} {ganzhi}" for label, ganzhi in target)
+    return [f"## 대상 간지({pillars})와의 합충형파해 (확정)", *_interaction_lines(date_interactions(data, target))]
+
+
+def format_sinsal(sinsal: tuple[Sinsal, ...]) -> str:
+    """Render computed sinsal as settled facts for the prompt."""
+    if not sinsal:
+        return "- 없음"
+    return "\n".join(
+        f"- {s.name} ({s.kind}): {', '.join(s.positions)} [{s.basis} 기준]" for s in sinsal
+    )
+
+
+_WEEKDAYS = "월화수목금토일"
+
+
+def format_day_score(score: DayScore) -> str:
+    """One line per scored day, e.g. "2026-05-16(토) 甲子일 82점: 일지 辰子 삼합"."""
+    weekday = _WEEKDAYS[score.date.weekday()]
+    notes = ", ".join(score.notes) if score.notes else "특이 사항 없음"
+    return f"- {score.date.isoformat()}({weekday}) {score.day_pillar}일 {score.score}점: {notes}"
+
+
+def format_hour_score(score: HourScore, label: str) -> str:
+    """One line per scored hour, e.g. "미시(未時) 13:00-15:00 乙未 80점 (정재): 일간 庚乙 합"."""
+    notes = ", ".join(score.notes) if score.notes else "특이 사항 없음"
+    return f"- {label} {score.hour_pillar} {score.score}점 ({score.ten_god}): {notes}"
+
+
+def chart_pillars(data: SajuData) -> str:
+    """Known pillars of a chart, year first, e.g. "庚午 辛巳 庚辰 癸未"."""
+    pillars = (data.year_pillar, data.month_pillar, data.day_pillar, data.time_pillar)
+    return " ".join(p.gan + p.zhi for p in pillars if p is not None)
+
+
+def _group_pair_line(pair: GroupPair, labels: Sequence[str]) -> str:
+    notes = ", ".join(pair.highlights) if pair.highlights else "특이 사항 없음"
+    return f"- {labels[pair.first]}-{labels[pair.second]} {pair.score}점: {notes}"
+
+
+def format_group_summary(
+    labels: Sequence[str], charts: Sequence[SajuData], matrix: GroupMatrix,
+) -> str:
+    """Members, clusters and best/worst pairs of a group matrix (no full charts)."""
+    lines = ["## 구성원"]
+    for label, data in zip(labels, charts):
+        analysis = analyze_chart(data)
+        lines.append(
+            f"- {label}: {chart_pillars(data)} / 일간 {data.day_master}({data.day_master_element}) "
+            f"/ {analysis.strength}, 용신 {analysis.useful_element}"
+        )
+    lines.append("")
+    lines.append(f"## 그룹 평균 궁합 (규칙 계산, 확정): {matrix.average}점")
+    lines.append("")
+    lines.append("## 소그룹 (규칙 계산, 확정, 괄호는 평균 궁합 점수)")
+    for cluster in matrix.clusters:
+        names = ", ".join(labels[i] for i in cluster.members)
+        cohesion = f" ({cluster.cohesion}점)" if cluster.cohesion is not None else " (단독)"
+        lines.append(f"- {names}{cohesion}")
+    lines.append("")
+    lines.append("## 궁합이 좋은 짝 (규칙 계산, 확정)")
+    lines.extend(_group_pair_line(pair, labels) for pair in matrix.best_pairs)
+    lines.append("")
+    lines.append("## 주의할 짝 (규칙 계산, 확정)")
+    lines.extend(_group_pair_line(pair, labels) for pair in matrix.worst_pairs)
     return "\n".join(lines)
+
+
+def format_career_info(info: CareerInfo | None) -> str:
+    """Format career metadata for prompt context."""
+    if info is None:
+        return "직장/경력 정보: 제공되지 않음"
+    lines = []
+    if info.current_industry:
+        lines.append(f"현재 업종: {info.current_industry}")
+    if info.current_role:
+        lines.append(f"현재 직무: {info.current_role}")
+    if info.years_at_company is not None:
+        lines.append(f"현 직장 근속 연수: {info.years_at_company}년")
+    if info.join_year is not None:
+        lines.append(f"입사 연도: {info.join_year}년")
+    if info.total_experience is not None:
+        lines.append(f"총 경력: {info.total_experience}년")
+    if info.concern_type:
+        concern_labels = {
+            "timing": "이직 타이밍",
+            "direction": "이직 방향",
+            "promotion_vs_move": "승진 vs 이직",
+            "startup": "창업",
+            "burnout": "번아웃",
+            "salary": "연봉",
+        }
+        lines.append(f"주요 고민: {concern_labels.get(info.concern_type.value, info.concern_type.value)}")
+    if info.target_period:
+        lines.append(f"희망 이직 시기: {info.target_period}")
+    return "\n".join(lines) if lines else "직장/경력 정보: 제공되지 않음"
+
+
+def format_relationship_info(info: RelationshipInfoInput | None, marriage_year: int | None = None) -> str:
+    """Format relationship metadata for prompt context."""
+    lines = []
+    if info is not None:
+        if info.dating_start_year:
+            lines.append(f"교제 시작 연도: {info.dating_start_year}년")
+        if info.dating_years is not None:
+            lines.append(f"교제 기간: {info.dating_years}년")
+        if info.target_marriage_year:
+            lines.append(f"결혼 희망 연도: {info.target_marriage_year}년")
+        if info.concern_type:
+            concern_labels = {
+                "when": "결혼 시기",
+                "readiness": "결혼 준비도",
+                "compatibility": "결혼 후 궁합",
+                "family": "양가 관계",
+                "finance": "결혼 후 재물운",
+                "children": "자녀운",
+            }
+            lines.append(f"주요 고민: {concern_labels.get(info.concern_type.value, info.concern_type.value)}")
+        if info.living_together is not None:
+            lines.append(f"동거 여부: {'예' if info.living_together else '아니오'}")
+    if marriage_year:
+        lines.append(f"결혼 예정 연도: {marriage_year}년")
+    return "\n".join(lines) if lines else "관계 정보: 제공되지 않음"
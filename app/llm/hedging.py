@@ -0,0 +1,153 @@
+"""Hedged (speculative) LLM requests under per-reading-type latency budgets.
+
+The primary model is streamed so the time to first token can be observed. If
+no token arrives within the budget, a second request is sent to the hedge
+model; whichever completes first wins and the other is cancelled.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+StreamFactory = Callable[[str], AsyncIterator[str]]
+
+
+@dataclass
+class HedgeMetrics:
+    """In-process counters for hedged requests.
+
+    Extra cost is approximated by the number of hedge requests issued and the
+    characters already received by the cancelled (losing) request.
+    """
+
+    requests: int = 0
+    hedged: int = 0
+    primary_wins: int = 0
+    hedge_wins: int = 0
+    hedge_calls_by_model: dict[str, int] = field(default_factory=dict)
+    wasted_chars_by_model: dict[str, int] = field(default_factory=dict)
+
+    def record_hedge(self, model: str) -> None:
+        self.hedged += 1
+        self.hedge_calls_by_model[model] = self.hedge_calls_by_model.get(model, 0) + 1
+
+    def record_waste(self, model: str, chars: int) -> None:
+        self.wasted_chars_by_model[model] = self.wasted_chars_by_model.get(model, 0) + chars
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "primary_wins": self.primary_wins,
+            "hedge_wins": self.hedge_wins,
+            "hedge_win_rate": self.hedge_wins / self.hedged if self.hedged else 0.0,
+            "hedge_calls_by_model": dict(self.hedge_calls_by_model),
+            "wasted_chars_by_model": dict(self.wasted_chars_by_model),
+        }
+
+
+async def _collect(
+    stream: AsyncIterator[str],
+    received: list[str],
+    first_token: asyncio.Event | None = None,
+) -> str:
+    async for text in stream:
+        if first_token is not None:
+            first_token.set()
+        received.append(text)
+    return "".join(received)
+
+
+async def _cancel(task: asyncio.Task) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        # Only the loser's own cancellation is expected; the caller's must propagate
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            raise
+    except Exception:
+        logger.warning("Cancelled LLM request failed during cleanup", exc_info=True)
+
+
+async def run_hedged(
+    open_stream: StreamFactory,
+    *,
+    primary_model: str,
+    hedge_model: str,
+    budget_seconds: float,
+    metrics: HedgeMetrics,
+) -> str:
+    """Run the primary request, hedging to hedge_model if it misses the budget.
+
+    Args:
+        open_stream: Callable returning a text stream for the given model ID.
+        primary_model: Model for the primary request.
+        hedge_model: Model for the speculative request.
+        budget_seconds: Time-to-first-token budget for the primary request.
+        metrics: Counters updated with the outcome.
+
+    Returns:
+        Text of the first request to complete successfully.
+    """
+    metrics.requests += 1
+    first_token = asyncio.Event()
+    primary_received: list[str] = []
+    hedge_received: list[str] = []
+    primary = asyncio.create_task(
+        _collect(open_stream(primary_model), primary_received, first_token)
+    )
+    tasks = [primary]
+
+    try:
+        token_wait = asyncio.create_task(first_token.wait())
+        try:
+            await asyncio.wait(
+                {primary, token_wait}, timeout=budget_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            token_wait.cancel()
+
+        if first_token.is_set() or primary.done():
+            text = await primary
+            metrics.primary_wins += 1
+            return text
+
+        logger.info(
+            "Primary model %s missed %.0fms first-token budget, hedging to %s",
+            primary_model, budget_seconds * 1000, hedge_model,
+        )
+        metrics.record_hedge(hedge_model)
+        hedge = asyncio.create_task(_collect(open_stream(hedge_model), hedge_received))
+        tasks.append(hedge)
+
+        pending: set[asyncio.Task] = {primary, hedge}
+        last_exc: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    last_exc = task.exception()
+                    continue
+                if task is primary:
+                    metrics.primary_wins += 1
+                    metrics.record_waste(hedge_model, sum(map(len, hedge_received)))
+                else:
+                    metrics.hedge_wins += 1
+                    metrics.record_waste(primary_model, sum(map(len, primary_received)))
+                return task.result()
+
+        assert last_exc is not None
+        raise last_exc
+    finally:
+        losers = [task for task in tasks if not task.done()]
+        for task in losers:
+            task.cancel()
+        for task in losers:
+            await _cancel(task)
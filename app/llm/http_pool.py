@@ -0,0 +1,172 @@
+"""Tuned httpx connection pool for the Anthropic client, with utilization metrics.
+
+Every request is timed in two phases using httpcore trace events:
+    queued   - from send until a pooled connection is assigned (pool wait,
+               plus TCP/TLS setup for a new connection)
+    upstream - from sending request headers until response headers arrive
+               (time spent waiting on the model)
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from app.config import Settings
+
+try:
+    # anthropic>=1.x is built on the httpx2 fork and rejects plain httpx objects
+    import httpx2 as httpx
+except ImportError:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# First httpcore trace events emitted once a connection has been assigned
+_CONNECTION_ASSIGNED_EVENTS = frozenset({
+    "connection.connect_tcp.started",
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+})
+_HEADERS_SENT_EVENTS = frozenset({
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+})
+
+
+@dataclass
+class PoolMetrics:
+    """In-process counters for the outbound LLM connection pool."""
+
+    max_connections: int
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    requests: int = 0
+    queued_seconds_total: float = 0.0
+    queued_seconds_max: float = 0.0
+    upstream_seconds_total: float = 0.0
+
+    def snapshot(self) -> dict:
+        count = self.requests or 1
+        return {
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "utilization": self.in_flight / self.max_connections,
+            "requests": self.requests,
+            "avg_queued_ms": self.queued_seconds_total / count * 1000,
+            "max_queued_ms": self.queued_seconds_max * 1000,
+            "avg_upstream_ms": self.upstream_seconds_total / count * 1000,
+        }
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body wrapper that releases the in-flight slot on close."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """AsyncHTTPTransport wrapper recording pool wait and upstream time."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: PoolMetrics):
+        self._transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = self.metrics
+        start = time.perf_counter()
+        marks: dict[str, float] = {}
+        inner_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name in _CONNECTION_ASSIGNED_EVENTS:
+                marks.setdefault("assigned", time.perf_counter())
+            if event_name in _HEADERS_SENT_EVENTS:
+                marks.setdefault("sent", time.perf_counter())
+            if inner_trace is not None:
+                await inner_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+
+        metrics.in_flight += 1
+        metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                metrics.in_flight -= 1
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+
+        now = time.perf_counter()
+        queued = marks.get("assigned", now) - start
+        metrics.requests += 1
+        metrics.queued_seconds_total += queued
+        metrics.queued_seconds_max = max(metrics.queued_seconds_max, queued)
+        metrics.upstream_seconds_total += now - marks.get("sent", now)
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_TrackedStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_http_client(config: Settings) -> tuple[httpx.AsyncClient, PoolMetrics]:
+    """Create the pooled httpx client used by AsyncAnthropic."""
+    http2 = config.llm_http2
+    if http2 and not _http2_available():
+        logger.warning("LLM_HTTP2 enabled but 'h2' is not installed. Falling back to HTTP/1.1.")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=config.llm_max_connections,
+        max_keepalive_connections=config.llm_max_keepalive_connections,
+        keepalive_expiry=config.llm_keepalive_expiry,
+    )
+    metrics = PoolMetrics(max_connections=config.llm_max_connections)
+    transport = InstrumentedTransport(
+        httpx.AsyncHTTPTransport(limits=limits, http2=http2),
+        metrics,
+    )
+    client = httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(
+            config.llm_timeout_seconds,
+            connect=config.llm_connect_timeout,
+            pool=config.llm_pool_timeout,
+        ),
+    )
+    return client, metrics
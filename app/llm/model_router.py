@@ -7,6 +7,7 @@ from app.config import settings
 _PREMIUM_TYPES: frozenset[str] = frozenset({
     "saju_reading",
     "compatibility",
+    "group_compatibility",
     "celebrity_compatibility",
     "situation_career_change",
     "career_transition",
@@ -19,16 +20,42 @@ _PREMIUM_TYPES: frozenset[str] = frozenset({
     "pet_compatibility",
 })
 
-# Standard tier: everything else uses Haiku
-_HAIKU_MODEL = "claude-haiku-4-5-20251001"
+
+def is_premium_type(reading_type: str) -> bool:
+    """Return True if the reading type is served by the premium model tier."""
+    return reading_type in _PREMIUM_TYPES
+
+
+# Scheduler priorities: lower value is served first
+PRIORITY_PREMIUM = 0
+PRIORITY_STANDARD = 1
+
+
+def get_priority_for_type(reading_type: str) -> int:
+    """Return the outbound queue priority for the given reading type."""
+    return PRIORITY_PREMIUM if reading_type in _PREMIUM_TYPES else PRIORITY_STANDARD
 
 
 def get_model_for_type(reading_type: str) -> str:
     """Return the appropriate model ID for the given reading type.
 
     Premium types use the configured default model (Sonnet).
-    All other types use Haiku for cost optimization.
+    All other types use the fast model (Haiku) for cost optimization.
     """
     if reading_type in _PREMIUM_TYPES:
         return settings.llm_model
-    return _HAIKU_MODEL
+    return settings.llm_fast_model
+
+
+def get_hedge_model_for_type(reading_type: str) -> str:
+    """Return the model used for hedged (speculative) requests.
+
+    Always the fast model. For standard types this duplicates the primary
+    model, which still helps when a single request is stuck in a slow replica.
+    """
+    return settings.llm_fast_model
+
+
+def get_timeout_for_type(reading_type: str) -> float:
+    """Return the request timeout in seconds for the given reading type."""
+    return settings.llm_timeouts_by_type.get(reading_type, settings.llm_timeout_seconds)
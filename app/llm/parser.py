@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
+from itertools import pairwise
 
 from app.models.response import InterpretationResponse, SectionResponse
 
@@ -18,6 +20,11 @@ _DISCLAIMER_PREFIXES = (
     "(이 해석은",
     "(본 해석은",
 )
+# Disclaimers are only searched for in this many trailing lines
+_DISCLAIMER_SEARCH_LINES = 5
+
+_SUMMARY_TITLE_RE = re.compile(r"^##\s+.+\n*")
+_NUMBERING_RE = re.compile(r"\d+\.\s*")
 
 
 def parse_interpretation(raw_text: str) -> InterpretationResponse:
@@ -34,17 +41,19 @@ def parse_interpretation(raw_text: str) -> InterpretationResponse:
 
         (disclaimer text at the end)
 
+    The text is scanned once for headers; each section is sliced exactly once
+    and the disclaimer is located by walking back over the last few lines, so
+    no intermediate line lists are built.
+
     Returns:
         InterpretationResponse with summary, sections, and disclaimer.
     """
-    raw_text = raw_text.strip()
-
-    # Split by ### headers
-    headers = list(_SECTION_HEADER_RE.finditer(raw_text))
+    text = raw_text.strip()
+    headers = _scan_headers(text)
 
     if not headers:
         # No sections found - return entire text as summary
-        summary, disclaimer = _extract_disclaimer(raw_text)
+        summary, disclaimer = _extract_disclaimer(text)
         return InterpretationResponse(
             summary=summary.strip(),
             sections=[],
@@ -52,71 +61,124 @@ def parse_interpretation(raw_text: str) -> InterpretationResponse:
         )
 
     # Everything before first ### is summary
-    summary_text = raw_text[: headers[0].start()].strip()
-    # Clean summary: remove leading ## header if present
-    summary_text = re.sub(r"^##\s+.+\n*", "", summary_text).strip()
-
-    # Parse sections
-    sections: list[SectionResponse] = []
-    for i, header in enumerate(headers):
-        title = header.group(1).strip()
-        start = header.end()
-        end = headers[i + 1].start() if i + 1 < len(headers) else len(raw_text)
-        content = raw_text[start:end].strip()
-        sections.append(SectionResponse(title=title, content=content))
-
-    # Extract disclaimer from last section's content
-    disclaimer: str | None = None
-    if sections:
-        last_content = sections[-1].content
-        cleaned, found_disclaimer = _extract_disclaimer(last_content)
-        if found_disclaimer:
-            sections = [
-                *sections[:-1],
-                SectionResponse(title=sections[-1].title, content=cleaned.strip()),
-            ]
-            disclaimer = found_disclaimer
-
-    # If no disclaimer found in sections, check if summary_text is empty
-    # and disclaimer might be standalone
-    if not disclaimer and not sections:
-        summary_text, disclaimer = _extract_disclaimer(summary_text)
+    summary_text = text[: headers[0][0]].strip()
+    if summary_text.startswith("##"):
+        # Clean summary: remove leading ## header if present
+        summary_text = _SUMMARY_TITLE_RE.sub("", summary_text, count=1).strip()
+
+    contents = [
+        text[body_start:next_start].strip()
+        for (_, body_start, _), (next_start, _, _) in pairwise(headers)
+    ]
+    last_content, disclaimer = _extract_disclaimer(text[headers[-1][1]:].strip())
+    contents.append(last_content.strip() if disclaimer else last_content)
 
     # If summary is empty, use first section's first sentence
-    if not summary_text and sections:
-        first_sentence = _first_sentence(sections[0].content)
-        summary_text = first_sentence
+    if not summary_text:
+        summary_text = _first_sentence(contents[0])
 
     return InterpretationResponse(
         summary=summary_text.strip(),
-        sections=sections,
+        sections=[
+            SectionResponse(title=title, content=content)
+            for (_, _, title), content in zip(headers, contents)
+        ],
         disclaimer=disclaimer,
     )
 
 
+def _scan_headers(text: str) -> list[tuple[int, int, str]]:
+    """Find ### section headers as (line_start, title_line_end, title).
+
+    Equivalent to iterating _SECTION_HEADER_RE.finditer(text) on stripped text,
+    but only inspects lines that actually start with ###.
+    """
+    headers: list[tuple[int, int, str]] = []
+    n = len(text)
+    pos = text.find("###")
+    while pos != -1:
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            line_end = n
+        title = None
+        if pos == 0 or text[pos - 1] == "\n":
+            rest = text[pos + 3:line_end]
+            if rest[:1].isspace():
+                title = rest.lstrip()
+                numbering = _NUMBERING_RE.match(title)
+                if numbering:
+                    # An empty remainder sends the numbering to the slow path
+                    title = title[numbering.end():]
+            elif not rest and line_end < n:
+                title = ""
+        if title is None:
+            # Only line starts can hold a header; resume on the next line
+            pos = text.find("###", line_end + 1) if line_end < n else -1
+            continue
+        if not title:
+            # Nothing left on this line: the title is on a following line
+            title_start = _header_title_start(text, pos + 3, n)
+            if title_start == -1:
+                pos = text.find("###", line_end + 1) if line_end < n else -1
+                continue
+            line_end = text.find("\n", title_start)
+            if line_end == -1:
+                line_end = n
+            title = text[title_start:line_end]
+        headers.append((pos, line_end, title.strip()))
+        pos = text.find("###", line_end)
+    return headers
+
+
+def _header_title_start(text: str, i: int, n: int) -> int:
+    """Return where a header title starts after '###' at index i, or -1.
+
+    Slow path for headers whose title does not follow on the same line.
+    """
+    # \s+ after the hashes (may run onto following lines, like the regex)
+    if i >= n or not text[i].isspace():
+        return -1
+    while i < n and text[i].isspace():
+        i += 1
+    if i == n:
+        return -1
+    # Optional "N." numbering, skipped only when a title follows it
+    j = i
+    while j < n and text[j].isdecimal():
+        j += 1
+    if j > i and j < n and text[j] == ".":
+        j += 1
+        while j < n and text[j].isspace():
+            j += 1
+        if j < n:
+            return j
+    return i
+
+
 def _extract_disclaimer(text: str) -> tuple[str, str | None]:
     """Extract disclaimer from the end of text.
 
+    Only the last five lines are inspected, walking backwards from the end.
+
     Returns (text_without_disclaimer, disclaimer_or_none).
     """
-    lines = text.strip().split("\n")
+    stripped_text = text.strip()
 
     # Search from the end for disclaimer
-    disclaimer_start = -1
-    for i in range(len(lines) - 1, max(len(lines) - 6, -1), -1):
-        stripped = lines[i].strip().lstrip("(").lstrip("*").lstrip("_")
-        if any(stripped.startswith(prefix) for prefix in _DISCLAIMER_PREFIXES):
-            disclaimer_start = i
+    line_end = len(stripped_text)
+    for _ in range(_DISCLAIMER_SEARCH_LINES):
+        line_start = stripped_text.rfind("\n", 0, line_end) + 1
+        line = stripped_text[line_start:line_end].strip().lstrip("(").lstrip("*").lstrip("_")
+        if line.startswith(_DISCLAIMER_PREFIXES):
+            disclaimer = stripped_text[line_start:].strip()
+            # Clean markdown formatting from disclaimer
+            disclaimer = disclaimer.strip("()").strip("*").strip("_").strip()
+            return stripped_text[:line_start].strip(), disclaimer
+        if line_start == 0:
             break
+        line_end = line_start - 1
 
-    if disclaimer_start == -1:
-        return text, None
-
-    disclaimer = "\n".join(lines[disclaimer_start:]).strip()
-    # Clean markdown formatting from disclaimer
-    disclaimer = disclaimer.strip("()").strip("*").strip("_").strip()
-    remaining = "\n".join(lines[:disclaimer_start]).strip()
-    return remaining, disclaimer
+    return text, None
 
 
 def _first_sentence(text: str) -> str:
@@ -133,3 +195,230 @@ def _first_sentence(text: str) -> str:
 
     # Fallback: first 100 chars
     return clean[:100].strip() if len(clean) > 100 else clean.strip()
+
+
+# --- Incremental parsing for SSE streams ---
+
+_HEADER_MARK = "###"
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """Structured SSE event produced by StreamingInterpretationParser."""
+
+    event: str  # summary | section_start | section_delta | disclaimer
+    data: dict
+
+
+def _strip_disclaimer_marks(line: str) -> str:
+    return line.strip().lstrip("(").lstrip("*").lstrip("_")
+
+
+class StreamingInterpretationParser:
+    """Incremental counterpart of parse_interpretation for streamed output.
+
+    Feed raw LLM chunks with ``feed()`` and call ``close()`` at the end. Events:
+        summary        {"text"}            - once the first ### header is seen
+        section_start  {"index", "title"}  - at every ### header
+        section_delta  {"index", "text"}   - section body text as it arrives
+        disclaimer     {"text"}            - at close, if the output ends in one
+
+    Body text is forwarded as soon as a line can no longer be a header or a
+    disclaimer, so only a few characters per line are ever buffered. Lines
+    that look like a disclaimer are held until close (or until it is clear
+    they were not the closing disclaimer). Total work is linear in the text.
+    """
+
+    def __init__(self) -> None:
+        self._section = -1  # -1 while still in the summary
+        self._summary_parts: list[str] = []
+        self._summary_pending = False  # summary deferred to first section's sentence
+        self._first_section_parts: list[str] = []
+        self._line = ""  # buffered start of an undecided line
+        self._mode: str | None = None  # None | content | header | held
+        self._held: list[str] = []
+        self._blank_lines = 0
+        self._section_has_text = False
+        self._line_open = False  # last emitted text ended mid-line
+        self._started = False
+
+    def feed(self, chunk: str) -> list[StreamEvent]:
+        events: list[StreamEvent] = []
+        start = 0
+        while True:
+            end = chunk.find("\n", start)
+            if end == -1:
+                self._feed_partial(chunk[start:], events)
+                return events
+            self._feed_partial(chunk[start:end], events)
+            self._end_line(events)
+            start = end + 1
+
+    def close(self) -> list[StreamEvent]:
+        events: list[StreamEvent] = []
+        if self._line or self._mode is not None:
+            self._end_line(events)
+
+        if self._section < 0:
+            summary, disclaimer = _extract_disclaimer("".join(self._summary_parts).strip())
+            events.append(StreamEvent("summary", {"text": summary.strip()}))
+            if disclaimer:
+                events.append(StreamEvent("disclaimer", {"text": disclaimer}))
+            return events
+
+        disclaimer = None
+        held = "\n".join(self._held).strip()
+        if held and held.count("\n") < _DISCLAIMER_SEARCH_LINES:
+            disclaimer = held.strip("()").strip("*").strip("_").strip()
+        elif held:
+            self._emit_text(held, events)
+            self._held = []
+
+        if self._summary_pending:
+            self._emit_deferred_summary(events)
+        if disclaimer:
+            events.append(StreamEvent("disclaimer", {"text": disclaimer}))
+        return events
+
+    # -- line handling --
+
+    def _feed_partial(self, text: str, events: list[StreamEvent]) -> None:
+        if not text:
+            return
+        if self._section < 0:
+            self._summary_feed(text, events)
+            return
+        streaming = not self._held  # lines after a held disclaimer are held too
+        if self._mode == "content" and streaming:
+            self._emit_text(text, events)
+            return
+        self._line += text
+        if self._mode is None:
+            self._mode = self._classify(self._line)
+            if self._mode == "content" and streaming:
+                line, self._line = self._line, ""
+                self._emit_text(line, events)
+
+    def _summary_feed(self, text: str, events: list[StreamEvent]) -> None:
+        if not self._started:
+            # Like parse_interpretation, ignore whitespace before the first text
+            text = text.lstrip()
+            if not text:
+                return
+            self._started = True
+        if self._mode == "content":
+            self._summary_parts.append(text)
+            return
+        self._line += text
+        if self._mode is None:
+            mode = self._classify(self._line)
+            if mode is not None and mode != "header":
+                mode = "content"
+                self._summary_parts.append(self._line)
+                self._line = ""
+            self._mode = mode
+
+    def _classify(self, line: str) -> str | None:
+        """Decide what a line is from its start, or None if still ambiguous."""
+        if line.startswith(_HEADER_MARK):
+            if len(line) == len(_HEADER_MARK):
+                return None
+            return "header" if line[len(_HEADER_MARK)].isspace() else "content"
+        if _HEADER_MARK.startswith(line):
+            return None
+        if self._section < 0:
+            return "content"
+        marker = _strip_disclaimer_marks(line)
+        if not marker:
+            return None
+        if marker.startswith(_DISCLAIMER_PREFIXES):
+            return "held"
+        if any(p.startswith(marker) for p in _DISCLAIMER_PREFIXES):
+            return None
+        return "content"
+
+    def _end_line(self, events: list[StreamEvent]) -> None:
+        line, mode = self._line, self._mode
+        self._line, self._mode = "", None
+
+        if mode == "header" or (mode is None and line.startswith(_HEADER_MARK)):
+            match = _SECTION_HEADER_RE.match(line)
+            if match:
+                self._start_section(match.group(1).strip(), events)
+                return
+
+        if self._section < 0:
+            if self._started:
+                self._summary_parts.append(line + "\n")
+            return
+
+        if mode == "content" and not self._held:
+            self._line_open = False
+            return
+        if mode == "held" or self._held:
+            if mode == "held" and self._held:
+                # A later disclaimer-like line supersedes the earlier one
+                self._flush_held(events)
+            self._held.append(line)
+            if len(self._held) > _DISCLAIMER_SEARCH_LINES and line.strip():
+                self._flush_held(events)
+            return
+        if not line.strip():
+            self._blank_lines += 1
+            return
+        self._emit_text(line, events)
+        self._blank_lines = 0
+        self._line_open = False
+
+    def _start_section(self, title: str, events: list[StreamEvent]) -> None:
+        if self._section < 0:
+            summary = "".join(self._summary_parts).strip()
+            summary = re.sub(r"^##\s+.+\n*", "", summary).strip()
+            self._summary_parts = []
+            if summary:
+                events.append(StreamEvent("summary", {"text": summary}))
+            else:
+                self._summary_pending = True
+        else:
+            self._flush_held(events)
+            if self._section == 0 and self._summary_pending:
+                self._emit_deferred_summary(events)
+
+        self._section += 1
+        self._section_has_text = False
+        self._line_open = False
+        self._blank_lines = 0
+        events.append(StreamEvent("section_start", {"index": self._section, "title": title}))
+
+    def _flush_held(self, events: list[StreamEvent]) -> None:
+        """Release held lines as body text once they cannot be the disclaimer."""
+        if self._held:
+            held, self._held = self._held, []
+            trailing_blanks = 0
+            while not held[-1].strip():
+                held.pop()
+                trailing_blanks += 1
+            self._emit_text("\n".join(held), events)
+            self._line_open = False
+            self._blank_lines = trailing_blanks
+
+    def _emit_text(self, text: str, events: list[StreamEvent]) -> None:
+        """Emit body text, inserting line breaks swallowed while deciding lines."""
+        if not self._section_has_text:
+            text = text.lstrip()
+            if not text:
+                return
+            self._section_has_text = True
+            self._blank_lines = 0
+        elif not self._line_open:
+            text = "\n" * (1 + self._blank_lines) + text
+            self._blank_lines = 0
+        self._line_open = True
+        if self._section == 0:
+            self._first_section_parts.append(text)
+        events.append(StreamEvent("section_delta", {"index": self._section, "text": text}))
+
+    def _emit_deferred_summary(self, events: list[StreamEvent]) -> None:
+        self._summary_pending = False
+        content = "".join(self._first_section_parts).strip()
+        events.append(StreamEvent("summary", {"text": _first_sentence(content)}))
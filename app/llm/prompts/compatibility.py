@@ -28,3 +28,26 @@ COMPATIBILITY_PROMPT = """아래 두 사람의 사주 데이터를 분석하여
 - 궁합의 강점 요약
 - 건강한 관계를 위한 핵심 조언
 """
+
+GROUP_COMPATIBILITY_PROMPT = """아래는 {member_count}명으로 이루어진 그룹(팀, 가족 등)의 사주 요약과 규칙 계산으로 구한 궁합 결과입니다.
+궁합 점수와 그룹 구성은 확정된 값이므로 다시 계산하지 말고, 이를 바탕으로 그룹 전체의 궁합 해석을 제공해주세요.
+
+{group_data}
+
+## 요청 해석 항목
+
+### 1. 그룹 궁합 개요
+- 그룹 전체의 오행 구성과 조화도
+- 평균 궁합 점수에서 드러나는 분위기
+
+### 2. 소그룹 분석
+- 잘 어울리는 소그룹과 그 이유
+- 소그룹 사이를 이어줄 수 있는 구성원
+
+### 3. 잘 맞는 짝과 주의할 짝
+- 궁합이 좋은 짝의 시너지
+- 충돌이 예상되는 짝과 완충 방법
+
+### 4. 그룹 운영 조언
+- 역할 분담, 소통 방식 등 그룹이 조화롭게 지내기 위한 실용적 조언
+"""
@@ -131,18 +131,23 @@ MARRIAGE_AUSPICIOUS_DATES_PROMPT = """아래 두 사람의 사주 데이터를 
 ## 대상 기간
 {target_period}
 
+## 후보 길일 (규칙 계산, 점수순)
+{candidate_dates}
+
+후보 길일은 두 사람의 일지·띠·일간과 용신, 월파, 손 없는 날을 규칙으로 계산한 결과입니다. 날짜를 새로 고르거나 점수를 다시 매기지 말고, 상위 날짜를 골라 이유를 풀어 설명해주세요.
+
 ## 해석 시 주의사항
 - 이 분석은 사주 역학 기반 참고 정보입니다.
 - 정확한 택일이 필요하면 전문 역술인 상담을 권장하세요.
 
 ## 요청 해석 항목
 
-### 1. 두 사람 사주 기반 길월 분석
-- 대상 기간 중 결혼에 좋은 달 TOP 3과 이유
-- 피해야 할 달과 이유
+### 1. 추천 길일 TOP 3
+- 후보 길일 상위 3개 날짜와 각 날짜가 두 사람에게 좋은 이유
+- 후보 중 한 사람에게만 유리한 날이 있다면 그 점
 
-### 2. 월별 길일 경향
-- 좋은 달 내에서의 길일 특성 (간지 기반)
+### 2. 길일 경향
+- 후보 길일에 공통으로 나타나는 간지 특성
 - 시간대 참고 (오전/오후 추천)
 
 ### 3. 택일 참고 사항
@@ -100,19 +100,24 @@ SINSAL_READING_PROMPT = """아래 사주 데이터를 분석하여 신살(神殺
 ## 사주 데이터
 {saju_data}
 
+## 신살 목록 (확정)
+{sinsal_data}
+
+신살 목록은 규칙으로 계산된 결과입니다. 목록에 없는 신살을 추가하거나 빼지 말고 그 의미를 풀어 설명해주세요.
+
 ## 요청 해석 항목
 다음 항목을 순서대로 해석해주세요:
 
 ### 1. 주요 길신(吉神) 분석
-- 천을귀인, 문창귀인, 천덕귀인 등 사주 내 길신 확인
+- 목록의 길신(천을귀인, 문창귀인, 천덕귀인 등) 해석
 - 각 길신의 의미와 발현 조건
 
 ### 2. 주요 흉신(凶神) 분석
-- 양인, 공망, 원진 등 사주 내 흉신 확인
+- 목록의 흉신(양인, 공망, 원진 등) 해석
 - 흉신의 영향과 대처 방향 (불필요한 공포 조성 없이)
 
 ### 3. 특수 신살
-- 도화살, 역마살, 화개살 등 특수 신살 분석
+- 목록의 특수 신살(도화, 역마, 화개 등) 해석
 - 현대적 관점에서의 재해석
 
 ### 4. 신살의 대운별 영향
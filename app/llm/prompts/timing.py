@@ -34,6 +34,8 @@ TIMING_BEST_HOURS_PROMPT = """아래 사주 데이터와 오늘의 12시진 정
 ## 오늘의 시진 정보
 {target_time}
 
+시진 점수는 사주의 일지·일간·용신, 시간 천간의 십신, 오늘 일진과의 합충을 규칙으로 계산한 결과입니다. 점수와 순위를 다시 매기지 말고 근거를 풀어 설명해주세요.
+
 ## 요청 해석 항목
 다음 항목을 순서대로 해석해주세요:
 
@@ -43,12 +45,11 @@ TIMING_BEST_HOURS_PROMPT = """아래 사주 데이터와 오늘의 12시진 정
 
 ### 2. 시진별 운세 (12시진)
 각 시진에 대해 간결하게 분석:
-- 길시(좋은 시간대) 표시
-- 흉시(주의 시간대) 표시
+- 점수가 높은 시진은 길시, 낮은 시진은 흉시로 표시
 - 각 시간대에 적합한 활동
 
 ### 3. 오늘의 황금 시간
-- 가장 좋은 시간대 TOP 3
+- 점수 상위 3개 시간대
 - 각 시간대에 추천하는 활동
 
 ### 4. 주의 시간대
@@ -72,8 +73,8 @@ TIMING_DDAY_PROMPT = """아래 사주 데이터와 D-day 날짜 정보를 분석
 다음 항목을 순서대로 해석해주세요:
 
 ### 1. D-day 종합 운세
-- 해당 날의 일간지와 사주 일간의 관계
-- 이 날의 전반적 에너지와 길흉
+- 택일 점수와 근거를 바탕으로 이 날의 전반적 에너지와 길흉 (점수는 다시 계산하지 않음)
+- 점수가 더 높은 대안 날짜가 있으면 간단히 언급
 
 ### 2. 주요 운세 분석
 - 시험/면접이라면: 학업운, 집중력, 표현력
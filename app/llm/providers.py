@@ -0,0 +1,230 @@
+"""LLM provider backends used by LLMClient.
+
+A provider turns (model, system prompt, user prompt) into text, either all at
+once or as a stream of chunks. LLMClient owns model routing, language handling
+and error wrapping; providers only talk to a backend.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+from collections.abc import AsyncIterator
+from typing import Protocol
+
+from anthropic import APIConnectionError, APIStatusError, AsyncAnthropic
+
+from app.llm.http_pool import PoolMetrics
+
+
+class LLMProvider(Protocol):
+    """Backend interface for text generation."""
+
+    name: str
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Return True if the error is transient and worth retrying."""
+        ...
+
+    async def create(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float | None = None,
+    ) -> str:
+        """Return the complete response text."""
+        ...
+
+    def stream(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield response text chunks as they are produced."""
+        ...
+
+
+# Transient HTTP statuses (529 = Anthropic overloaded)
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+def _system_blocks(system_prompt: str) -> list[dict]:
+    return [
+        {
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+class AnthropicProvider:
+    """Provider backed by the Anthropic Messages API."""
+
+    name = "anthropic"
+
+    def __init__(self, client: AsyncAnthropic, pool_metrics: PoolMetrics | None = None):
+        self._client = client
+        self.pool_metrics = pool_metrics
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        return self._client
+
+    async def aclose(self) -> None:
+        await self._client.close()
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        # APITimeoutError is a subclass of APIConnectionError
+        if isinstance(exc, APIConnectionError):
+            return True
+        return isinstance(exc, APIStatusError) and exc.status_code in _RETRYABLE_STATUS_CODES
+
+    async def create(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float | None = None,
+    ) -> str:
+        response = await self._client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=_system_blocks(system_prompt),
+            timeout=timeout,
+            messages=[{"role": "user", "content": user_prompt}],
+        )
+        return response.content[0].text
+
+    async def stream(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float | None = None,
+    ) -> AsyncIterator[str]:
+        async with self._client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=_system_blocks(system_prompt),
+            timeout=timeout,
+            messages=[{"role": "user", "content": user_prompt}],
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+
+class FakeProviderError(Exception):
+    """Simulated backend failure raised by FakeProvider."""
+
+
+_FAKE_SECTION_TITLES = (
+    "타고난 기질과 성격",
+    "재물운과 직업운",
+    "연애운과 대인관계",
+    "건강과 생활 조언",
+)
+
+_FAKE_SENTENCE = "오행의 흐름이 안정적으로 이어지며 차분하게 기회를 살피는 것이 좋습니다."
+
+
+class FakeProvider:
+    """Deterministic local provider for offline load testing.
+
+    Simulates a time-to-first-token delay, a steady tokens-per-second output
+    rate and a random error rate. The response text depends only on the model
+    and prompt, and the error sequence only on ``seed``, so runs are
+    reproducible.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        *,
+        latency_ms: float = 200.0,
+        tokens_per_second: float = 50.0,
+        error_rate: float = 0.0,
+        output_tokens: int = 300,
+        seed: int = 0,
+    ):
+        self._latency = max(latency_ms, 0.0) / 1000
+        self._token_delay = 1 / tokens_per_second if tokens_per_second > 0 else 0.0
+        self._error_rate = error_rate
+        self._output_tokens = output_tokens
+        self._rng = random.Random(seed)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        return isinstance(exc, FakeProviderError)
+
+    def _maybe_fail(self) -> None:
+        if self._error_rate > 0 and self._rng.random() < self._error_rate:
+            raise FakeProviderError("Simulated provider failure")
+
+    def _tokens(self, model: str, user_prompt: str, max_tokens: int) -> list[str]:
+        """Build the response as a list of whitespace-delimited tokens."""
+        digest = hashlib.sha256(f"{model}\n{user_prompt}".encode()).hexdigest()[:8]
+        words = _FAKE_SENTENCE.split(" ")
+        limit = min(self._output_tokens, max_tokens)
+
+        tokens: list[str] = [f"[{digest}] ", *(w + " " for w in words)]
+        tokens[-1] = tokens[-1].rstrip() + "\n\n"
+        section = 0
+        while len(tokens) < limit:
+            title = _FAKE_SECTION_TITLES[section % len(_FAKE_SECTION_TITLES)]
+            tokens.append(f"### {section + 1}. {title}\n")
+            tokens.extend(w + " " for w in words)
+            tokens[-1] = tokens[-1].rstrip() + "\n\n"
+            section += 1
+        tokens.append("본 분석은 전통 역학에 기반한 참고 정보입니다.")
+        return tokens
+
+    async def create(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float | None = None,
+    ) -> str:
+        self._maybe_fail()
+        tokens = self._tokens(model, user_prompt, max_tokens)
+        await asyncio.sleep(self._latency + self._token_delay * len(tokens))
+        return "".join(tokens)
+
+    async def stream(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float | None = None,
+    ) -> AsyncIterator[str]:
+        self._maybe_fail()
+        tokens = self._tokens(model, user_prompt, max_tokens)
+        await asyncio.sleep(self._latency)
+        for token in tokens:
+            yield token
+            if self._token_delay:
+                await asyncio.sleep(self._token_delay)
@@ -0,0 +1,115 @@
+"""Per-model concurrency limiting with priority queueing for outbound LLM calls.
+
+Each model gets a fixed number of concurrent slots. When all slots are busy,
+callers wait in a priority queue (premium reading types first, FIFO within a
+priority) and fail fast with LLMOverloadedError once their queue deadline
+passes.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from app.config import settings
+from app.llm.model_router import get_priority_for_type
+from app.middleware.error_handler import LLMOverloadedError
+
+
+@dataclass
+class _ModelSlots:
+    limit: int
+    active: int = 0
+    waiters: list[tuple[int, int, asyncio.Future]] = field(default_factory=list)
+    rejected: int = 0
+
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, fut in self.waiters if not fut.done())
+
+    def release(self) -> None:
+        # Hand the slot straight to the best live waiter, skipping timed-out ones
+        while self.waiters:
+            _, _, fut = heapq.heappop(self.waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self.active -= 1
+
+
+class LLMScheduler:
+    """Async semaphore-style scheduler with per-model limits and priorities."""
+
+    def __init__(
+        self,
+        *,
+        default_limit: int,
+        limits_by_model: dict[str, int] | None = None,
+        queue_timeout: float,
+    ):
+        self._default_limit = default_limit
+        self._limits_by_model = limits_by_model or {}
+        self._queue_timeout = queue_timeout
+        self._slots: dict[str, _ModelSlots] = {}
+        self._counter = itertools.count()
+
+    @classmethod
+    def from_settings(cls) -> LLMScheduler:
+        return cls(
+            default_limit=settings.llm_concurrency_default,
+            limits_by_model=settings.llm_concurrency_by_model,
+            queue_timeout=settings.llm_queue_timeout_seconds,
+        )
+
+    def _slots_for(self, model: str) -> _ModelSlots:
+        slots = self._slots.get(model)
+        if slots is None:
+            slots = _ModelSlots(limit=self._limits_by_model.get(model, self._default_limit))
+            self._slots[model] = slots
+        return slots
+
+    async def _acquire(self, slots: _ModelSlots, priority: int, model: str) -> None:
+        if slots.active < slots.limit and not slots.queue_depth():
+            slots.active += 1
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(slots.waiters, (priority, next(self._counter), fut))
+        try:
+            done, _ = await asyncio.wait({fut}, timeout=self._queue_timeout)
+        except asyncio.CancelledError:
+            if fut.done():
+                slots.release()
+            else:
+                fut.cancel()
+            raise
+
+        if not done:
+            fut.cancel()
+            slots.rejected += 1
+            raise LLMOverloadedError(
+                f"LLM queue for {model} exceeded {self._queue_timeout:.1f}s deadline"
+            )
+
+    @asynccontextmanager
+    async def slot(self, model: str, reading_type: str) -> AsyncIterator[None]:
+        """Hold one concurrency slot for `model` for the duration of the block."""
+        slots = self._slots_for(model)
+        await self._acquire(slots, get_priority_for_type(reading_type), model)
+        try:
+            yield
+        finally:
+            slots.release()
+
+    def snapshot(self) -> dict:
+        return {
+            model: {
+                "limit": slots.limit,
+                "active": slots.active,
+                "queued": slots.queue_depth(),
+                "rejected": slots.rejected,
+            }
+            for model, slots in self._slots.items()
+        }
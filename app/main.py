@@ -13,8 +13,21 @@ from app.middleware.error_handler import (
     saju_error_handler,
 )
 from app.middleware.rate_limiter import RateLimiterMiddleware
+from app.middleware.request_scope import RequestScopeMiddleware
 from app.middleware.token_validator import TokenValidatorMiddleware
-from app.routers import career, celebrity, compatibility, fortune, health, marriage, pet, relationship, saju, timing
+from app.routers import (
+    bundle,
+    career,
+    celebrity,
+    compatibility,
+    fortune,
+    health,
+    marriage,
+    pet,
+    relationship,
+    saju,
+    timing,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -37,7 +50,8 @@ app = FastAPI(
 )
 
 # Middleware (last added = first to execute)
-# Execution order: TokenValidator -> RateLimiter -> CORS -> route handler
+# Execution order: TokenValidator -> RateLimiter -> CORS -> RequestScope -> route handler
+app.add_middleware(RequestScopeMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -63,3 +77,4 @@ app.include_router(timing.router)
 app.include_router(pet.router)
 app.include_router(career.router)
 app.include_router(marriage.router)
+app.include_router(bundle.router)
@@ -24,11 +24,27 @@ class LeapMonthError(SajuError):
         super().__init__(message, status_code=422)
 
 
+class InvalidBundleError(SajuError):
+    def __init__(self, message: str = "Invalid reading bundle"):
+        super().__init__(message, status_code=422)
+
+
 class LLMError(SajuError):
     def __init__(self, message: str = "LLM interpretation failed"):
         super().__init__(message, status_code=502)
 
 
+class LLMOverloadedError(LLMError):
+    def __init__(self, message: str = "LLM capacity exhausted, try again later"):
+        SajuError.__init__(self, message, status_code=503)
+
+
+class CircuitOpenError(SajuError):
+    def __init__(self, dependency: str):
+        super().__init__(f"{dependency} is temporarily unavailable", status_code=503)
+        self.dependency = dependency
+
+
 async def saju_error_handler(_request: Request, exc: SajuError) -> JSONResponse:
     return JSONResponse(
         status_code=exc.status_code,
@@ -1,6 +1,7 @@
 """Per-user rate limiting middleware using Redis."""
 from __future__ import annotations
 
+import json
 import logging
 import time
 from typing import Callable
@@ -19,6 +20,22 @@ _SKIP_PATHS: frozenset[str] = frozenset({"/health"})
 _DEFAULT_LIMIT = 30
 _WINDOW_SECONDS = 60
 
+# Starts one LLM generation per requested reading type
+_BUNDLE_PATH = "/api/v1/bundle/readings"
+
+
+async def _request_cost(request: Request) -> int:
+    """Rate limit units a request uses: one per distinct reading of a bundle, else one."""
+    if request.method != "POST" or request.url.path != _BUNDLE_PATH:
+        return 1
+    try:
+        reading_types = json.loads(await request.body())["reading_types"]
+    except (ValueError, KeyError, TypeError):
+        return 1  # the route rejects the body
+    if not isinstance(reading_types, list):
+        return 1
+    return max(1, len({t for t in reading_types if isinstance(t, str)}))
+
 
 class RateLimiterMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: ASGIApp) -> None:
@@ -59,9 +76,11 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
         current_minute = int(time.time()) // _WINDOW_SECONDS
         rate_key = f"rate:{user_id}:{current_minute}"
 
+        cost = await _request_cost(request)
+
         try:
-            current_count = await redis.incr(rate_key)
-            if current_count == 1:
+            current_count = await redis.incrby(rate_key, cost)
+            if current_count == cost:
                 await redis.expire(rate_key, _WINDOW_SECONDS)
 
             if current_count > _DEFAULT_LIMIT:
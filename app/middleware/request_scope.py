@@ -0,0 +1,19 @@
+"""Opens a request_scope (see app.services.request_memo) around each HTTP request."""
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.services.request_memo import request_scope
+
+
+class RequestScopeMiddleware:
+    # Plain ASGI middleware, so streamed response bodies run inside the scope too
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_scope():
+            await self.app(scope, receive, send)
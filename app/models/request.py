@@ -47,6 +47,10 @@ class SajuCalculateRequest(BaseModel):
 class SajuReadingRequest(BaseModel):
     birth: BirthInput
     stream: bool = Field(False, description="Enable SSE streaming")
+    structured_stream: bool = Field(
+        False,
+        description="With stream, emit parsed summary/section/disclaimer events instead of raw text chunks",
+    )
     language: str = Field("ko", description="Response language (e.g. 'ko', 'en', 'ja', 'English')")
     counselor_id: str | None = Field(None, description="Virtual counselor ID (e.g. 'master-yoon')")
     custom_system_prompt: str | None = Field(None, description="Custom system prompt from admin DB (overrides default)")
@@ -55,6 +59,7 @@ class SajuReadingRequest(BaseModel):
 class SinsalRequest(BaseModel):
     birth: BirthInput
     language: str = Field("ko", description="Response language (e.g. 'ko', 'en', 'ja', 'English')")
+    interpret: bool = Field(True, description="False returns the computed sinsal list without an LLM call")
 
 
 class CompatibilityRequest(BaseModel):
@@ -63,6 +68,17 @@ class CompatibilityRequest(BaseModel):
     language: str = Field("ko", description="Response language (e.g. 'ko', 'en', 'ja', 'English')")
 
 
+class GroupMember(BaseModel):
+    label: str | None = Field(None, max_length=40, description="Display name (default: '사람 N')")
+    birth: BirthInput
+
+
+class GroupCompatibilityRequest(BaseModel):
+    members: list[GroupMember] = Field(..., min_length=2, max_length=50)
+    interpret: bool = Field(False, description="Also generate an LLM narrative of the group summary")
+    language: str = Field("ko", description="Response language (e.g. 'ko', 'en', 'ja', 'English')")
+
+
 class FortuneRequest(BaseModel):
     birth: BirthInput
     target_year: int | None = None
@@ -77,6 +93,12 @@ class CelebrityCompatibilityRequest(BaseModel):
     language: str = Field("ko", description="Response language (e.g. 'ko', 'en', 'ja', 'English')")
 
 
+class CelebrityBestMatchRequest(BaseModel):
+    birth: BirthInput
+    limit: int = Field(10, ge=1, le=50, description="Number of celebrities to return")
+    gender: Gender | None = Field(None, description="Only rank celebrities of this gender")
+
+
 class RelationshipReadingRequest(BaseModel):
     target_birth: BirthInput
     relationship_type: RelationshipType
@@ -98,6 +120,10 @@ class TimingRequest(BaseModel):
     language: str = Field("ko", description="Response language (e.g. 'ko', 'en', 'ja', 'English')")
 
 
+class BestHoursRequest(TimingRequest):
+    interpret: bool = Field(True, description="False returns the computed hour scores without an LLM call")
+
+
 # --- Pet fortune ---
 
 class PetBirthInput(BaseModel):
@@ -207,4 +233,21 @@ class MarriageAuspiciousDatesRequest(BaseModel):
     person2: BirthInput
     target_year: int | None = None
     target_months: list[int] | None = Field(None, description="Specific months to analyze")
+    candidate_count: int = Field(10, ge=1, le=30, description="Number of rule-ranked candidate dates")
     language: str = Field("ko", description="Response language")
+
+
+# --- Reading bundle ---
+
+class ReadingBundleRequest(BaseModel):
+    birth: BirthInput
+    reading_types: list[str] = Field(
+        ..., min_length=1, max_length=8,
+        description="Reading types to generate (e.g. ['saju_reading', 'monthly', 'career_transition'])",
+    )
+    partner: BirthInput | None = Field(None, description="Partner birth input, required for marriage_timing")
+    career_info: CareerInfo | None = None
+    relationship_info: RelationshipInfoInput | None = None
+    target_year: int | None = Field(None, description="Monthly fortune / luck timeline start year (default: now)")
+    target_month: int | None = Field(None, ge=1, le=12, description="Start month (default: now)")
+    language: str = Field("ko", description="Response language (e.g. 'ko', 'en', 'ja', 'English')")
@@ -64,10 +64,24 @@ class SajuReadingResponse(BaseModel):
     interpretation: InterpretationResponse
 
 
+class SinsalItem(BaseModel):
+    name: str  # e.g. 천을귀인
+    kind: str  # 길신 / 흉신 / 특수
+    positions: list[str]  # e.g. ["연지", "시지"]
+    basis: str  # character it is read from, e.g. "일간 甲"
+
+
+class SinsalResponse(BaseModel):
+    calculation: SajuCalculateResponse
+    sinsal: list[SinsalItem]
+    interpretation: InterpretationResponse | None = None  # None when interpret is false
+
+
 class CompatibilityResponse(BaseModel):
-    person1: SajuCalculateResponse
-    person2: SajuCalculateResponse
+    person1: SajuCalculateResponse  # 사람 1 of the interpretation
+    person2: SajuCalculateResponse  # 사람 2 of the interpretation
     interpretation: InterpretationResponse
+    persons_swapped: bool = False  # person1/person2 are the request's person2/person1
 
 
 class FortuneResponse(BaseModel):
@@ -76,9 +90,15 @@ class FortuneResponse(BaseModel):
     target_date: str
 
 
+class BreakerStateResponse(BaseModel):
+    state: str  # closed | open | half_open
+    consecutive_failures: int
+
+
 class HealthResponse(BaseModel):
-    status: str = "ok"
+    status: str = "ok"  # "degraded" while any circuit breaker is not closed
     version: str = "0.1.0"
+    breakers: dict[str, BreakerStateResponse] = {}
 
 
 class CelebrityInfo(BaseModel):
@@ -93,6 +113,47 @@ class CelebritySearchResponse(BaseModel):
     count: int
 
 
+class CelebrityMatchItem(BaseModel):
+    celebrity: CelebrityInfo
+    score: int  # chart-relation score, 0-100
+    highlights: list[str]  # relations behind the score
+
+
+class CelebrityBestMatchResponse(BaseModel):
+    user: SajuCalculateResponse
+    matches: list[CelebrityMatchItem]
+    count: int
+
+
+class GroupMemberItem(BaseModel):
+    label: str
+    pillars: str  # e.g. "庚午 辛巳 庚辰 癸未"
+    day_master: str
+
+
+class GroupPairItem(BaseModel):
+    members: list[int]  # positions in the request
+    labels: list[str]
+    score: int  # chart-relation score, 0-100
+    highlights: list[str]  # relations behind the score
+
+
+class GroupClusterItem(BaseModel):
+    members: list[int]
+    labels: list[str]
+    cohesion: int | None  # mean pair score inside the cluster, None for one member
+
+
+class GroupCompatibilityResponse(BaseModel):
+    members: list[GroupMemberItem]
+    matrix: list[list[int | None]]  # pair scores 0-100, None on the diagonal
+    average: int  # mean pair score of the group
+    clusters: list[GroupClusterItem]  # largest first
+    best_pairs: list[GroupPairItem]
+    worst_pairs: list[GroupPairItem]
+    interpretation: InterpretationResponse | None = None  # None when interpret is false
+
+
 class CelebrityCompatibilityResponse(BaseModel):
     user: SajuCalculateResponse
     celebrity: SajuCalculateResponse
@@ -107,6 +168,21 @@ class TimingResponse(BaseModel):
     target_datetime: str
 
 
+class HourScoreItem(BaseModel):
+    shi_chen: str  # e.g. "자시(子時) 23:00-01:00"
+    hour_pillar: str  # e.g. 甲子
+    ten_god: str  # of the hour stem, e.g. 정관
+    score: int  # 0-100, rule-based
+    notes: list[str]
+
+
+class BestHoursResponse(BaseModel):
+    calculation: SajuCalculateResponse
+    hour_scores: list[HourScoreItem]  # 자시 first
+    interpretation: InterpretationResponse | None = None  # None when interpret is false
+    target_datetime: str
+
+
 class PetReadingResponse(BaseModel):
     calculation: SajuCalculateResponse
     interpretation: InterpretationResponse
@@ -121,9 +197,21 @@ class PetCompatibilityResponse(BaseModel):
 
 
 class MarriageTimingResponse(BaseModel):
-    person1: SajuCalculateResponse
-    person2: SajuCalculateResponse
+    person1: SajuCalculateResponse  # 사람 1 of the interpretation
+    person2: SajuCalculateResponse  # 사람 2 of the interpretation
     interpretation: InterpretationResponse
+    persons_swapped: bool = False  # person1/person2 are the request's person2/person1
+
+
+class AuspiciousDateItem(BaseModel):
+    date: str  # YYYY-MM-DD
+    day_pillar: str  # e.g. 甲子
+    score: int  # rule-based score, 0-100
+    notes: list[str]  # rules behind the score
+
+
+class MarriageAuspiciousDatesResponse(MarriageTimingResponse):
+    candidate_dates: list[AuspiciousDateItem]  # best first
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,227 @@
+"""Retry with jittered backoff and circuit breakers for external dependencies.
+
+Used by LLMClient (Anthropic) and CacheService (Redis). Breakers are kept in a
+module-level registry so /health can report their state.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+from app.middleware.error_handler import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    rejects calls. Once `reset_timeout` seconds pass it lets a single probe
+    through (half-open); success closes it again, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self._reset_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed now."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probe_in_flight:
+            self._state = HALF_OPEN
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self._state != CLOSED:
+            logger.info("Circuit %s closed", self.name)
+        self._state = CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state == HALF_OPEN or self._failures >= self._failure_threshold:
+            if self._state != OPEN:
+                logger.warning("Circuit %s opened after %d failures", self.name, self._failures)
+            self._state = OPEN
+            self._opened_at = self._clock()
+
+    def release_probe(self) -> None:
+        """Forget an in-flight probe whose outcome is unknown (e.g. cancelled)."""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "consecutive_failures": self._failures}
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def create_breaker(name: str, *, failure_threshold: int, reset_timeout: float) -> CircuitBreaker:
+    """Create a breaker and register it for health reporting (latest wins)."""
+    breaker = CircuitBreaker(
+        name, failure_threshold=failure_threshold, reset_timeout=reset_timeout,
+    )
+    _BREAKERS[name] = breaker
+    return breaker
+
+
+def breaker_states() -> dict[str, dict]:
+    """Return the state of every registered breaker."""
+    return {name: breaker.snapshot() for name, breaker in _BREAKERS.items()}
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Read a Retry-After header (seconds or HTTP date) from an API error."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter, honouring Retry-After."""
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def delay_for(self, attempt: int, exc: BaseException) -> float | None:
+        """Delay before retry number `attempt` (1-based), or None to give up."""
+        server_delay = retry_after_seconds(exc)
+        if server_delay is not None:
+            return server_delay if server_delay <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+async def call_with_resilience(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    breaker: CircuitBreaker,
+    policy: RetryPolicy,
+    is_retryable: Callable[[BaseException], bool],
+) -> T:
+    """Call `fn` through `breaker`, retrying retryable failures per `policy`.
+
+    Only retryable (transient) failures count against the breaker; client
+    errors such as bad requests pass straight through.
+    """
+    attempt = 1
+    while True:
+        if not breaker.allow():
+            raise CircuitOpenError(breaker.name)
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception as exc:
+            if not is_retryable(exc):
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            delay = policy.delay_for(attempt, exc) if attempt < policy.attempts else None
+            if delay is None:
+                raise
+            logger.info(
+                "%s call failed (attempt %d/%d), retrying in %.2fs: %s",
+                breaker.name, attempt, policy.attempts, delay, exc,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        breaker.record_success()
+        return result
+
+
+async def stream_with_resilience(
+    open_stream: Callable[[], AsyncIterator[T]],
+    *,
+    breaker: CircuitBreaker,
+    policy: RetryPolicy,
+    is_retryable: Callable[[BaseException], bool],
+) -> AsyncIterator[T]:
+    """Streaming variant of call_with_resilience.
+
+    A failed stream is only retried if it has not yielded anything yet, so
+    callers never see duplicated output.
+    """
+    attempt = 1
+    while True:
+        if not breaker.allow():
+            raise CircuitOpenError(breaker.name)
+        started = False
+        try:
+            async for item in open_stream():
+                started = True
+                yield item
+        except Exception as exc:
+            if not is_retryable(exc):
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            can_retry = attempt < policy.attempts and not started
+            delay = policy.delay_for(attempt, exc) if can_retry else None
+            if delay is None:
+                raise
+            logger.info(
+                "%s stream failed (attempt %d/%d), retrying in %.2fs: %s",
+                breaker.name, attempt, policy.attempts, delay, exc,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        except BaseException:
+            breaker.release_probe()
+            raise
+        breaker.record_success()
+        return
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from fastapi import APIRouter, Depends
+from sse_starlette.sse import EventSourceResponse
+
+from app.dependencies import get_bundle_service, get_saju_service
+from app.llm.parser import parse_interpretation
+from app.models.request import ReadingBundleRequest
+from app.services.bundle_service import (
+    PARTNER_READING_TYPES,
+    ReadingBundleService,
+    validate_bundle,
+)
+from app.services.saju_service import SajuService
+
+router = APIRouter(prefix="/api/v1/bundle", tags=["bundle"])
+
+
+@router.post("/readings")
+async def bundle_readings(
+    request: ReadingBundleRequest,
+    service: ReadingBundleService = Depends(get_bundle_service),
+    saju_service: SajuService = Depends(get_saju_service),
+) -> EventSourceResponse:
+    """Several readings of one chart, generated concurrently and streamed as each finishes."""
+    reading_types = validate_bundle(request.reading_types, request.partner is not None)
+    saju = saju_service.calculate(request.birth)
+    partner = saju_service.calculate(request.partner) if request.partner is not None else None
+    today = date.today()
+    start = date(request.target_year or today.year, request.target_month or today.month, 1)
+
+    async def event_generator():
+        yield {
+            "event": "calculation",
+            "data": json.dumps(saju_service.saju_to_dict(saju), ensure_ascii=False),
+        }
+        if partner is not None:
+            yield {
+                "event": "partner_calculation",
+                "data": json.dumps(saju_service.saju_to_dict(partner), ensure_ascii=False),
+            }
+
+        async for result in service.generate(
+            saju, reading_types,
+            partner=partner,
+            career_info=request.career_info,
+            relationship_info=request.relationship_info,
+            start=start,
+            language=request.language,
+        ):
+            if result.error is not None:
+                data = {
+                    "reading_type": result.reading_type,
+                    "error": type(result.error).__name__,
+                    "message": result.error.message,
+                }
+                yield {"event": "error", "data": json.dumps(data, ensure_ascii=False)}
+            else:
+                data = {
+                    "reading_type": result.reading_type,
+                    "interpretation": parse_interpretation(result.interpretation).model_dump(),
+                }
+                if result.reading_type in PARTNER_READING_TYPES:
+                    data["persons_swapped"] = result.persons_swapped
+                yield {"event": "reading", "data": json.dumps(data, ensure_ascii=False)}
+
+        yield {"event": "done", "data": ""}
+
+    return EventSourceResponse(event_generator())
@@ -3,13 +3,16 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Query
 
 from app.data.celebrities import search_celebrities
+from app.data.celebrity_search import DEFAULT_SEARCH_LIMIT
 from app.dependencies import get_celebrity_service, get_saju_service
 from app.llm.parser import parse_interpretation
 from app.llm.prompts.celebrity_compatibility import CELEBRITY_DISCLAIMER
-from app.models.request import CelebrityCompatibilityRequest
+from app.models.request import CelebrityBestMatchRequest, CelebrityCompatibilityRequest
 from app.models.response import (
+    CelebrityBestMatchResponse,
     CelebrityCompatibilityResponse,
     CelebrityInfo,
+    CelebrityMatchItem,
     CelebritySearchResponse,
     SajuCalculateResponse,
 )
@@ -22,9 +25,10 @@ router = APIRouter(prefix="/api/v1/celebrity", tags=["celebrity"])
 @router.get("/search", response_model=CelebritySearchResponse)
 async def celebrity_search(
     q: str = Query(..., min_length=1, max_length=50, description="Search query"),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=100, description="Maximum number of results"),
 ) -> CelebritySearchResponse:
-    """Search celebrities by name (Korean/English) or group name."""
-    results = search_celebrities(q)
+    """Search celebrities by name (Korean/English, choseong) or group name."""
+    results = search_celebrities(q, limit)
     items = [
         CelebrityInfo(
             id=c.id,
@@ -37,6 +41,41 @@ async def celebrity_search(
     return CelebritySearchResponse(results=items, count=len(items))
 
 
+@router.post("/best-match", response_model=CelebrityBestMatchResponse)
+async def celebrity_best_match(
+    request: CelebrityBestMatchRequest,
+    service: CelebrityService = Depends(get_celebrity_service),
+    saju_service: SajuService = Depends(get_saju_service),
+) -> CelebrityBestMatchResponse:
+    """Rank celebrities by chart compatibility with the user, without an LLM call.
+
+    Use /compatibility for the full interpretation of the pairing the user picks.
+    """
+    user_saju, matches = service.best_matches(
+        request.birth,
+        limit=request.limit,
+        gender=request.gender.value if request.gender else None,
+    )
+    items = [
+        CelebrityMatchItem(
+            celebrity=CelebrityInfo(
+                id=m.chart.celebrity.id,
+                name_ko=m.chart.celebrity.name_ko,
+                name_en=m.chart.celebrity.name_en,
+                group=m.chart.celebrity.group,
+            ),
+            score=m.score,
+            highlights=list(m.highlights),
+        )
+        for m in matches
+    ]
+    return CelebrityBestMatchResponse(
+        user=SajuCalculateResponse(**saju_service.saju_to_dict(user_saju)),
+        matches=items,
+        count=len(items),
+    )
+
+
 @router.post("/compatibility", response_model=CelebrityCompatibilityResponse)
 async def celebrity_compatibility(
     request: CelebrityCompatibilityRequest,
@@ -3,10 +3,19 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends
 
 from app.dependencies import get_compatibility_service, get_saju_service
+from app.llm.formatter import chart_pillars
 from app.llm.parser import parse_interpretation
-from app.models.request import CompatibilityRequest
-from app.models.response import CompatibilityResponse, SajuCalculateResponse
-from app.services.compatibility_service import CompatibilityService
+from app.models.request import CompatibilityRequest, GroupCompatibilityRequest
+from app.models.response import (
+    CompatibilityResponse,
+    GroupClusterItem,
+    GroupCompatibilityResponse,
+    GroupMemberItem,
+    GroupPairItem,
+    SajuCalculateResponse,
+)
+from app.services.compatibility_service import CompatibilityService, prompt_order
+from app.services.group_match import GroupPair
 from app.services.saju_service import SajuService
 
 router = APIRouter(prefix="/api/v1/compatibility", tags=["compatibility"])
@@ -18,12 +27,64 @@ async def analyze(
     service: CompatibilityService = Depends(get_compatibility_service),
     saju_service: SajuService = Depends(get_saju_service),
 ) -> CompatibilityResponse:
-    """Analyze compatibility between two people."""
-    saju1, saju2, raw_text = await service.analyze(
-        request.person1, request.person2, language=request.language,
+    """Analyze compatibility between two people, listed in the order the interpretation names them."""
+    saju1, saju2, swapped = prompt_order(
+        "compatibility",
+        service.calculate_person(request.person1),
+        service.calculate_person(request.person2),
     )
+    raw_text = await service.analyze_charts(saju1, saju2, language=request.language)
     return CompatibilityResponse(
         person1=SajuCalculateResponse(**saju_service.saju_to_dict(saju1)),
         person2=SajuCalculateResponse(**saju_service.saju_to_dict(saju2)),
         interpretation=parse_interpretation(raw_text),
+        persons_swapped=swapped,
+    )
+
+
+@router.post("/group", response_model=GroupCompatibilityResponse)
+async def group(
+    request: GroupCompatibilityRequest,
+    service: CompatibilityService = Depends(get_compatibility_service),
+) -> GroupCompatibilityResponse:
+    """Pairwise compatibility matrix of a group with clusters, scored without an LLM call.
+
+    With interpret, the LLM narrates the group summary (not each pair).
+    """
+    labels = [member.label or f"사람 {i}" for i, member in enumerate(request.members, 1)]
+    sajus, matrix = service.group_matrix([member.birth for member in request.members])
+    interpretation = None
+    if request.interpret:
+        raw_text = await service.group_summary(sajus, labels, matrix, language=request.language)
+        interpretation = parse_interpretation(raw_text)
+
+    def pair_items(pairs: tuple[GroupPair, ...]) -> list[GroupPairItem]:
+        return [
+            GroupPairItem(
+                members=[p.first, p.second],
+                labels=[labels[p.first], labels[p.second]],
+                score=p.score,
+                highlights=list(p.highlights),
+            )
+            for p in pairs
+        ]
+
+    return GroupCompatibilityResponse(
+        members=[
+            GroupMemberItem(label=label, pillars=chart_pillars(saju), day_master=saju.day_master)
+            for label, saju in zip(labels, sajus)
+        ],
+        matrix=[list(row) for row in matrix.scores],
+        average=matrix.average,
+        clusters=[
+            GroupClusterItem(
+                members=list(c.members),
+                labels=[labels[i] for i in c.members],
+                cohesion=c.cohesion,
+            )
+            for c in matrix.clusters
+        ],
+        best_pairs=pair_items(matrix.best_pairs),
+        worst_pairs=pair_items(matrix.worst_pairs),
+        interpretation=interpretation,
     )
@@ -1,10 +1,23 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.models.response import HealthResponse
+from app.dependencies import get_llm_client
+from app.llm.client import LLMClient
+from app.models.response import BreakerStateResponse, HealthResponse
+from app.resilience import breaker_states
 
 router = APIRouter()
 
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
-    return HealthResponse()
+    breakers = {
+        name: BreakerStateResponse(**state) for name, state in breaker_states().items()
+    }
+    degraded = any(b.state != "closed" for b in breakers.values())
+    return HealthResponse(status="degraded" if degraded else "ok", breakers=breakers)
+
+
+@router.get("/health/llm")
+async def llm_metrics(llm_client: LLMClient = Depends(get_llm_client)) -> dict:
+    """LLM provider, hedging and connection pool metrics."""
+    return llm_client.metrics_snapshot()
@@ -5,6 +5,8 @@ from datetime import date
 from fastapi import APIRouter, Depends
 
 from app.dependencies import get_compatibility_service, get_fortune_service, get_saju_service
+from app.engine.models import SajuData
+from app.llm.formatter import format_day_score, format_relationship_info
 from app.llm.parser import parse_interpretation
 from app.llm.prompts.marriage import (
     MARRIAGE_AUSPICIOUS_DATES_PROMPT,
@@ -17,41 +19,65 @@ from app.models.request import (
     MarriageFinanceRequest,
     MarriageLifeForecastRequest,
     MarriageTimingRequest,
-    RelationshipInfoInput,
 )
-from app.models.response import MarriageTimingResponse, SajuCalculateResponse
-from app.services.compatibility_service import CompatibilityService
+from app.models.response import (
+    AuspiciousDateItem,
+    MarriageAuspiciousDatesResponse,
+    MarriageTimingResponse,
+    SajuCalculateResponse,
+)
+from app.services.compatibility_service import CompatibilityService, prompt_order
 from app.services.fortune_service import FortuneService
 from app.services.saju_service import SajuService
 
 router = APIRouter(prefix="/api/v1/marriage", tags=["marriage"])
 
 
-def _format_relationship_info(info: RelationshipInfoInput | None, marriage_year: int | None = None) -> str:
-    """Format relationship metadata for prompt context."""
-    lines = []
-    if info is not None:
-        if info.dating_start_year:
-            lines.append(f"교제 시작 연도: {info.dating_start_year}년")
-        if info.dating_years is not None:
-            lines.append(f"교제 기간: {info.dating_years}년")
-        if info.target_marriage_year:
-            lines.append(f"결혼 희망 연도: {info.target_marriage_year}년")
-        if info.concern_type:
-            concern_labels = {
-                "when": "결혼 시기",
-                "readiness": "결혼 준비도",
-                "compatibility": "결혼 후 궁합",
-                "family": "양가 관계",
-                "finance": "결혼 후 재물운",
-                "children": "자녀운",
-            }
-            lines.append(f"주요 고민: {concern_labels.get(info.concern_type.value, info.concern_type.value)}")
-        if info.living_together is not None:
-            lines.append(f"동거 여부: {'예' if info.living_together else '아니오'}")
-    if marriage_year:
-        lines.append(f"결혼 예정 연도: {marriage_year}년")
-    return "\n".join(lines) if lines else "관계 정보: 제공되지 않음"
+def _person_blocks(
+    fortune_service: FortuneService, saju1: SajuData, saju2: SajuData, start_year: int, start_month: int = 1,
+) -> dict[str, str]:
+    """Prompt blocks of both charts with their luck timelines from start_year/start_month."""
+    return {
+        "person1_data": fortune_service.prompt_block(saju1, start_year, start_month),
+        "person2_data": fortune_service.prompt_block(saju2, start_year, start_month),
+    }
+
+
+async def _couple_reading(
+    request_body: MarriageTimingRequest | MarriageLifeForecastRequest | MarriageFinanceRequest,
+    compat_service: CompatibilityService,
+    saju_service: SajuService,
+    fortune_service: FortuneService,
+    *,
+    reading_type: str,
+    prompt_template: str,
+    rel_info: str,
+) -> MarriageTimingResponse:
+    """Shared logic for the couple readings that look ahead from this month."""
+    today = date.today()
+    saju1, saju2, swapped = prompt_order(
+        reading_type,
+        compat_service.calculate_person(request_body.person1),
+        compat_service.calculate_person(request_body.person2),
+    )
+
+    interpretation = await compat_service.analyze_charts(
+        saju1,
+        saju2,
+        reading_type=reading_type,
+        prompt_template=prompt_template,
+        # luck_from is not in the templates; it keys the cache on the timeline start
+        prompt_kwargs={"relationship_info": rel_info, "luck_from": f"{today.year}-{today.month:02d}"},
+        language=request_body.language,
+        **_person_blocks(fortune_service, saju1, saju2, today.year, today.month),
+    )
+
+    return MarriageTimingResponse(
+        person1=SajuCalculateResponse(**saju_service.saju_to_dict(saju1)),
+        person2=SajuCalculateResponse(**saju_service.saju_to_dict(saju2)),
+        interpretation=parse_interpretation(interpretation),
+        persons_swapped=swapped,
+    )
 
 
 @router.post("/timing", response_model=MarriageTimingResponse)
@@ -59,23 +85,14 @@ async def marriage_timing(
     request_body: MarriageTimingRequest,
     compat_service: CompatibilityService = Depends(get_compatibility_service),
     saju_service: SajuService = Depends(get_saju_service),
+    fortune_service: FortuneService = Depends(get_fortune_service),
 ) -> MarriageTimingResponse:
     """Analyze optimal marriage timing for a couple."""
-    rel_info = _format_relationship_info(request_body.relationship_info)
-
-    saju1, saju2, interpretation = await compat_service.analyze(
-        request_body.person1,
-        request_body.person2,
+    return await _couple_reading(
+        request_body, compat_service, saju_service, fortune_service,
         reading_type="marriage_timing",
         prompt_template=MARRIAGE_TIMING_PROMPT,
-        prompt_kwargs={"relationship_info": rel_info},
-        language=request_body.language,
-    )
-
-    return MarriageTimingResponse(
-        person1=SajuCalculateResponse(**saju_service.saju_to_dict(saju1)),
-        person2=SajuCalculateResponse(**saju_service.saju_to_dict(saju2)),
-        interpretation=parse_interpretation(interpretation),
+        rel_info=format_relationship_info(request_body.relationship_info),
     )
 
 
@@ -84,23 +101,14 @@ async def marriage_life_forecast(
     request_body: MarriageLifeForecastRequest,
     compat_service: CompatibilityService = Depends(get_compatibility_service),
     saju_service: SajuService = Depends(get_saju_service),
+    fortune_service: FortuneService = Depends(get_fortune_service),
 ) -> MarriageTimingResponse:
     """Analyze post-marriage life compatibility in depth."""
-    rel_info = _format_relationship_info(None, marriage_year=request_body.marriage_year)
-
-    saju1, saju2, interpretation = await compat_service.analyze(
-        request_body.person1,
-        request_body.person2,
+    return await _couple_reading(
+        request_body, compat_service, saju_service, fortune_service,
         reading_type="marriage_life_forecast",
         prompt_template=MARRIAGE_LIFE_FORECAST_PROMPT,
-        prompt_kwargs={"relationship_info": rel_info},
-        language=request_body.language,
-    )
-
-    return MarriageTimingResponse(
-        person1=SajuCalculateResponse(**saju_service.saju_to_dict(saju1)),
-        person2=SajuCalculateResponse(**saju_service.saju_to_dict(saju2)),
-        interpretation=parse_interpretation(interpretation),
+        rel_info=format_relationship_info(None, marriage_year=request_body.marriage_year),
     )
 
 
@@ -109,51 +117,68 @@ async def marriage_finance(
     request_body: MarriageFinanceRequest,
     compat_service: CompatibilityService = Depends(get_compatibility_service),
     saju_service: SajuService = Depends(get_saju_service),
+    fortune_service: FortuneService = Depends(get_fortune_service),
 ) -> MarriageTimingResponse:
     """Analyze couple's financial fortune after marriage."""
-    rel_info = _format_relationship_info(None, marriage_year=request_body.marriage_year)
-
-    saju1, saju2, interpretation = await compat_service.analyze(
-        request_body.person1,
-        request_body.person2,
+    return await _couple_reading(
+        request_body, compat_service, saju_service, fortune_service,
         reading_type="marriage_finance",
         prompt_template=MARRIAGE_FINANCE_PROMPT,
-        prompt_kwargs={"relationship_info": rel_info},
-        language=request_body.language,
-    )
-
-    return MarriageTimingResponse(
-        person1=SajuCalculateResponse(**saju_service.saju_to_dict(saju1)),
-        person2=SajuCalculateResponse(**saju_service.saju_to_dict(saju2)),
-        interpretation=parse_interpretation(interpretation),
+        rel_info=format_relationship_info(None, marriage_year=request_body.marriage_year),
     )
 
 
-@router.post("/auspicious-dates", response_model=MarriageTimingResponse)
+@router.post("/auspicious-dates", response_model=MarriageAuspiciousDatesResponse)
 async def marriage_auspicious_dates(
     request_body: MarriageAuspiciousDatesRequest,
     compat_service: CompatibilityService = Depends(get_compatibility_service),
     saju_service: SajuService = Depends(get_saju_service),
     fortune_service: FortuneService = Depends(get_fortune_service),
-) -> MarriageTimingResponse:
-    """Analyze auspicious dates for marriage."""
+) -> MarriageAuspiciousDatesResponse:
+    """Rank auspicious marriage dates by rule and have the LLM explain the best ones."""
     target_year = request_body.target_year or date.today().year
     period_info = fortune_service._get_target_period_info(target_year, 6)
     if request_body.target_months:
         months_str = ", ".join(str(m) for m in request_body.target_months)
         period_info += f"\n분석 대상 월: {months_str}월"
 
-    saju1, saju2, interpretation = await compat_service.analyze(
-        request_body.person1,
-        request_body.person2,
+    # The candidate notes name 사람1/사람2 in prompt order too
+    saju1, saju2, swapped = prompt_order(
+        "marriage_auspicious_dates",
+        compat_service.calculate_person(request_body.person1),
+        compat_service.calculate_person(request_body.person2),
+    )
+    # Past days of the target year are not proposed
+    start = max(date(target_year, 1, 1), date.today())
+    candidates = []
+    if start.year == target_year:
+        candidates = fortune_service.rank_dates(
+            [saju1, saju2], start, date(target_year, 12, 31),
+            months=request_body.target_months, limit=request_body.candidate_count,
+        )
+
+    interpretation = await compat_service.analyze_charts(
+        saju1,
+        saju2,
         reading_type="marriage_auspicious_dates",
         prompt_template=MARRIAGE_AUSPICIOUS_DATES_PROMPT,
-        prompt_kwargs={"target_period": period_info},
+        prompt_kwargs={
+            "target_period": period_info,
+            "candidate_dates": "\n".join(format_day_score(c) for c in candidates) or "- 없음",
+        },
         language=request_body.language,
+        **_person_blocks(fortune_service, saju1, saju2, target_year),
     )
 
-    return MarriageTimingResponse(
+    return MarriageAuspiciousDatesResponse(
         person1=SajuCalculateResponse(**saju_service.saju_to_dict(saju1)),
         person2=SajuCalculateResponse(**saju_service.saju_to_dict(saju2)),
         interpretation=parse_interpretation(interpretation),
+        persons_swapped=swapped,
+        candidate_dates=[
+            AuspiciousDateItem(
+                date=c.date.isoformat(), day_pillar=c.day_pillar, score=c.score, notes=list(c.notes),
+            )
+            for c in candidates
+        ],
     )
@@ -28,7 +28,7 @@ from app.models.response import (
     SajuCalculateResponse,
     SajuReadingResponse,
 )
-from app.services.cache_service import CacheService
+from app.services.cache_keys import reading_cache_key
 from app.services.compatibility_service import CompatibilityService
 from app.services.fortune_service import FortuneService
 from app.services.saju_service import SajuService
@@ -98,10 +98,8 @@ async def pet_reading(
 
     saju = service.calculate(birth)
 
-    cache_key = CacheService.make_key(
-        "pet_reading",
-        y=birth.year, m=birth.month, d=birth.day, h=birth.hour,
-        g=birth.gender.value, lang=request_body.language,
+    cache_key = reading_cache_key(
+        "pet_reading", saju, language=request_body.language, pet_info=pet_info,
     )
     cached = await service._cache.get(cache_key)
     if cached:
@@ -162,21 +160,19 @@ async def pet_yearly_fortune(
     target_year = request_body.target_year or date.today().year
 
     saju = service.calculate(birth)
-    period_info = fortune_service._get_target_period_info(target_year, 6)
 
-    cache_key = CacheService.make_key(
-        "pet_yearly",
-        y=birth.year, m=birth.month, d=birth.day, h=birth.hour,
-        g=birth.gender.value, ty=target_year, lang=request_body.language,
+    cache_key = reading_cache_key(
+        "pet_yearly_fortune", saju, language=request_body.language,
+        pet_info=pet_info, ty=target_year,
     )
     cached = await service._cache.get(cache_key)
     if cached:
         raw_text = cached
     else:
         prompt = PET_YEARLY_FORTUNE_PROMPT.format(
-            saju_data=format_saju_for_prompt(saju),
+            saju_data=format_saju_for_prompt(saju, luck=fortune_service.luck_timeline(saju, target_year)),
             pet_info=pet_info,
-            target_period=period_info,
+            target_period=fortune_service._get_target_period_info(target_year, 6),
         )
         raw_text = await service._llm.generate(
             prompt, reading_type="pet_yearly_fortune", language=request_body.language,
@@ -200,22 +196,17 @@ async def pet_adoption_timing(
     target_year = request_body.target_year or date.today().year
 
     saju = service.calculate(request_body.owner)
-    period_info = fortune_service._get_target_period_info(target_year, 6)
-
-    cache_key = CacheService.make_key(
-        "pet_adoption",
-        y=request_body.owner.year, m=request_body.owner.month,
-        d=request_body.owner.day, h=request_body.owner.hour,
-        g=request_body.owner.gender.value, ty=target_year,
-        lang=request_body.language,
+
+    cache_key = reading_cache_key(
+        "pet_adoption_timing", saju, language=request_body.language, ty=target_year,
     )
     cached = await service._cache.get(cache_key)
     if cached:
         raw_text = cached
     else:
         prompt = PET_ADOPTION_TIMING_PROMPT.format(
-            saju_data=format_saju_for_prompt(saju),
-            target_period=period_info,
+            saju_data=format_saju_for_prompt(saju, luck=fortune_service.luck_timeline(saju, target_year)),
+            target_period=fortune_service._get_target_period_info(target_year, 6),
         )
         raw_text = await service._llm.generate(
             prompt, reading_type="pet_adoption_timing", language=request_body.language,
@@ -6,9 +6,14 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from sse_starlette.sse import EventSourceResponse
 
 from app.dependencies import get_saju_service
-from app.llm.parser import parse_interpretation
+from app.llm.parser import StreamEvent, StreamingInterpretationParser, parse_interpretation
 from app.models.request import SajuCalculateRequest, SajuReadingRequest, SinsalRequest
-from app.models.response import SajuCalculateResponse, SajuReadingResponse
+from app.models.response import (
+    SajuCalculateResponse,
+    SajuReadingResponse,
+    SinsalItem,
+    SinsalResponse,
+)
 from app.services.saju_service import SajuService
 
 router = APIRouter(prefix="/api/v1/saju", tags=["saju"])
@@ -61,6 +66,10 @@ async def reading(
     )
 
 
+def _sse_event(event: StreamEvent) -> dict:
+    return {"event": event.event, "data": json.dumps(event.data, ensure_ascii=False)}
+
+
 async def _streaming_reading(
     request: SajuReadingRequest,
     service: SajuService,
@@ -82,30 +91,47 @@ async def _streaming_reading(
             "data": json.dumps(calc_data, ensure_ascii=False),
         }
 
-        # Stream interpretation chunks
-        async for chunk in text_stream:
-            yield {
-                "event": "interpretation",
-                "data": chunk,
-            }
+        if request.structured_stream:
+            # Stream parsed sections so clients can render without re-parsing
+            parser = StreamingInterpretationParser()
+            async for chunk in text_stream:
+                for event in parser.feed(chunk):
+                    yield _sse_event(event)
+            for event in parser.close():
+                yield _sse_event(event)
+        else:
+            # Stream interpretation chunks
+            async for chunk in text_stream:
+                yield {
+                    "event": "interpretation",
+                    "data": chunk,
+                }
 
         yield {"event": "done", "data": ""}
 
     return EventSourceResponse(event_generator())
 
 
-@router.post("/sinsal", response_model=SajuReadingResponse)
+@router.post("/sinsal", response_model=SinsalResponse)
 async def sinsal(
     request_body: SinsalRequest,
     request: Request,
     service: SajuService = Depends(get_saju_service),
-) -> SajuReadingResponse:
-    """Sinsal (신살) analysis."""
-    reading_type = getattr(request.state, "reading_type", "sinsal")
-    saju, raw_text = await service.reading(
-        request_body.birth, reading_type, language=request_body.language,
-    )
-    return SajuReadingResponse(
+) -> SinsalResponse:
+    """Sinsal (신살) analysis. The sinsal list is computed; the LLM only interprets it."""
+    saju, found = service.sinsal(request_body.birth)
+    interpretation = None
+    if request_body.interpret:
+        reading_type = getattr(request.state, "reading_type", "sinsal")
+        _, raw_text = await service.reading(
+            request_body.birth, reading_type, language=request_body.language,
+        )
+        interpretation = parse_interpretation(raw_text)
+    return SinsalResponse(
         calculation=SajuCalculateResponse(**service.saju_to_dict(saju)),
-        interpretation=parse_interpretation(raw_text),
+        sinsal=[
+            SinsalItem(name=s.name, kind=s.kind, positions=list(s.positions), basis=s.basis)
+            for s in found
+        ],
+        interpretation=interpretation,
     )
@@ -6,9 +6,14 @@ from fastapi import APIRouter, Depends
 
 from app.dependencies import get_fortune_service, get_saju_service
 from app.llm.parser import parse_interpretation
-from app.models.request import TimingRequest
-from app.models.response import SajuCalculateResponse, TimingResponse
-from app.services.fortune_service import FortuneService
+from app.models.request import BestHoursRequest, TimingRequest
+from app.models.response import (
+    BestHoursResponse,
+    HourScoreItem,
+    SajuCalculateResponse,
+    TimingResponse,
+)
+from app.services.fortune_service import SHI_CHEN_LABELS, FortuneService
 from app.services.saju_service import SajuService
 
 router = APIRouter(prefix="/api/v1/timing", tags=["timing"])
@@ -38,26 +43,39 @@ async def timing_now(
     )
 
 
-@router.post("/best-hours", response_model=TimingResponse)
+@router.post("/best-hours", response_model=BestHoursResponse)
 async def timing_best_hours(
-    request: TimingRequest,
+    request: BestHoursRequest,
     service: FortuneService = Depends(get_fortune_service),
     saju_service: SajuService = Depends(get_saju_service),
-) -> TimingResponse:
-    """Best hours analysis for today (or target date)."""
+) -> BestHoursResponse:
+    """Best hours for today (or target date). The hours are scored; the LLM only interprets them."""
     now = datetime.now()
     target_year = request.target_year or now.year
     target_month = request.target_month or now.month
     target_day = request.target_day or now.day
 
-    saju, interpretation, target_date = await service.timing_best_hours(
+    saju, day_pillar, scores = service.best_hours(
         request.birth, target_year, target_month, target_day,
-        language=request.language,
     )
-    return TimingResponse(
+    interpretation = None
+    if request.interpret:
+        raw_text = await service.timing_best_hours(
+            saju, target_year, target_month, target_day, day_pillar, scores,
+            language=request.language,
+        )
+        interpretation = parse_interpretation(raw_text)
+    return BestHoursResponse(
         calculation=SajuCalculateResponse(**saju_service.saju_to_dict(saju)),
-        interpretation=parse_interpretation(interpretation),
-        target_datetime=target_date,
+        hour_scores=[
+            HourScoreItem(
+                shi_chen=SHI_CHEN_LABELS[s.shi_chen], hour_pillar=s.hour_pillar,
+                ten_god=s.ten_god, score=s.score, notes=list(s.notes),
+            )
+            for s in scores
+        ],
+        interpretation=interpretation,
+        target_datetime=f"{target_year}-{target_month:02d}-{target_day:02d}",
     )
 
 
@@ -0,0 +1,171 @@
+"""Several readings of one chart generated concurrently (premium package).
+
+The chart is calculated once and each requested reading type runs as its own
+task; results are yielded in completion order so the router can stream
+each one as soon as it is ready. Every reading goes through the same service
+method (and cache key) as its standalone endpoint, so bundle and single
+requests share cached interpretations.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import string
+from collections.abc import AsyncIterator, Awaitable
+from dataclasses import dataclass
+from datetime import date
+
+from app.engine.models import SajuData
+from app.llm.formatter import format_career_info, format_relationship_info
+from app.llm.prompts.career import CAREER_PROMPTS
+from app.llm.prompts.marriage import MARRIAGE_TIMING_PROMPT
+from app.llm.prompts.reading_types import READING_TYPE_PROMPTS
+from app.middleware.error_handler import InvalidBundleError, LLMError, SajuError
+from app.models.request import CareerInfo, RelationshipInfoInput
+from app.services.compatibility_service import CompatibilityService, swaps_pair
+from app.services.fortune_service import FortuneService
+from app.services.saju_service import SajuService
+
+logger = logging.getLogger(__name__)
+
+MONTHLY = "monthly"
+MARRIAGE_TIMING = "marriage_timing"
+
+
+def _template_fields(template: str) -> set[str]:
+    return {field for _, field, _, _ in string.Formatter().parse(template) if field}
+
+
+# Single-chart readings SajuService.interpret can build from the chart alone
+CHART_READING_TYPES = frozenset(
+    reading_type for reading_type, template in READING_TYPE_PROMPTS.items()
+    if _template_fields(template) <= {"saju_data", "sinsal_data"}
+)
+BUNDLE_READING_TYPES = CHART_READING_TYPES | CAREER_PROMPTS.keys() | {MONTHLY, MARRIAGE_TIMING}
+# Readings that also need the partner's chart
+PARTNER_READING_TYPES = frozenset({MARRIAGE_TIMING})
+
+
+@dataclass(frozen=True)
+class BundleReading:
+    """Outcome of one reading of a bundle."""
+
+    reading_type: str
+    interpretation: str | None  # None when the reading failed
+    error: SajuError | None = None
+    # Partner readings: the interpretation's 사람 1 is the partner (see prompt_order)
+    persons_swapped: bool = False
+
+
+def validate_bundle(reading_types: list[str], has_partner: bool) -> list[str]:
+    """Requested reading types without duplicates, in request order.
+
+    Raises InvalidBundleError for types a bundle cannot serve.
+    """
+    unique = list(dict.fromkeys(reading_types))
+    unsupported = [t for t in unique if t not in BUNDLE_READING_TYPES]
+    if unsupported:
+        raise InvalidBundleError(
+            f"Unsupported reading types for a bundle: {', '.join(unsupported)}"
+        )
+    if not has_partner:
+        needs_partner = [t for t in unique if t in PARTNER_READING_TYPES]
+        if needs_partner:
+            raise InvalidBundleError(f"partner is required for: {', '.join(needs_partner)}")
+    return unique
+
+
+class ReadingBundleService:
+    """Fans out the readings of one chart to the reading services."""
+
+    def __init__(
+        self,
+        saju_service: SajuService,
+        fortune_service: FortuneService,
+        compat_service: CompatibilityService,
+    ):
+        self._saju = saju_service
+        self._fortune = fortune_service
+        self._compat = compat_service
+
+    def _reading(
+        self,
+        reading_type: str,
+        saju: SajuData,
+        *,
+        partner: SajuData | None,
+        career_info: CareerInfo | None,
+        relationship_info: RelationshipInfoInput | None,
+        start: date,
+        language: str,
+    ) -> Awaitable[str]:
+        if reading_type == MONTHLY:
+            return self._fortune.monthly_interpretation(
+                saju, start.year, start.month, language=language,
+            )
+        if reading_type in CAREER_PROMPTS:
+            return self._saju.career_interpretation(
+                saju, reading_type, format_career_info(career_info),
+                self._fortune.luck_timeline(saju, start.year, start.month),
+                language=language,
+            )
+        if reading_type == MARRIAGE_TIMING:
+            assert partner is not None
+            return self._compat.analyze_charts(
+                saju, partner,
+                reading_type=reading_type,
+                prompt_template=MARRIAGE_TIMING_PROMPT,
+                # Same prompt kwargs as /marriage/timing, so both share the cache
+                prompt_kwargs={
+                    "relationship_info": format_relationship_info(relationship_info),
+                    "luck_from": f"{start.year}-{start.month:02d}",
+                },
+                language=language,
+                person1_data=self._fortune.prompt_block(saju, start.year, start.month),
+                person2_data=self._fortune.prompt_block(partner, start.year, start.month),
+            )
+        return self._saju.interpret(saju, reading_type, language=language)
+
+    async def generate(
+        self,
+        saju: SajuData,
+        reading_types: list[str],
+        *,
+        partner: SajuData | None = None,
+        career_info: CareerInfo | None = None,
+        relationship_info: RelationshipInfoInput | None = None,
+        start: date | None = None,
+        language: str = "ko",
+    ) -> AsyncIterator[BundleReading]:
+        """Run the readings concurrently and yield each as it finishes.
+
+        start is the month monthly fortune and the luck timelines start from
+        (default: this month). A failed reading is yielded with its error;
+        the others carry on. Readings still running when the consumer stops
+        iterating are cancelled.
+        """
+        start = start or date.today()
+
+        async def run(reading_type: str) -> BundleReading:
+            try:
+                interpretation = await self._reading(
+                    reading_type, saju,
+                    partner=partner, career_info=career_info, relationship_info=relationship_info,
+                    start=start, language=language,
+                )
+            except SajuError as exc:
+                return BundleReading(reading_type, None, exc)
+            except Exception:
+                logger.exception("Bundle reading %s failed", reading_type)
+                return BundleReading(reading_type, None, LLMError(f"{reading_type} reading failed"))
+            swapped = reading_type in PARTNER_READING_TYPES and swaps_pair(reading_type, saju, partner)
+            return BundleReading(reading_type, interpretation, persons_swapped=swapped)
+
+        tasks = [asyncio.create_task(run(reading_type)) for reading_type in reading_types]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,76 @@
+"""Cache keys for LLM interpretations.
+
+Every cached interpretation is keyed by its namespace (the reading type sent
+to the LLM), the schema version of that namespace, the chart fingerprint of
+each person involved, the response language and any prompt inputs that are
+not part of the chart (target dates, counselor, pet or career details):
+
+    saju:{namespace}:v{version}:{digest}
+
+Bumping a namespace's version when its prompt or output format changes makes
+every old key in that namespace unreachable; those entries simply expire by
+TTL, so no Redis SCAN or FLUSH is needed and other namespaces stay warm.
+Versions live in CACHE_KEY_VERSIONS and can be overridden without a code
+change through the CACHE_KEY_VERSIONS setting (e.g. '{"daily": 3}').
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from app.config import settings
+from app.engine.fingerprint import chart_fingerprint
+from app.engine.models import SajuData
+from app.services.cache_service import CacheService
+
+DEFAULT_KEY_VERSION = 1
+
+# Per-namespace schema versions. Namespaces not listed are at
+# DEFAULT_KEY_VERSION; bump one here together with its prompt or output change.
+CACHE_KEY_VERSIONS: dict[str, int] = {
+    # Ranked candidate dates and the D-day score in the prompt (v2), luck timeline (v3)
+    "marriage_auspicious_dates": 3,
+    "timing_dday": 2,
+    # Rule-based 12 shi-chen scores in the prompt
+    "timing_best_hours": 2,
+    # Da Yun, yearly and monthly luck timeline in the chart block
+    "monthly": 2,
+    "career_transition": 2,
+    "career_stay_or_go": 2,
+    "career_startup": 2,
+    "career_burnout": 2,
+    "marriage_timing": 2,
+    "marriage_life_forecast": 2,
+    "marriage_finance": 2,
+    "pet_yearly_fortune": 2,
+    "pet_adoption_timing": 2,
+}
+
+
+def key_version(namespace: str) -> int:
+    """Return the current schema version of a namespace."""
+    override = settings.cache_key_versions.get(namespace)
+    if override is not None:
+        return override
+    return CACHE_KEY_VERSIONS.get(namespace, DEFAULT_KEY_VERSION)
+
+
+def reading_cache_key(
+    namespace: str,
+    *charts: SajuData,
+    language: str,
+    **fields: Any,
+) -> str:
+    """Build the cache key for an interpretation of one or more charts.
+
+    Args:
+        namespace: Reading type the interpretation was generated for.
+        charts: Charts the prompt was built from, in prompt order.
+        language: Response language code.
+        fields: Other prompt inputs (JSON-serializable) that change the output.
+    """
+    return CacheService.make_key(
+        f"{namespace}:v{key_version(namespace)}",
+        charts=[chart_fingerprint(saju) for saju in charts],
+        lang=language,
+        **fields,
+    )
@@ -5,27 +5,64 @@ import json
 import logging
 from typing import Any
 
+from app.config import settings
+from app.middleware.error_handler import CircuitOpenError
+from app.resilience import CircuitBreaker, RetryPolicy, call_with_resilience, create_breaker
+
+try:
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    from redis.exceptions import TimeoutError as RedisTimeoutError
+
+    _TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+        RedisConnectionError, RedisTimeoutError, OSError, TimeoutError,
+    )
+except ImportError:
+    _TRANSIENT_ERRORS = (OSError, TimeoutError)
+
 logger = logging.getLogger(__name__)
 
+# Cache calls are best-effort: a miss is cheaper than waiting on retries
+_NO_RETRY = RetryPolicy(attempts=1)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    return isinstance(exc, _TRANSIENT_ERRORS)
+
 
 class CacheService:
-    """Redis cache abstraction with graceful degradation."""
+    """Redis cache abstraction with graceful degradation.
+
+    Calls go through a circuit breaker so a dead Redis is skipped instead of
+    being hit (and timing out) on every request.
+    """
 
-    def __init__(self, redis_client=None):
+    def __init__(self, redis_client=None, breaker: CircuitBreaker | None = None):
         self._redis = redis_client
+        self._breaker = breaker or create_breaker(
+            "redis",
+            failure_threshold=settings.redis_breaker_failure_threshold,
+            reset_timeout=settings.redis_breaker_reset_seconds,
+        )
 
     @property
     def available(self) -> bool:
         return self._redis is not None
 
+    async def _call(self, fn):
+        return await call_with_resilience(
+            fn, breaker=self._breaker, policy=_NO_RETRY, is_retryable=_is_transient,
+        )
+
     async def get(self, key: str) -> Any | None:
         if not self.available:
             return None
         try:
-            data = await self._redis.get(key)
+            data = await self._call(lambda: self._redis.get(key))
             if data is None:
                 return None
             return json.loads(data)
+        except CircuitOpenError:
+            return None
         except Exception:
             logger.warning("Cache get failed for key=%s", key, exc_info=True)
             return None
@@ -34,15 +71,44 @@ class CacheService:
         if not self.available:
             return
         try:
-            await self._redis.set(key, json.dumps(value, ensure_ascii=False), ex=ttl)
+            payload = json.dumps(value, ensure_ascii=False)
+            await self._call(lambda: self._redis.set(key, payload, ex=ttl))
+        except CircuitOpenError:
+            return
         except Exception:
             logger.warning("Cache set failed for key=%s", key, exc_info=True)
 
+    async def add(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Set key only if it does not exist yet. Returns True if it was set."""
+        if not self.available:
+            return False
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+            return bool(await self._call(lambda: self._redis.set(key, payload, ex=ttl, nx=True)))
+        except CircuitOpenError:
+            return False
+        except Exception:
+            logger.warning("Cache add failed for key=%s", key, exc_info=True)
+            return False
+
+    async def exists(self, key: str) -> bool:
+        if not self.available:
+            return False
+        try:
+            return bool(await self._call(lambda: self._redis.exists(key)))
+        except CircuitOpenError:
+            return False
+        except Exception:
+            logger.warning("Cache exists failed for key=%s", key, exc_info=True)
+            return False
+
     async def delete(self, key: str) -> None:
         if not self.available:
             return
         try:
-            await self._redis.delete(key)
+            await self._call(lambda: self._redis.delete(key))
+        except CircuitOpenError:
+            return
         except Exception:
             logger.warning("Cache delete failed for key=%s", key, exc_info=True)
 
@@ -0,0 +1,94 @@
+"""Precomputed celebrity charts.
+
+Celebrity birth data is static, so each celebrity's chart and its prompt block
+(format_saju_for_prompt output) are computed once when the index is built at
+startup. A celebrity compatibility request then only calculates the user's side.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from app.data.celebrities import Celebrity, current_dataset
+from app.engine.constants import OH_HAENG_HANJA
+from app.engine.models import SajuData
+from app.engine.relations import BRANCH_INDEX, STEM_INDEX
+from app.llm.formatter import format_saju_for_prompt
+from app.models.request import BirthInput
+
+
+def celebrity_birth_input(celebrity: Celebrity) -> BirthInput:
+    """Convert a Celebrity record to BirthInput (hour=None, solar)."""
+    return BirthInput(
+        year=celebrity.year,
+        month=celebrity.month,
+        day=celebrity.day,
+        hour=None,
+        gender=celebrity.gender,
+    )
+
+
+@dataclass(frozen=True)
+class CelebrityChart:
+    celebrity: Celebrity
+    saju: SajuData
+    prompt_data: str
+
+
+class ChartColumns:
+    """Pillar indices and element counts of a list of charts, one byte per chart.
+
+    Lets pair scoring (see celebrity_match) run over many charts without
+    touching SajuData.
+    """
+
+    def __init__(self, sajus: Sequence[SajuData]):
+        self.day_stems = bytes(STEM_INDEX[s.day_pillar.gan] for s in sajus)
+        self.day_branches = bytes(BRANCH_INDEX[s.day_pillar.zhi] for s in sajus)
+        self.year_branches = bytes(BRANCH_INDEX[s.year_pillar.zhi] for s in sajus)
+        self.month_branches = bytes(BRANCH_INDEX[s.month_pillar.zhi] for s in sajus)
+        # elements[e][i]: count of element e (OH_HAENG_HANJA order) in chart i
+        self.elements = tuple(bytes(s.element_counts[e] for s in sajus) for e in OH_HAENG_HANJA)
+
+
+class CelebrityChartIndex(ChartColumns):
+    """Immutable id -> CelebrityChart mapping, in database order.
+
+    Also keeps the columns of every chart, for ranking without touching SajuData.
+    """
+
+    def __init__(self, charts: Iterable[CelebrityChart]):
+        self._by_id = MappingProxyType({chart.celebrity.id: chart for chart in charts})
+        self._charts = tuple(self._by_id.values())
+        super().__init__([chart.saju for chart in self._charts])
+
+    @classmethod
+    def build(
+        cls,
+        calculate: Callable[[BirthInput], SajuData],
+        celebrities: Iterable[Celebrity] | None = None,
+    ) -> CelebrityChartIndex:
+        """Calculate every celebrity's chart with `calculate` (e.g. CompatibilityService.calculate_person).
+
+        `celebrities` defaults to the dataset currently served by app.data.celebrities.
+        """
+        if celebrities is None:
+            celebrities = current_dataset().store
+        charts = []
+        for celebrity in celebrities:
+            saju = calculate(celebrity_birth_input(celebrity))
+            charts.append(CelebrityChart(celebrity, saju, format_saju_for_prompt(saju)))
+        return cls(charts)
+
+    def get(self, celebrity_id: str) -> CelebrityChart | None:
+        return self._by_id.get(celebrity_id)
+
+    def chart_at(self, position: int) -> CelebrityChart:
+        return self._charts[position]
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[CelebrityChart]:
+        return iter(self._charts)
@@ -0,0 +1,169 @@
+"""LLM-free "best match" ranking of a user against every indexed celebrity.
+
+The score is a weighted sum of traditional chart relations:
+
+    day stems     천간합 +3, 천간충 -2, one day master generating the other +1
+    day branches  육합 +3, 삼합 +2, 충 -3
+    year branches 육합 +2, 삼합 +1, 충 -2 (띠 궁합)
+    month branches 육합 +1, 삼합 +1, 충 -1
+    elements      +1 per element unit the celebrity supplies where the user has
+                  fewer than two (오행 보완)
+
+normalized to 0-100. Every term depends on a single celebrity feature, so the
+user's side is turned into small lookup rows once per request and each
+celebrity costs a few table lookups over the index's byte columns. The same
+rows and columns score a group's pairs (see group_match).
+"""
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+
+from app.engine.constants import CHEON_GAN_HANJA, JI_JI_HANJA, OH_HAENG_HANJA
+from app.engine.models import SajuData
+from app.engine.relations import (
+    BRANCH_CHUNG,
+    BRANCH_INDEX,
+    BRANCH_RELATION_LABELS,
+    BRANCH_RELATIONS,
+    BRANCH_SAMHAP,
+    BRANCH_YUKHAP,
+    GENERATES,
+    STEM_CHUNG,
+    STEM_HAP,
+    STEM_INDEX,
+    STEM_RELATION_LABELS,
+    STEM_RELATIONS,
+    stem_element,
+)
+from app.services.celebrity_index import CelebrityChart, CelebrityChartIndex, ChartColumns
+
+_STEM_WEIGHTS = {STEM_HAP: 3, STEM_CHUNG: -2}
+_GENERATING_WEIGHT = 1
+_DAY_BRANCH_WEIGHTS = {BRANCH_YUKHAP: 3, BRANCH_SAMHAP: 2, BRANCH_CHUNG: -3}
+_YEAR_BRANCH_WEIGHTS = {BRANCH_YUKHAP: 2, BRANCH_SAMHAP: 1, BRANCH_CHUNG: -2}
+_MONTH_BRANCH_WEIGHTS = {BRANCH_YUKHAP: 1, BRANCH_SAMHAP: 1, BRANCH_CHUNG: -1}
+# A user with fewer than this many of an element gains from a partner who has it
+_ELEMENT_NEED = 2
+
+_BRANCH_TERMS = (
+    ("일지", "day_branches", _DAY_BRANCH_WEIGHTS),
+    ("띠", "year_branches", _YEAR_BRANCH_WEIGHTS),
+    ("월지", "month_branches", _MONTH_BRANCH_WEIGHTS),
+)
+RAW_MIN = min(_STEM_WEIGHTS.values()) + sum(min(w.values()) for _, _, w in _BRANCH_TERMS)
+_RAW_MAX_FIXED = (
+    max(_STEM_WEIGHTS.values()) + _GENERATING_WEIGHT + sum(max(w.values()) for _, _, w in _BRANCH_TERMS)
+)
+
+
+@dataclass(frozen=True)
+class CelebrityMatch:
+    chart: CelebrityChart
+    score: int  # 0-100
+    highlights: tuple[str, ...]
+
+
+class ChartRows:
+    """Lookup rows of one chart: score contribution of each partner feature value."""
+
+    def __init__(self, user: SajuData):
+        self.day_stem = STEM_INDEX[user.day_pillar.gan]
+        user_element = stem_element(self.day_stem)
+        self.stem = [
+            _STEM_WEIGHTS.get(STEM_RELATIONS[self.day_stem][stem], 0)
+            + (_GENERATING_WEIGHT if _generating(user_element, stem_element(stem)) else 0)
+            for stem in range(10)
+        ]
+        self.branch_indices = {
+            "day_branches": BRANCH_INDEX[user.day_pillar.zhi],
+            "year_branches": BRANCH_INDEX[user.year_pillar.zhi],
+            "month_branches": BRANCH_INDEX[user.month_pillar.zhi],
+        }
+        self.branches = {
+            column: [weights.get(BRANCH_RELATIONS[self.branch_indices[column]][b], 0) for b in range(12)]
+            for _, column, weights in _BRANCH_TERMS
+        }
+        # (element index, units needed) for elements the user is short of
+        self.needs = [
+            (i, _ELEMENT_NEED - user.element_counts[element])
+            for i, element in enumerate(OH_HAENG_HANJA)
+            if user.element_counts[element] < _ELEMENT_NEED
+        ]
+        self.raw_max = _RAW_MAX_FIXED + sum(need for _, need in self.needs)
+
+
+def _generating(a: int, b: int) -> bool:
+    return GENERATES[a] == b or GENERATES[b] == a
+
+
+def raw_scores(rows: ChartRows, index: ChartColumns) -> list[int]:
+    """Raw score of the rows' chart against every chart of the columns."""
+    stem, day, year, month = (
+        rows.stem,
+        rows.branches["day_branches"],
+        rows.branches["year_branches"],
+        rows.branches["month_branches"],
+    )
+    scores = [
+        stem[s] + day[d] + year[y] + month[m]
+        for s, d, y, m in zip(index.day_stems, index.day_branches, index.year_branches, index.month_branches)
+    ]
+    for element, need in rows.needs:
+        column = index.elements[element]
+        scores = [score + min(need, count) for score, count in zip(scores, column)]
+    return scores
+
+
+def normalized(rows: ChartRows, raw: int) -> int:
+    """Raw score on the 0-100 scale of the rows' chart."""
+    return round(100 * (raw - RAW_MIN) / (rows.raw_max - RAW_MIN))
+
+
+def pair_highlights(rows: ChartRows, index: ChartColumns, position: int) -> tuple[str, ...]:
+    """Relations behind the score of the rows' chart against chart `position`."""
+    notes = []
+    user_stem = rows.day_stem
+    celeb_stem = index.day_stems[position]
+    relation = STEM_RELATIONS[user_stem][celeb_stem]
+    if relation in STEM_RELATION_LABELS:
+        notes.append(f"일간 {CHEON_GAN_HANJA[user_stem]}{CHEON_GAN_HANJA[celeb_stem]} {STEM_RELATION_LABELS[relation]}")
+    if _generating(stem_element(user_stem), stem_element(celeb_stem)):
+        notes.append("일간 오행 상생")
+    for label, column, _ in _BRANCH_TERMS:
+        user_branch = rows.branch_indices[column]
+        celeb_branch = getattr(index, column)[position]
+        relation = BRANCH_RELATIONS[user_branch][celeb_branch]
+        if relation in BRANCH_RELATION_LABELS:
+            notes.append(
+                f"{label} {JI_JI_HANJA[user_branch]}{JI_JI_HANJA[celeb_branch]} {BRANCH_RELATION_LABELS[relation]}"
+            )
+    supplied = [OH_HAENG_HANJA[e] for e, _ in rows.needs if index.elements[e][position] > 0]
+    if supplied:
+        notes.append(f"오행 보완: {''.join(supplied)}")
+    return tuple(notes)
+
+
+def rank_celebrities(
+    user: SajuData,
+    index: CelebrityChartIndex,
+    *,
+    limit: int = 10,
+    gender: str | None = None,
+) -> list[CelebrityMatch]:
+    """Return the `limit` best-matching celebrities, best first (ties keep index order)."""
+    rows = ChartRows(user)
+    scores = raw_scores(rows, index)
+    positions = range(len(scores))
+    if gender is not None:
+        positions = [i for i in positions if index.chart_at(i).celebrity.gender == gender]
+
+    best = heapq.nsmallest(limit, positions, key=lambda i: (-scores[i], i))
+    return [
+        CelebrityMatch(
+            chart=index.chart_at(i),
+            score=normalized(rows, scores[i]),
+            highlights=pair_highlights(rows, index, i),
+        )
+        for i in best
+    ]
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-from app.data.celebrities import Celebrity, get_celebrity_by_id
+import asyncio
+import logging
+
+from app.data.celebrities import Celebrity, activate_dataset, check_for_update
 from app.engine.models import SajuData
 from app.llm.prompts.celebrity_compatibility import CELEBRITY_COMPATIBILITY_PROMPT
 from app.middleware.error_handler import SajuError
 from app.models.request import BirthInput
+from app.services.celebrity_index import CelebrityChartIndex, celebrity_birth_input
+from app.services.celebrity_match import CelebrityMatch, rank_celebrities
 from app.services.compatibility_service import CompatibilityService
 
+logger = logging.getLogger(__name__)
+
 
 class CelebrityNotFoundError(SajuError):
     """Raised when a celebrity ID does not match any entry."""
@@ -19,21 +26,38 @@ class CelebrityNotFoundError(SajuError):
 
 
 class CelebrityService:
-    """Thin wrapper over CompatibilityService for celebrity compatibility."""
+    """Thin wrapper over CompatibilityService for celebrity compatibility.
+
+    Celebrity charts come from a CelebrityChartIndex built at startup and
+    replaced when the dataset is reloaded.
+    """
 
-    def __init__(self, compatibility_service: CompatibilityService):
+    def __init__(self, compatibility_service: CompatibilityService, index: CelebrityChartIndex):
         self._compat = compatibility_service
+        self._index = index
+
+    @property
+    def index(self) -> CelebrityChartIndex:
+        return self._index
+
+    def replace_index(self, index: CelebrityChartIndex) -> None:
+        self._index = index
 
     @staticmethod
     def celebrity_to_birth_input(celebrity: Celebrity) -> BirthInput:
         """Convert a Celebrity record to BirthInput (hour=None, solar)."""
-        return BirthInput(
-            year=celebrity.year,
-            month=celebrity.month,
-            day=celebrity.day,
-            hour=None,
-            gender=celebrity.gender,
-        )
+        return celebrity_birth_input(celebrity)
+
+    def best_matches(
+        self,
+        user_birth: BirthInput,
+        *,
+        limit: int = 10,
+        gender: str | None = None,
+    ) -> tuple[SajuData, list[CelebrityMatch]]:
+        """Rank every indexed celebrity against the user by chart relations (no LLM call)."""
+        user_saju = self._compat.calculate_person(user_birth)
+        return user_saju, rank_celebrities(user_saju, self._index, limit=limit, gender=gender)
 
     async def analyze_compatibility(
         self,
@@ -47,15 +71,15 @@ class CelebrityService:
         Returns (user_saju, celebrity_saju, celebrity, interpretation).
         Raises CelebrityNotFoundError if the celebrity_id is invalid.
         """
-        celebrity = get_celebrity_by_id(celebrity_id)
-        if celebrity is None:
+        chart = self._index.get(celebrity_id)
+        if chart is None:
             raise CelebrityNotFoundError(celebrity_id)
+        celebrity = chart.celebrity
 
-        celeb_birth = self.celebrity_to_birth_input(celebrity)
-
-        user_saju, celeb_saju, interpretation = await self._compat.analyze(
-            person1=user_birth,
-            person2=celeb_birth,
+        user_saju = self._compat.calculate_person(user_birth)
+        interpretation = await self._compat.analyze_charts(
+            user_saju,
+            chart.saju,
             reading_type="celebrity_compatibility",
             prompt_template=CELEBRITY_COMPATIBILITY_PROMPT,
             prompt_kwargs={
@@ -63,6 +87,54 @@ class CelebrityService:
                 "celebrity_group": celebrity.group,
             },
             language=language,
+            person2_data=chart.prompt_data,
         )
 
-        return user_saju, celeb_saju, celebrity, interpretation
+        return user_saju, chart.saju, celebrity, interpretation
+
+
+class CelebrityDatasetWatcher:
+    """Polls the celebrity dataset file and hot-swaps it when it changes.
+
+    The new file is loaded and its charts are calculated in a worker thread
+    before anything is swapped, so requests keep being served from the old
+    version until the new one is complete.
+    """
+
+    def __init__(self, service: CelebrityService, *, interval_seconds: float):
+        self._service = service
+        self._interval = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.check_once()
+            except Exception:
+                logger.exception("Celebrity dataset reload failed")
+
+    async def check_once(self) -> bool:
+        """Reload the dataset if its file changed. Returns True if it was swapped."""
+        dataset = await asyncio.to_thread(check_for_update)
+        if dataset is None:
+            return False
+        index = await asyncio.to_thread(
+            CelebrityChartIndex.build, self._service._compat.calculate_person, dataset.store,
+        )
+        activate_dataset(dataset)
+        self._service.replace_index(index)
+        logger.info("Celebrity dataset reloaded: %d entries from %s", len(index), dataset.path)
+        return True
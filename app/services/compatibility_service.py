@@ -2,12 +2,48 @@ from __future__ import annotations
 
 from app.config import settings
 from app.engine.calculator import SajuCalculator
+from app.engine.fingerprint import chart_fingerprint
 from app.engine.models import SajuData
 from app.llm.client import LLMClient
-from app.llm.formatter import format_saju_for_prompt
-from app.llm.prompts.compatibility import COMPATIBILITY_PROMPT
+from app.llm.formatter import (
+    format_group_summary,
+    format_partner_interactions,
+    format_saju_for_prompt,
+)
+from app.llm.prompts.compatibility import COMPATIBILITY_PROMPT, GROUP_COMPATIBILITY_PROMPT
 from app.models.request import BirthInput
+from app.services.cache_keys import reading_cache_key
 from app.services.cache_service import CacheService
+from app.services.group_match import GroupMatrix, score_group
+from app.services.saju_service import calculate_birth
+
+# Pair readings where swapping the two people asks the same question. Their
+# charts are put in a canonical order so A-B and B-A share one cache entry.
+# Directional readings (owner/pet, user/celebrity) keep request order.
+SYMMETRIC_READING_TYPES = frozenset({
+    "compatibility",
+    "marriage_timing",
+    "marriage_life_forecast",
+    "marriage_finance",
+    "marriage_auspicious_dates",
+})
+
+
+def swaps_pair(reading_type: str, saju1: SajuData, saju2: SajuData) -> bool:
+    """Whether the prompt presents saju2 as person 1 (canonical order of a symmetric reading)."""
+    return reading_type in SYMMETRIC_READING_TYPES and chart_fingerprint(saju2) < chart_fingerprint(saju1)
+
+
+def prompt_order(
+    reading_type: str, saju1: SajuData, saju2: SajuData,
+) -> tuple[SajuData, SajuData, bool]:
+    """The pair in the order its prompt names them (사람 1, 사람 2) and whether that swaps it.
+
+    Responses list the people in this order so that they match the interpretation.
+    """
+    if swaps_pair(reading_type, saju1, saju2):
+        return saju2, saju1, True
+    return saju1, saju2, False
 
 
 class CompatibilityService:
@@ -23,19 +59,8 @@ class CompatibilityService:
         self._llm = llm_client
         self._cache = cache
 
-    def _calculate_person(self, birth: BirthInput) -> SajuData:
-        return self._calculator.calculate(
-            year=birth.year,
-            month=birth.month,
-            day=birth.day,
-            hour=birth.hour,
-            minute=birth.minute,
-            gender_male=birth.gender == "male",
-            calendar_type=birth.calendar_type.value,
-            is_leap_month=birth.is_leap_month,
-            use_night_zi=birth.use_night_zi,
-            use_true_solar_time=birth.use_true_solar_time,
-        )
+    def calculate_person(self, birth: BirthInput) -> SajuData:
+        return calculate_birth(self._calculator, birth)
 
     async def analyze(
         self,
@@ -49,6 +74,9 @@ class CompatibilityService:
     ) -> tuple[SajuData, SajuData, str]:
         """Analyze compatibility between two people.
 
+        The charts are returned in prompt order (see prompt_order), which is
+        how the interpretation names them.
+
         Args:
             person1: First person's birth input.
             person2: Second person's birth input.
@@ -57,26 +85,59 @@ class CompatibilityService:
             prompt_kwargs: Extra format kwargs merged into the prompt template.
             language: Response language code (e.g. 'ko', 'en', 'ja').
         """
-        saju1 = self._calculate_person(person1)
-        saju2 = self._calculate_person(person2)
-
-        cache_key = CacheService.make_key(
-            "compat",
-            p1_y=saju1.solar_year, p1_m=saju1.solar_month, p1_d=saju1.solar_day,
-            p1_h=saju1.solar_hour, p1_g=person1.gender.value,
-            p2_y=saju2.solar_year, p2_m=saju2.solar_month, p2_d=saju2.solar_day,
-            p2_h=saju2.solar_hour, p2_g=person2.gender.value,
-            lang=language,
+        saju1, saju2, _ = prompt_order(
+            reading_type, self.calculate_person(person1), self.calculate_person(person2),
+        )
+        interpretation = await self.analyze_charts(
+            saju1, saju2,
+            reading_type=reading_type,
+            prompt_template=prompt_template,
+            prompt_kwargs=prompt_kwargs,
+            language=language,
+        )
+        return saju1, saju2, interpretation
+
+    async def analyze_charts(
+        self,
+        saju1: SajuData,
+        saju2: SajuData,
+        *,
+        reading_type: str = "compatibility",
+        prompt_template: str | None = None,
+        prompt_kwargs: dict[str, str] | None = None,
+        language: str = "ko",
+        person1_data: str | None = None,
+        person2_data: str | None = None,
+    ) -> str:
+        """Analyze compatibility between two already calculated charts.
+
+        person1_data/person2_data are optional pre-formatted prompt blocks
+        (format_saju_for_prompt output) for charts that are reused across
+        requests. Other arguments are as in analyze().
+        """
+        # Prompt order
+        first, second = (saju1, person1_data), (saju2, person2_data)
+        if swaps_pair(reading_type, saju1, saju2):
+            first, second = second, first
+
+        cache_key = reading_cache_key(
+            reading_type, first[0], second[0], language=language, context=prompt_kwargs or {},
         )
 
         cached = await self._cache.get(cache_key)
         if cached:
-            return saju1, saju2, cached
+            return cached
 
         template = prompt_template if prompt_template is not None else COMPATIBILITY_PROMPT
+        # The cross-chart relations follow the second person's block, so a
+        # precomputed block is extended rather than re-rendered
+        if second[1]:
+            person2_data = "\n\n".join((second[1], "\n".join(format_partner_interactions(second[0], first[0]))))
+        else:
+            person2_data = format_saju_for_prompt(second[0], partner=first[0])
         format_args: dict[str, str] = {
-            "person1_data": format_saju_for_prompt(saju1),
-            "person2_data": format_saju_for_prompt(saju2),
+            "person1_data": first[1] or format_saju_for_prompt(first[0]),
+            "person2_data": person2_data,
         }
         if prompt_kwargs:
             format_args = {**format_args, **prompt_kwargs}
@@ -86,4 +147,44 @@ class CompatibilityService:
         )
 
         await self._cache.set(cache_key, interpretation, ttl=settings.cache_ttl_interpretation)
-        return saju1, saju2, interpretation
+        return interpretation
+
+    def group_matrix(self, births: list[BirthInput]) -> tuple[list[SajuData], GroupMatrix]:
+        """Calculate each member's chart once and score every pair (no LLM call)."""
+        sajus = [self.calculate_person(birth) for birth in births]
+        matrix = score_group(
+            sajus,
+            cluster_threshold=settings.group_cluster_threshold,
+            pair_limit=settings.group_pair_limit,
+        )
+        return sajus, matrix
+
+    async def group_summary(
+        self,
+        sajus: list[SajuData],
+        labels: list[str],
+        matrix: GroupMatrix,
+        *,
+        language: str = "ko",
+    ) -> str:
+        """Narrative of a group matrix. The prompt carries the group summary only, not N charts."""
+        reading_type = "group_compatibility"
+        cache_key = reading_cache_key(
+            reading_type, *sajus, language=language,
+            labels=labels,
+            cluster_threshold=settings.group_cluster_threshold,
+            pair_limit=settings.group_pair_limit,
+        )
+        cached = await self._cache.get(cache_key)
+        if cached:
+            return cached
+
+        prompt = GROUP_COMPATIBILITY_PROMPT.format(
+            member_count=len(sajus),
+            group_data=format_group_summary(labels, sajus, matrix),
+        )
+        interpretation = await self._llm.generate(
+            prompt, reading_type=reading_type, language=language,
+        )
+        await self._cache.set(cache_key, interpretation, ttl=settings.cache_ttl_interpretation)
+        return interpretation
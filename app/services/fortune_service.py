@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from datetime import date
-
-from lunar_python import Solar
+from collections import OrderedDict
+from datetime import date, timedelta
 
 from app.config import settings
+from app.engine.auspicious import DateScorer, DayScore, HourScore, HourScorer
 from app.engine.calculator import SajuCalculator
+from app.engine.fingerprint import chart_fingerprint
+from app.engine.ganzhi_calendar import GanZhiCalendar
+from app.engine.luck import LuckTimeline, luck_timeline
 from app.engine.models import SajuData
 from app.llm.client import LLMClient
-from app.llm.formatter import format_saju_for_prompt
+from app.llm.formatter import format_day_score, format_hour_score, format_saju_for_prompt
 from app.llm.prompts.fortune import DAILY_FORTUNE_PROMPT, MONTHLY_FORTUNE_PROMPT
 from app.llm.prompts.timing import (
     TIMING_BEST_HOURS_PROMPT,
@@ -16,7 +19,9 @@ from app.llm.prompts.timing import (
     TIMING_NOW_PROMPT,
 )
 from app.models.request import BirthInput
+from app.services.cache_keys import reading_cache_key
 from app.services.cache_service import CacheService
+from app.services.saju_service import calculate_birth
 
 
 class FortuneService:
@@ -27,40 +32,67 @@ class FortuneService:
         calculator: SajuCalculator,
         llm_client: LLMClient,
         cache: CacheService,
+        calendar: GanZhiCalendar | None = None,
     ):
         self._calculator = calculator
         self._llm = llm_client
         self._cache = cache
+        self._calendar = calendar or GanZhiCalendar()
+        # (chart fingerprint, start year, start month) -> timeline, least recently used first
+        self._timelines: OrderedDict[tuple[str, int, int], LuckTimeline] = OrderedDict()
 
     def _calculate_person(self, birth: BirthInput) -> SajuData:
-        return self._calculator.calculate(
-            year=birth.year,
-            month=birth.month,
-            day=birth.day,
-            hour=birth.hour,
-            minute=birth.minute,
-            gender_male=birth.gender == "male",
-            calendar_type=birth.calendar_type.value,
-            is_leap_month=birth.is_leap_month,
-            use_night_zi=birth.use_night_zi,
-            use_true_solar_time=birth.use_true_solar_time,
+        return calculate_birth(self._calculator, birth)
+
+    def rank_dates(
+        self,
+        charts: list[SajuData],
+        start: date,
+        end: date,
+        *,
+        months: list[int] | None = None,
+        limit: int = 10,
+    ) -> list[DayScore]:
+        """Best days in start..end for all charts together (rule-based, no LLM)."""
+        return DateScorer(charts).rank(self._calendar, start, end, months=months, limit=limit)
+
+    def luck_timeline(self, saju: SajuData, start_year: int, start_month: int = 1) -> LuckTimeline:
+        """대운/세운/월운 of a chart from a month on, over the configured horizon.
+
+        Kept in memory per chart, so the fortune, career, marriage and pet
+        readings of one user compute it once.
+        """
+        key = (chart_fingerprint(saju), start_year, start_month)
+        timeline = self._timelines.get(key)
+        if timeline is not None:
+            self._timelines.move_to_end(key)
+            return timeline
+        timeline = luck_timeline(
+            saju, self._calendar, start_year, start_month,
+            years=settings.luck_timeline_years, months=settings.luck_timeline_months,
         )
+        self._timelines[key] = timeline
+        if len(self._timelines) > settings.luck_timeline_cache_size:
+            self._timelines.popitem(last=False)
+        return timeline
+
+    def prompt_block(self, saju: SajuData, start_year: int, start_month: int = 1) -> str:
+        """format_saju_for_prompt output with the luck timeline from start_year/start_month."""
+        return format_saju_for_prompt(saju, luck=self.luck_timeline(saju, start_year, start_month))
 
     def _get_target_period_info(
         self, target_year: int, target_month: int, target_day: int | None = None
     ) -> str:
         """Get the Gan-Zhi info for a target date/month."""
         day = target_day if target_day else 15  # mid-month for monthly
-        solar = Solar(target_year, target_month, day, 12, 0, 0)
-        lunar = solar.getLunar()
-        ec = lunar.getEightChar()
+        pillars = self._calendar.pillars(target_year, target_month, day, 12)
 
         lines = [f"대상 연도: {target_year}년"]
-        lines.append(f"연간지: {ec.getYear()}")
-        lines.append(f"월간지: {ec.getMonth()}")
+        lines.append(f"연간지: {pillars.year}")
+        lines.append(f"월간지: {pillars.month}")
         if target_day:
             lines.append(f"대상 날짜: {target_year}년 {target_month}월 {target_day}일")
-            lines.append(f"일간지: {ec.getDay()}")
+            lines.append(f"일간지: {pillars.day}")
         else:
             lines.append(f"대상 월: {target_year}년 {target_month}월")
 
@@ -76,23 +108,33 @@ class FortuneService:
     ) -> tuple[SajuData, str, str]:
         """Generate monthly fortune."""
         saju = self._calculate_person(birth)
-        target_date_str = f"{target_year}-{target_month:02d}"
+        interpretation = await self.monthly_interpretation(saju, target_year, target_month, language=language)
+        return saju, interpretation, f"{target_year}-{target_month:02d}"
 
-        cache_key = CacheService.make_key(
-            "monthly",
-            y=saju.solar_year, m=saju.solar_month, d=saju.solar_day,
-            h=saju.solar_hour, g=birth.gender.value,
+    async def monthly_interpretation(
+        self,
+        saju: SajuData,
+        target_year: int,
+        target_month: int,
+        *,
+        language: str = "ko",
+    ) -> str:
+        """Monthly fortune of an already calculated chart."""
+        cache_key = reading_cache_key(
+            "monthly", saju, language=language,
             ty=target_year, tm=target_month,
-            lang=language,
         )
 
         cached = await self._cache.get(cache_key)
         if cached:
-            return saju, cached, target_date_str
+            return cached
 
         period_info = self._get_target_period_info(target_year, target_month)
         prompt = MONTHLY_FORTUNE_PROMPT.format(
-            saju_data=format_saju_for_prompt(saju),
+            saju_data=format_saju_for_prompt(
+                saju, target=self._target_pillars(target_year, target_month),
+                luck=self.luck_timeline(saju, target_year, target_month),
+            ),
             target_period=period_info,
         )
         interpretation = await self._llm.generate(
@@ -100,7 +142,33 @@ class FortuneService:
         )
 
         await self._cache.set(cache_key, interpretation, ttl=settings.cache_ttl_fortune)
-        return saju, interpretation, target_date_str
+        return interpretation
+
+    @staticmethod
+    def _daily_cache_key(
+        saju: SajuData,
+        target_year: int,
+        target_month: int,
+        target_day: int,
+        language: str,
+    ) -> str:
+        return reading_cache_key(
+            "daily", saju, language=language,
+            ty=target_year, tm=target_month, td=target_day,
+        )
+
+    def daily_cache_key(
+        self,
+        birth: BirthInput,
+        target_year: int,
+        target_month: int,
+        target_day: int,
+        *,
+        language: str = "ko",
+    ) -> str:
+        """Cache key under which daily() stores this profile's fortune."""
+        saju = self._calculate_person(birth)
+        return self._daily_cache_key(saju, target_year, target_month, target_day, language)
 
     async def daily(
         self,
@@ -115,13 +183,7 @@ class FortuneService:
         saju = self._calculate_person(birth)
         target_date_str = f"{target_year}-{target_month:02d}-{target_day:02d}"
 
-        cache_key = CacheService.make_key(
-            "daily",
-            y=saju.solar_year, m=saju.solar_month, d=saju.solar_day,
-            h=saju.solar_hour, g=birth.gender.value,
-            ty=target_year, tm=target_month, td=target_day,
-            lang=language,
-        )
+        cache_key = self._daily_cache_key(saju, target_year, target_month, target_day, language)
 
         cached = await self._cache.get(cache_key)
         if cached:
@@ -129,7 +191,9 @@ class FortuneService:
 
         period_info = self._get_target_period_info(target_year, target_month, target_day)
         prompt = DAILY_FORTUNE_PROMPT.format(
-            saju_data=format_saju_for_prompt(saju),
+            saju_data=format_saju_for_prompt(
+                saju, target=self._target_pillars(target_year, target_month, target_day),
+            ),
             target_period=period_info,
         )
         interpretation = await self._llm.generate(
@@ -140,6 +204,23 @@ class FortuneService:
         await self._cache.set(cache_key, interpretation, ttl=settings.cache_ttl_fortune)
         return saju, interpretation, target_date_str
 
+    def _target_pillars(
+        self,
+        target_year: int,
+        target_month: int,
+        target_day: int | None = None,
+        target_hour: int | None = None,
+    ) -> list[tuple[str, str]]:
+        """(label, gan-zhi) pillars of the target period, for format_saju_for_prompt."""
+        day = target_day if target_day else 15
+        pillars = self._calendar.pillars(target_year, target_month, day, 12 if target_hour is None else target_hour)
+        target = [("세운", pillars.year), ("월운", pillars.month)]
+        if target_day:
+            target.append(("일진", pillars.day))
+        if target_hour is not None:
+            target.append(("시진", pillars.time))
+        return target
+
     def _get_target_time_info(
         self,
         target_year: int,
@@ -149,61 +230,66 @@ class FortuneService:
     ) -> str:
         """Get Gan-Zhi info for a target date/time including hour pillar."""
         hour = target_hour if target_hour is not None else 12
-        solar = Solar(target_year, target_month, target_day, hour, 0, 0)
-        lunar = solar.getLunar()
-        ec = lunar.getEightChar()
+        pillars = self._calendar.pillars(target_year, target_month, target_day, hour)
 
         lines = [
             f"대상 날짜: {target_year}년 {target_month}월 {target_day}일",
-            f"연간지: {ec.getYear()}",
-            f"월간지: {ec.getMonth()}",
-            f"일간지: {ec.getDay()}",
+            f"연간지: {pillars.year}",
+            f"월간지: {pillars.month}",
+            f"일간지: {pillars.day}",
         ]
         if target_hour is not None:
             shi_chen = _hour_to_shi_chen(target_hour)
             lines.append(f"대상 시간: {target_hour}시 ({shi_chen})")
-            lines.append(f"시간지: {ec.getTime()}")
+            lines.append(f"시간지: {pillars.time}")
+
+        return "\n".join(lines)
 
+    def _dday_score_info(self, saju: SajuData, target: date) -> str:
+        """Rule-based score of the D-day and better days around it."""
+        scorer = DateScorer([saju])
+        day_score = scorer.score(self._calendar, target)
+        window = timedelta(days=_DDAY_WINDOW_DAYS)
+        better = [
+            s for s in scorer.rank(self._calendar, target - window, target + window, limit=_DDAY_ALTERNATIVES)
+            if s.score > day_score.score
+        ]
+        lines = ["## 택일 점수 (규칙 계산, 확정)", format_day_score(day_score)]
+        if better:
+            lines.append(f"앞뒤 {_DDAY_WINDOW_DAYS}일 중 점수가 더 높은 날:")
+            lines.extend(format_day_score(s) for s in better)
         return "\n".join(lines)
 
+    def _hour_scores(
+        self, saju: SajuData, target_year: int, target_month: int, target_day: int
+    ) -> tuple[str, list[HourScore]]:
+        """Day pillar of a target date and the rule-based score of its 12 shi-chen."""
+        day_pillar = self._calendar.pillars(target_year, target_month, target_day, 12).day
+        hour_pillars = self._calendar.shi_chen_pillars(target_year, target_month, target_day)
+        return day_pillar, HourScorer(saju).score(day_pillar, hour_pillars)
+
     def _get_all_hours_info(
-        self, target_year: int, target_month: int, target_day: int
+        self, target_year: int, target_month: int, target_day: int, day_pillar: str, scores: list[HourScore]
     ) -> str:
-        """Get Gan-Zhi info for all 12 shi-chen of a target date."""
-        solar_mid = Solar(target_year, target_month, target_day, 12, 0, 0)
-        lunar_mid = solar_mid.getLunar()
-        ec_mid = lunar_mid.getEightChar()
-
+        """Target date and its 12 shi-chen, ranked by score."""
         lines = [
             f"대상 날짜: {target_year}년 {target_month}월 {target_day}일",
-            f"일간지: {ec_mid.getDay()}",
+            f"일간지: {day_pillar}",
             "",
-            "## 12시진 간지",
-        ]
-
-        hours_info = [
-            (0, "자시(子時) 23:00-01:00"),
-            (2, "축시(丑時) 01:00-03:00"),
-            (4, "인시(寅時) 03:00-05:00"),
-            (6, "묘시(卯時) 05:00-07:00"),
-            (8, "진시(辰時) 07:00-09:00"),
-            (10, "사시(巳時) 09:00-11:00"),
-            (12, "오시(午時) 11:00-13:00"),
-            (14, "미시(未時) 13:00-15:00"),
-            (16, "신시(申時) 15:00-17:00"),
-            (18, "유시(酉時) 17:00-19:00"),
-            (20, "술시(戌時) 19:00-21:00"),
-            (22, "해시(亥時) 21:00-23:00"),
+            "## 12시진 점수 (규칙 계산, 확정, 점수순)",
         ]
-
-        for hour, name in hours_info:
-            solar = Solar(target_year, target_month, target_day, hour, 0, 0)
-            lunar = solar.getLunar()
-            ec = lunar.getEightChar()
-            lines.append(f"- {name}: {ec.getTime()}")
-
+        ranked = sorted(scores, key=lambda s: (-s.score, s.shi_chen))
+        lines.extend(format_hour_score(s, SHI_CHEN_LABELS[s.shi_chen]) for s in ranked)
         return "\n".join(lines)
 
+    def best_hours(
+        self, birth: BirthInput, target_year: int, target_month: int, target_day: int
+    ) -> tuple[SajuData, str, list[HourScore]]:
+        """Calculate the chart, the day pillar and the 12 shi-chen scores of a date, no LLM."""
+        saju = self._calculate_person(birth)
+        day_pillar, scores = self._hour_scores(saju, target_year, target_month, target_day)
+        return saju, day_pillar, scores
+
     async def timing_now(
         self,
         birth: BirthInput,
@@ -219,12 +305,9 @@ class FortuneService:
         shi_chen = _hour_to_shi_chen(target_hour)
         target_dt_str = f"{target_year}-{target_month:02d}-{target_day:02d} {target_hour:02d}:00 ({shi_chen})"
 
-        cache_key = CacheService.make_key(
-            "timing_now",
-            y=saju.solar_year, m=saju.solar_month, d=saju.solar_day,
-            h=saju.solar_hour, g=birth.gender.value,
+        cache_key = reading_cache_key(
+            "timing_now", saju, language=language,
             ty=target_year, tm=target_month, td=target_day, th=target_hour,
-            lang=language,
         )
 
         cached = await self._cache.get(cache_key)
@@ -235,7 +318,9 @@ class FortuneService:
             target_year, target_month, target_day, target_hour,
         )
         prompt = TIMING_NOW_PROMPT.format(
-            saju_data=format_saju_for_prompt(saju),
+            saju_data=format_saju_for_prompt(
+                saju, target=self._target_pillars(target_year, target_month, target_day, target_hour),
+            ),
             target_time=time_info,
         )
         interpretation = await self._llm.generate(
@@ -247,32 +332,30 @@ class FortuneService:
 
     async def timing_best_hours(
         self,
-        birth: BirthInput,
+        saju: SajuData,
         target_year: int,
         target_month: int,
         target_day: int,
+        day_pillar: str,
+        scores: list[HourScore],
         *,
         language: str = "ko",
-    ) -> tuple[SajuData, str, str]:
-        """Generate best hours analysis for a target date."""
-        saju = self._calculate_person(birth)
-        target_date_str = f"{target_year}-{target_month:02d}-{target_day:02d}"
-
-        cache_key = CacheService.make_key(
-            "timing_best_hours",
-            y=saju.solar_year, m=saju.solar_month, d=saju.solar_day,
-            h=saju.solar_hour, g=birth.gender.value,
+    ) -> str:
+        """Generate best hours analysis for a target date from its scores (see best_hours)."""
+        cache_key = reading_cache_key(
+            "timing_best_hours", saju, language=language,
             ty=target_year, tm=target_month, td=target_day,
-            lang=language,
         )
 
         cached = await self._cache.get(cache_key)
         if cached:
-            return saju, cached, target_date_str
+            return cached
 
-        hours_info = self._get_all_hours_info(target_year, target_month, target_day)
+        hours_info = self._get_all_hours_info(target_year, target_month, target_day, day_pillar, scores)
         prompt = TIMING_BEST_HOURS_PROMPT.format(
-            saju_data=format_saju_for_prompt(saju),
+            saju_data=format_saju_for_prompt(
+                saju, target=self._target_pillars(target_year, target_month, target_day),
+            ),
             target_time=hours_info,
         )
         interpretation = await self._llm.generate(
@@ -280,7 +363,7 @@ class FortuneService:
         )
 
         await self._cache.set(cache_key, interpretation, ttl=settings.cache_ttl_fortune)
-        return saju, interpretation, target_date_str
+        return interpretation
 
     async def timing_dday(
         self,
@@ -295,12 +378,9 @@ class FortuneService:
         saju = self._calculate_person(birth)
         target_date_str = f"{target_year}-{target_month:02d}-{target_day:02d}"
 
-        cache_key = CacheService.make_key(
-            "timing_dday",
-            y=saju.solar_year, m=saju.solar_month, d=saju.solar_day,
-            h=saju.solar_hour, g=birth.gender.value,
+        cache_key = reading_cache_key(
+            "timing_dday", saju, language=language,
             ty=target_year, tm=target_month, td=target_day,
-            lang=language,
         )
 
         cached = await self._cache.get(cache_key)
@@ -308,8 +388,11 @@ class FortuneService:
             return saju, cached, target_date_str
 
         time_info = self._get_target_time_info(target_year, target_month, target_day)
+        time_info += "\n\n" + self._dday_score_info(saju, date(target_year, target_month, target_day))
         prompt = TIMING_DDAY_PROMPT.format(
-            saju_data=format_saju_for_prompt(saju),
+            saju_data=format_saju_for_prompt(
+                saju, target=self._target_pillars(target_year, target_month, target_day),
+            ),
             target_time=time_info,
         )
         interpretation = await self._llm.generate(
@@ -320,6 +403,26 @@ class FortuneService:
         return saju, interpretation, target_date_str
 
 
+# Days searched on each side of a D-day for better alternatives
+_DDAY_WINDOW_DAYS = 7
+_DDAY_ALTERNATIVES = 3
+
+# Display labels for the shi-chen, in GanZhiCalendar.shi_chen_pillars order
+SHI_CHEN_LABELS = (
+    "자시(子時) 23:00-01:00",
+    "축시(丑時) 01:00-03:00",
+    "인시(寅時) 03:00-05:00",
+    "묘시(卯時) 05:00-07:00",
+    "진시(辰時) 07:00-09:00",
+    "사시(巳時) 09:00-11:00",
+    "오시(午時) 11:00-13:00",
+    "미시(未時) 13:00-15:00",
+    "신시(申時) 15:00-17:00",
+    "유시(酉時) 17:00-19:00",
+    "술시(戌時) 19:00-21:00",
+    "해시(亥時) 21:00-23:00",
+)
+
 _SHI_CHEN_NAMES = (
     "자시(子)", "축시(丑)", "인시(寅)", "묘시(卯)",
     "진시(辰)", "사시(巳)", "오시(午)", "미시(未)",
@@ -0,0 +1,109 @@
+"""LLM-free compatibility matrix of a group (team, family) with clustering.
+
+Every member's chart is calculated once and turned into the lookup rows and
+byte columns of celebrity_match, so the N x N matrix costs N passes of table
+lookups instead of N^2 pair readings. The score of a pair is the mean of the
+two directional scores (오행 보완 depends on whose elements are short).
+
+Members are grouped by average-linkage clustering: the two clusters with the
+highest mean pair score are merged until no merge reaches the threshold.
+"""
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from itertools import combinations
+
+from app.engine.models import SajuData
+from app.services.celebrity_index import ChartColumns
+from app.services.celebrity_match import ChartRows, normalized, pair_highlights, raw_scores
+
+
+@dataclass(frozen=True)
+class GroupPair:
+    first: int  # member positions, first < second
+    second: int
+    score: int  # 0-100
+    highlights: tuple[str, ...]  # as seen from the first member
+
+
+@dataclass(frozen=True)
+class GroupCluster:
+    members: tuple[int, ...]  # member positions, ascending
+    cohesion: int | None  # mean pair score inside the cluster, None for one member
+
+
+@dataclass(frozen=True)
+class GroupMatrix:
+    scores: tuple[tuple[int | None, ...], ...]  # symmetric, None on the diagonal
+    average: int  # mean pair score of the group
+    clusters: tuple[GroupCluster, ...]  # largest first
+    best_pairs: tuple[GroupPair, ...]
+    worst_pairs: tuple[GroupPair, ...]
+
+
+def _pair_scores(rows: list[ChartRows], columns: ChartColumns) -> list[list[int]]:
+    directional = [
+        [normalized(member, raw) for raw in raw_scores(member, columns)] for member in rows
+    ]
+    return [
+        [round((directional[i][j] + directional[j][i]) / 2) for j in range(len(rows))]
+        for i in range(len(rows))
+    ]
+
+
+def _clusters(scores: list[list[int]], threshold: int) -> list[GroupCluster]:
+    clusters = {i: [i] for i in range(len(scores))}
+    # Sum of pair scores between two clusters, keyed by cluster id
+    links = {(a, b): scores[a][b] for a, b in combinations(clusters, 2)}
+    while links:
+        a, b = max(links, key=lambda pair: (
+            links[pair] / (len(clusters[pair[0]]) * len(clusters[pair[1]])), -pair[0], -pair[1],
+        ))
+        if links[a, b] / (len(clusters[a]) * len(clusters[b])) < threshold:
+            break
+        clusters[a].extend(clusters.pop(b))
+        for c in clusters:
+            if c != a:
+                merged = links.pop((min(b, c), max(b, c)))
+                links[min(a, c), max(a, c)] += merged
+        del links[a, b]
+
+    result = []
+    for members in clusters.values():
+        members.sort()
+        pairs = list(combinations(members, 2))
+        cohesion = round(sum(scores[i][j] for i, j in pairs) / len(pairs)) if pairs else None
+        result.append(GroupCluster(tuple(members), cohesion))
+    result.sort(key=lambda cluster: (-len(cluster.members), cluster.members))
+    return result
+
+
+def score_group(
+    sajus: list[SajuData],
+    *,
+    cluster_threshold: int = 60,
+    pair_limit: int = 5,
+) -> GroupMatrix:
+    """Score every pair of a group, cluster it and pick its best and worst pairs."""
+    rows = [ChartRows(saju) for saju in sajus]
+    columns = ChartColumns(sajus)
+    scores = _pair_scores(rows, columns)
+    pairs = list(combinations(range(len(sajus)), 2))
+    best = heapq.nsmallest(pair_limit, pairs, key=lambda p: (-scores[p[0]][p[1]], p))
+    worst = heapq.nsmallest(pair_limit, pairs, key=lambda p: (scores[p[0]][p[1]], p))
+
+    def pair(first: int, second: int) -> GroupPair:
+        highlights = pair_highlights(rows[first], columns, second)
+        return GroupPair(first, second, scores[first][second], highlights)
+
+    return GroupMatrix(
+        scores=tuple(
+            tuple(None if i == j else score for j, score in enumerate(row))
+            for i, row in enumerate(scores)
+        ),
+        average=round(sum(scores[i][j] for i, j in pairs) / len(pairs)),
+        clusters=tuple(_clusters(scores, cluster_threshold)),
+        best_pairs=tuple(pair(*p) for p in best),
+        worst_pairs=tuple(pair(*p) for p in worst),
+    )
@@ -0,0 +1,263 @@
+"""Overnight pre-generation of next-day daily fortunes.
+
+Daily fortune traffic spikes every morning and each cold request waits on the
+LLM. DailyFortunePregenerator walks a list of active birth profiles and calls
+FortuneService.daily for the next day, which fills the exact cache keys the
+/api/v1/fortune/daily endpoint reads.
+
+Runs are resumable: a profile whose key is already cached is skipped, so
+re-running after a crash only generates what is still missing. LLM calls are
+paced to a requests-per-minute budget so the job stays within provider quotas
+and leaves headroom for live traffic.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from app.middleware.error_handler import CircuitOpenError, LLMOverloadedError
+from app.models.request import FortuneRequest
+from app.services.cache_service import CacheService
+from app.services.fortune_service import FortuneService
+from app.services.request_memo import request_scope
+
+logger = logging.getLogger(__name__)
+
+# Attempts per profile when the LLM is overloaded or its circuit is open
+_BUSY_ATTEMPTS = 3
+
+
+def load_profiles(path: str | Path) -> list[FortuneRequest]:
+    """Read active profiles from a JSON Lines file.
+
+    Each line is a FortuneRequest body, e.g. {"birth": {...}, "language": "ko"};
+    target date fields are ignored.
+    """
+    profiles = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                profiles.append(FortuneRequest.model_validate_json(line))
+    return profiles
+
+
+class RequestPacer:
+    """Spaces call starts evenly so at most `per_minute` begin each minute."""
+
+    def __init__(self, per_minute: float, *, clock: Callable[[], float] = time.monotonic):
+        self._interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._clock = clock
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        now = self._clock()
+        start = max(now, self._next)
+        self._next = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+@dataclass
+class PregenerationReport:
+    target_date: str
+    total: int = 0
+    generated: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+class DailyFortunePregenerator:
+    """Fills the daily fortune cache for a target date."""
+
+    def __init__(
+        self,
+        fortune_service: FortuneService,
+        cache: CacheService,
+        *,
+        requests_per_minute: float,
+        concurrency: int,
+        busy_backoff_seconds: float = 30.0,
+    ):
+        self._fortune = fortune_service
+        self._cache = cache
+        self._requests_per_minute = requests_per_minute
+        self._concurrency = concurrency
+        self._busy_backoff = busy_backoff_seconds
+
+    async def run(self, profiles: Iterable[FortuneRequest], target: date) -> PregenerationReport:
+        profiles = list(profiles)
+        report = PregenerationReport(target_date=target.isoformat(), total=len(profiles))
+        if not self._cache.available:
+            logger.warning("Cache unavailable. Skipping daily fortune pre-generation.")
+            return report
+
+        pacer = RequestPacer(self._requests_per_minute)
+        pending = iter(profiles)
+
+        async def worker() -> None:
+            # Workers share one iterator, so each profile is handled exactly once
+            for profile in pending:
+                await self._generate_one(profile, target, pacer, report)
+
+        await asyncio.gather(*(worker() for _ in range(max(self._concurrency, 1))))
+        logger.info("Daily fortune pre-generation finished: %s", report.snapshot())
+        return report
+
+    async def _generate_one(
+        self,
+        profile: FortuneRequest,
+        target: date,
+        pacer: RequestPacer,
+        report: PregenerationReport,
+    ) -> None:
+        # daily_cache_key and daily share one chart calculation
+        with request_scope():
+            await self._generate_profile(profile, target, pacer, report)
+
+    async def _generate_profile(
+        self,
+        profile: FortuneRequest,
+        target: date,
+        pacer: RequestPacer,
+        report: PregenerationReport,
+    ) -> None:
+        try:
+            key = self._fortune.daily_cache_key(
+                profile.birth, target.year, target.month, target.day, language=profile.language,
+            )
+        except Exception:
+            logger.warning("Skipping invalid profile %s", profile.birth, exc_info=True)
+            report.failed += 1
+            return
+
+        if await self._cache.exists(key):
+            report.skipped += 1
+            return
+
+        for attempt in range(1, _BUSY_ATTEMPTS + 1):
+            await pacer.wait()
+            try:
+                await self._fortune.daily(
+                    profile.birth, target.year, target.month, target.day,
+                    language=profile.language,
+                )
+            except (LLMOverloadedError, CircuitOpenError) as exc:
+                if attempt == _BUSY_ATTEMPTS:
+                    break
+                logger.info("LLM busy during pre-generation (%s), backing off", exc)
+                await asyncio.sleep(self._busy_backoff)
+                continue
+            except Exception:
+                logger.warning("Daily fortune pre-generation failed", exc_info=True)
+                break
+            report.generated += 1
+            return
+        report.failed += 1
+
+
+class DailyPregenerationScheduler:
+    """Runs the pre-generator every night at `hour` (server local time).
+
+    A done marker per target date makes the job run once per night even with
+    several workers or restarts. A run lock keeps workers from running
+    concurrently. The lock is refreshed while a run is in progress, so after
+    a crash it expires and the next attempt resumes where the last one stopped.
+    A run in which any profile failed is not marked done either, so the next
+    attempt retries the failed profiles.
+    """
+
+    def __init__(
+        self,
+        pregenerator: DailyFortunePregenerator,
+        cache: CacheService,
+        profiles_path: str | Path,
+        *,
+        hour: int,
+        lock_seconds: int,
+        now: Callable[[], datetime] = datetime.now,
+    ):
+        self._pregenerator = pregenerator
+        self._cache = cache
+        self._profiles_path = profiles_path
+        self._hour = hour
+        self._lock_seconds = lock_seconds
+        self._now = now
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _key(target: date, suffix: str) -> str:
+        return f"saju:pregen:daily:{target.isoformat()}:{suffix}"
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            now = self._now()
+            run_at = now.replace(hour=self._hour, minute=0, second=0, microsecond=0)
+            if now < run_at:
+                await asyncio.sleep((run_at - now).total_seconds())
+                continue
+
+            try:
+                done = await self.run_once(now.date() + timedelta(days=1))
+            except Exception:
+                logger.exception("Daily fortune pre-generation run failed")
+                done = False
+
+            if done:
+                next_run = run_at + timedelta(days=1)
+                await asyncio.sleep(max((next_run - self._now()).total_seconds(), 0.0))
+            else:
+                # Another worker holds the lock, or this run failed: check back later
+                await asyncio.sleep(self._lock_seconds)
+
+    async def run_once(self, target: date) -> bool:
+        """Pre-generate `target` unless already done. Returns True once every profile is cached."""
+        done_key = self._key(target, "done")
+        if await self._cache.exists(done_key):
+            return True
+        lock_key = self._key(target, "lock")
+        if not await self._cache.add(lock_key, "running", ttl=self._lock_seconds):
+            logger.info("Daily fortune pre-generation for %s is running elsewhere", target)
+            return False
+
+        refresher = asyncio.create_task(self._refresh_lock(lock_key))
+        try:
+            profiles = load_profiles(self._profiles_path)
+            report = await self._pregenerator.run(profiles, target)
+        finally:
+            refresher.cancel()
+            await self._cache.delete(lock_key)
+
+        if report.failed:
+            logger.warning(
+                "Daily fortune pre-generation for %s left %d profiles failed, retrying later",
+                target, report.failed,
+            )
+            return False
+        await self._cache.set(done_key, report.snapshot(), ttl=2 * 86400)
+        return True
+
+    async def _refresh_lock(self, lock_key: str) -> None:
+        while True:
+            await asyncio.sleep(self._lock_seconds / 3)
+            await self._cache.set(lock_key, "running", ttl=self._lock_seconds)
+
@@ -0,0 +1,42 @@
+"""Request-scoped memoization.
+
+One request can reach the same value through several service calls: best-hours
+scores the hours and then interprets them, sinsal lists the sinsal and then
+reads the chart, each calculating the chart from the same birth input.
+RequestScopeMiddleware opens a scope per HTTP request; a value memoized inside
+it is computed once and dropped with the request. Outside a scope (tests
+calling services directly) memoized() simply computes the value.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_memo: ContextVar[dict[Hashable, Any] | None] = ContextVar("request_memo", default=None)
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """Memoize values for the duration of the block (one request or job item).
+
+    Tasks started inside the block share the scope.
+    """
+    token = _memo.set({})
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+def memoized(key: Hashable, compute: Callable[[], T]) -> T:
+    """Value of `key` in the current scope, computing it on first use."""
+    memo = _memo.get()
+    if memo is None:
+        return compute()
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
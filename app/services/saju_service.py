@@ -1,16 +1,36 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-from dataclasses import asdict
 
 from app.config import settings
 from app.engine.calculator import SajuCalculator
-from app.engine.models import SajuData
+from app.engine.luck import LuckTimeline
+from app.engine.models import PillarInfo, SajuData
+from app.engine.sinsal import Sinsal, find_sinsal
 from app.llm.client import LLMClient
-from app.llm.formatter import format_saju_for_prompt
+from app.llm.formatter import format_saju_for_prompt, format_sinsal
 from app.llm.prompts.reading_types import get_prompt_for_type
 from app.models.request import BirthInput
+from app.services.cache_keys import reading_cache_key
 from app.services.cache_service import CacheService
+from app.services.request_memo import memoized
+
+
+def calculate_birth(calculator: SajuCalculator, birth: BirthInput) -> SajuData:
+    """Chart of a birth input, calculated once per request (see request_memo)."""
+    options = {
+        "year": birth.year,
+        "month": birth.month,
+        "day": birth.day,
+        "hour": birth.hour,
+        "minute": birth.minute,
+        "gender_male": birth.gender == "male",
+        "calendar_type": birth.calendar_type.value,
+        "is_leap_month": birth.is_leap_month,
+        "use_night_zi": birth.use_night_zi,
+        "use_true_solar_time": birth.use_true_solar_time,
+    }
+    return memoized(("chart", *options.values()), lambda: calculator.calculate(**options))
 
 
 class SajuService:
@@ -28,18 +48,20 @@ class SajuService:
 
     def calculate(self, birth: BirthInput) -> SajuData:
         """Pure calculation, no LLM."""
-        return self._calculator.calculate(
-            year=birth.year,
-            month=birth.month,
-            day=birth.day,
-            hour=birth.hour,
-            minute=birth.minute,
-            gender_male=birth.gender == "male",
-            calendar_type=birth.calendar_type.value,
-            is_leap_month=birth.is_leap_month,
-            use_night_zi=birth.use_night_zi,
-            use_true_solar_time=birth.use_true_solar_time,
-        )
+        return calculate_birth(self._calculator, birth)
+
+    def sinsal(self, birth: BirthInput) -> tuple[SajuData, tuple[Sinsal, ...]]:
+        """Calculate the chart and its sinsal, no LLM."""
+        saju = self.calculate(birth)
+        return saju, find_sinsal(saju)
+
+    @staticmethod
+    def _build_prompt(saju: SajuData, reading_type: str) -> str:
+        prompt_template = get_prompt_for_type(reading_type)
+        fields = {"saju_data": format_saju_for_prompt(saju)}
+        if "{sinsal_data}" in prompt_template:
+            fields["sinsal_data"] = format_sinsal(find_sinsal(saju))
+        return prompt_template.format(**fields)
 
     async def reading(
         self,
@@ -52,24 +74,34 @@ class SajuService:
     ) -> tuple[SajuData, str]:
         """Calculate and generate full interpretation."""
         saju = self.calculate(birth)
+        interpretation = await self.interpret(
+            saju, reading_type,
+            language=language,
+            counselor_id=counselor_id,
+            custom_system_prompt=custom_system_prompt,
+        )
+        return saju, interpretation
 
-        cache_key = CacheService.make_key(
-            "reading",
-            year=saju.solar_year, month=saju.solar_month, day=saju.solar_day,
-            hour=saju.solar_hour, minute=saju.solar_minute,
-            gender=birth.gender.value, night_zi=birth.use_night_zi,
-            true_solar_time=birth.use_true_solar_time,
-            reading_type=reading_type,
-            lang=language,
-            counselor=counselor_id or "default",
+    async def interpret(
+        self,
+        saju: SajuData,
+        reading_type: str = "saju_reading",
+        *,
+        language: str = "ko",
+        counselor_id: str | None = None,
+        custom_system_prompt: str | None = None,
+    ) -> str:
+        """Generate the interpretation of an already calculated chart."""
+        # Keyed on the chart, so every birth with the same chart shares the reading
+        cache_key = reading_cache_key(
+            reading_type, saju, language=language, counselor=counselor_id or "default",
         )
 
         cached = await self._cache.get(cache_key)
         if cached:
-            return saju, cached
+            return cached
 
-        prompt_template = get_prompt_for_type(reading_type)
-        prompt = prompt_template.format(saju_data=format_saju_for_prompt(saju))
+        prompt = self._build_prompt(saju, reading_type)
         interpretation = await self._llm.generate(
             prompt,
             reading_type=reading_type,
@@ -78,7 +110,41 @@ class SajuService:
         )
 
         await self._cache.set(cache_key, interpretation, ttl=settings.cache_ttl_interpretation)
-        return saju, interpretation
+        return interpretation
+
+    async def career_interpretation(
+        self,
+        saju: SajuData,
+        reading_type: str,
+        career_text: str,
+        luck: LuckTimeline,
+        *,
+        extra_prompt_kwargs: dict[str, str] | None = None,
+        language: str = "ko",
+    ) -> str:
+        """Career reading (career_*) of a chart with its career context and luck timeline."""
+        cache_key = reading_cache_key(
+            reading_type, saju, language=language,
+            career_info=career_text, context=extra_prompt_kwargs or {},
+            luck_from=f"{luck.start_year}-{luck.start_month:02d}",
+        )
+        cached = await self._cache.get(cache_key)
+        if cached:
+            return cached
+
+        format_args: dict[str, str] = {
+            "saju_data": format_saju_for_prompt(saju, luck=luck),
+            "career_info": career_text,
+        }
+        if extra_prompt_kwargs:
+            format_args = {**format_args, **extra_prompt_kwargs}
+        prompt = get_prompt_for_type(reading_type).format(**format_args)
+
+        interpretation = await self._llm.generate(
+            prompt, reading_type=reading_type, language=language,
+        )
+        await self._cache.set(cache_key, interpretation, ttl=settings.cache_ttl_interpretation)
+        return interpretation
 
     async def reading_stream(
         self,
@@ -91,8 +157,7 @@ class SajuService:
     ) -> tuple[SajuData, AsyncIterator[str]]:
         """Calculate and stream interpretation."""
         saju = self.calculate(birth)
-        prompt_template = get_prompt_for_type(reading_type)
-        prompt = prompt_template.format(saju_data=format_saju_for_prompt(saju))
+        prompt = self._build_prompt(saju, reading_type)
         return saju, self._llm.generate_stream(
             prompt,
             reading_type=reading_type,
@@ -101,17 +166,40 @@ class SajuService:
         )
 
     def saju_to_dict(self, saju: SajuData) -> dict:
-        """Convert SajuData to a serializable dict matching SajuCalculateResponse."""
-        d = asdict(saju)
-        d["solar_date"] = f"{saju.solar_year}-{saju.solar_month:02d}-{saju.solar_day:02d}"
-        d["lunar_date"] = f"{saju.lunar_year}-{abs(saju.lunar_month):02d}-{saju.lunar_day:02d}"
-
-        # Remove raw fields not in response
-        for key in (
-            "solar_year", "solar_month", "solar_day",
-            "solar_hour", "solar_minute",
-            "lunar_year", "lunar_month", "lunar_day",
-        ):
-            d.pop(key, None)
-
-        return d
+        """Convert SajuData to a serializable dict matching SajuCalculateResponse.
+
+        Unlike dataclasses.asdict nothing is deep-copied: the dict refers to
+        the chart's own lists and dicts (SajuData is frozen and never mutated).
+        """
+        return {
+            "solar_date": f"{saju.solar_year}-{saju.solar_month:02d}-{saju.solar_day:02d}",
+            "lunar_date": f"{saju.lunar_year}-{abs(saju.lunar_month):02d}-{saju.lunar_day:02d}",
+            "is_leap_month": saju.is_leap_month,
+            "year_pillar": _pillar_to_dict(saju.year_pillar),
+            "month_pillar": _pillar_to_dict(saju.month_pillar),
+            "day_pillar": _pillar_to_dict(saju.day_pillar),
+            "time_pillar": _pillar_to_dict(saju.time_pillar) if saju.time_pillar else None,
+            "day_master": saju.day_master,
+            "day_master_kor": saju.day_master_kor,
+            "day_master_element": saju.day_master_element,
+            "day_master_yin_yang": saju.day_master_yin_yang,
+            "tai_yuan": saju.tai_yuan,
+            "tai_yuan_na_yin": saju.tai_yuan_na_yin,
+            "ming_gong": saju.ming_gong,
+            "ming_gong_na_yin": saju.ming_gong_na_yin,
+            "shen_gong": saju.shen_gong,
+            "shen_gong_na_yin": saju.shen_gong_na_yin,
+            "da_yun_start_age": saju.da_yun_start_age,
+            "da_yun_list": [
+                {"start_age": dy.start_age, "start_year": dy.start_year, "gan_zhi": dy.gan_zhi}
+                for dy in saju.da_yun_list
+            ],
+            "element_counts": saju.element_counts,
+            "used_night_zi": saju.used_night_zi,
+            "used_true_solar_time": saju.used_true_solar_time,
+            "birth_time_unknown": saju.birth_time_unknown,
+        }
+
+
+def _pillar_to_dict(pillar: PillarInfo) -> dict:
+    return dict(vars(pillar))
@@ -0,0 +1,123 @@
+"""Benchmark parse_interpretation against the previous regex-based parser.
+
+Parses every LLM output in tests/fixtures/llm_outputs with both
+implementations, fails if any result differs, and reports CPU time per call.
+Usage: python scripts/bench_parser.py [--iterations N]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.llm.parser import (
+    _DISCLAIMER_PREFIXES,
+    _SECTION_HEADER_RE,
+    _first_sentence,
+    parse_interpretation,
+)
+from app.models.response import InterpretationResponse, SectionResponse
+
+CORPUS_DIR = ROOT / "tests" / "fixtures" / "llm_outputs"
+
+
+def _legacy_extract_disclaimer(text: str) -> tuple[str, str | None]:
+    lines = text.strip().split("\n")
+    disclaimer_start = -1
+    for i in range(len(lines) - 1, max(len(lines) - 6, -1), -1):
+        stripped = lines[i].strip().lstrip("(").lstrip("*").lstrip("_")
+        if any(stripped.startswith(prefix) for prefix in _DISCLAIMER_PREFIXES):
+            disclaimer_start = i
+            break
+    if disclaimer_start == -1:
+        return text, None
+    disclaimer = "\n".join(lines[disclaimer_start:]).strip()
+    disclaimer = disclaimer.strip("()").strip("*").strip("_").strip()
+    remaining = "\n".join(lines[:disclaimer_start]).strip()
+    return remaining, disclaimer
+
+
+def legacy_parse_interpretation(raw_text: str) -> InterpretationResponse:
+    """The regex/split based parser this module replaced, kept for comparison."""
+    raw_text = raw_text.strip()
+    headers = list(_SECTION_HEADER_RE.finditer(raw_text))
+    if not headers:
+        summary, disclaimer = _legacy_extract_disclaimer(raw_text)
+        return InterpretationResponse(summary=summary.strip(), sections=[], disclaimer=disclaimer)
+
+    summary_text = raw_text[: headers[0].start()].strip()
+    summary_text = re.sub(r"^##\s+.+\n*", "", summary_text).strip()
+
+    sections: list[SectionResponse] = []
+    for i, header in enumerate(headers):
+        start = header.end()
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(raw_text)
+        sections.append(SectionResponse(
+            title=header.group(1).strip(), content=raw_text[start:end].strip(),
+        ))
+
+    disclaimer: str | None = None
+    cleaned, found_disclaimer = _legacy_extract_disclaimer(sections[-1].content)
+    if found_disclaimer:
+        sections = [
+            *sections[:-1],
+            SectionResponse(title=sections[-1].title, content=cleaned.strip()),
+        ]
+        disclaimer = found_disclaimer
+
+    if not summary_text and sections:
+        summary_text = _first_sentence(sections[0].content)
+
+    return InterpretationResponse(
+        summary=summary_text.strip(), sections=sections, disclaimer=disclaimer,
+    )
+
+
+def _cpu_time_per_call(parse, texts: list[str], iterations: int) -> float:
+    start = time.process_time()
+    for _ in range(iterations):
+        for text in texts:
+            parse(text)
+    return (time.process_time() - start) / (iterations * len(texts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the interpretation parser")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = {path.stem: path.read_text(encoding="utf-8") for path in sorted(CORPUS_DIR.glob("*.md"))}
+    if not corpus:
+        print(f"No corpus files found in {CORPUS_DIR}")
+        sys.exit(1)
+
+    mismatches = [
+        name for name, text in corpus.items()
+        if parse_interpretation(text) != legacy_parse_interpretation(text)
+    ]
+    if mismatches:
+        print(f"Output differs from legacy parser for: {', '.join(mismatches)}")
+        sys.exit(1)
+
+    print(f"{len(corpus)} corpus files, identical output, {args.iterations} iterations each\n")
+    print(f"{'file':<16} {'chars':>6} {'legacy µs':>10} {'current µs':>11} {'speedup':>8}")
+    total_legacy = total_current = 0.0
+    for name, text in corpus.items():
+        legacy = _cpu_time_per_call(legacy_parse_interpretation, [text], args.iterations)
+        current = _cpu_time_per_call(parse_interpretation, [text], args.iterations)
+        total_legacy += legacy
+        total_current += current
+        print(f"{name:<16} {len(text):>6} {legacy * 1e6:>10.1f} {current * 1e6:>11.1f} {legacy / current:>7.2f}x")
+    print(f"{'total':<16} {'':>6} {total_legacy * 1e6:>10.1f} {total_current * 1e6:>11.1f} "
+          f"{total_legacy / total_current:>7.2f}x")
+
+    sys.exit(0 if total_current < total_legacy else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Compile a celebrity CSV into the memory-mapped columnar format.
+
+Point CELEBRITY_DATASET_PATH at the output; running servers pick up a
+rebuilt file on their next reload check. The file is replaced atomically.
+Usage: python scripts/build_celebrity_store.py celebrities.csv celebrities.bin
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.data.celebrity_store import (
+    CelebrityStore,
+    read_celebrities_csv,
+    write_celebrity_store,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the columnar celebrity dataset")
+    parser.add_argument("source", help="CSV with id,name_ko,name_en,group,year,month,day,gender")
+    parser.add_argument("output", help="Columnar file to write")
+    args = parser.parse_args()
+
+    celebrities = read_celebrities_csv(args.source)
+    write_celebrity_store(celebrities, args.output)
+    store = CelebrityStore.open(args.output)
+    print(f"Wrote {len(store)} celebrities to {args.output} ({Path(args.output).stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Offline load test against the in-process FastAPI app with the fake LLM provider.
+
+Runs the full middleware/router/service stack without network access and
+reports end-to-end latency next to the simulated model time, so the server's
+own overhead can be read off directly.
+Usage: python scripts/load_test.py [--requests N] [--concurrency C] [--latency-ms MS]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+READING_BODY = {
+    "birth": {
+        "year": 1990,
+        "month": 5,
+        "day": 15,
+        "hour": 14,
+        "minute": 30,
+        "gender": "male",
+    },
+}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def run_load_test(total: int, concurrency: int, path: str) -> int:
+    from app.config import settings
+    from app.dependencies import init_dependencies, shutdown_dependencies
+    from app.main import app
+
+    settings.require_service_token = False
+    await init_dependencies()
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    failures = 0
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://load-test", timeout=None,
+    ) as client:
+
+        async def one(i: int) -> None:
+            nonlocal failures
+            body = {**READING_BODY, "birth": {**READING_BODY["birth"], "day": 1 + i % 28}}
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(path, json=body)
+                elapsed = time.perf_counter() - start
+            if response.status_code == 200:
+                latencies.append(elapsed)
+            else:
+                failures += 1
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        wall = time.perf_counter() - wall_start
+
+    await shutdown_dependencies()
+
+    model_time = (
+        settings.fake_llm_latency_ms / 1000
+        + settings.fake_llm_output_tokens / settings.fake_llm_tokens_per_second
+    )
+    print("=" * 60)
+    print(f"Endpoint: {path}  requests={total}  concurrency={concurrency}")
+    print(f"Throughput: {total / wall:.1f} req/s  failures={failures}")
+    if latencies:
+        p50 = _percentile(latencies, 50)
+        p95 = _percentile(latencies, 95)
+        print(f"Latency p50={p50 * 1000:.1f}ms  p95={p95 * 1000:.1f}ms")
+        print(f"Simulated model time: {model_time * 1000:.1f}ms")
+        print(f"Server overhead p50={(p50 - model_time) * 1000:.1f}ms")
+    print("=" * 60)
+    return 0 if failures == 0 else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test with the fake LLM provider")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--path", default="/api/v1/saju/reading")
+    parser.add_argument("--latency-ms", type=float, default=None)
+    parser.add_argument("--tokens-per-second", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=None)
+    args = parser.parse_args()
+
+    # Must be set before app.config is imported
+    os.environ["LLM_PROVIDER"] = "fake"
+    os.environ["REDIS_URL"] = os.environ.get("REDIS_URL", "redis://localhost:1/0")
+    if args.latency_ms is not None:
+        os.environ["FAKE_LLM_LATENCY_MS"] = str(args.latency_ms)
+    if args.tokens_per_second is not None:
+        os.environ["FAKE_LLM_TOKENS_PER_SECOND"] = str(args.tokens_per_second)
+    if args.error_rate is not None:
+        os.environ["FAKE_LLM_ERROR_RATE"] = str(args.error_rate)
+
+    sys.exit(asyncio.run(run_load_test(args.requests, args.concurrency, args.path)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Pre-generate daily fortunes for a list of active profiles (one-off worker).
+
+Fills the same cache keys as /api/v1/fortune/daily. Safe to re-run: profiles
+that are already cached are skipped, so an interrupted run resumes where it
+stopped. Requires Redis and an LLM provider configured via the usual settings.
+Usage: python scripts/pregenerate_daily.py --profiles profiles.jsonl [--date YYYY-MM-DD]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+async def run(profiles_path: str, target: date, rpm: float | None, concurrency: int | None) -> int:
+    from app import dependencies
+    from app.config import settings
+    from app.services.pregeneration_service import load_profiles
+
+    if rpm is not None:
+        settings.daily_pregen_requests_per_minute = rpm
+    if concurrency is not None:
+        settings.daily_pregen_concurrency = concurrency
+
+    await dependencies.init_dependencies()
+    try:
+        profiles = load_profiles(profiles_path)
+        report = await dependencies.build_daily_pregenerator().run(profiles, target)
+    finally:
+        await dependencies.shutdown_dependencies()
+
+    print(f"target={report.target_date} total={report.total} generated={report.generated} "
+          f"skipped={report.skipped} failed={report.failed}")
+    return 0 if report.failed == 0 else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate daily fortunes into the cache")
+    parser.add_argument("--profiles", required=True, help="JSON Lines file of FortuneRequest bodies")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today() + timedelta(days=1))
+    parser.add_argument("--requests-per-minute", type=float, default=None)
+    parser.add_argument("--concurrency", type=int, default=None)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args.profiles, args.date, args.requests_per_minute, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
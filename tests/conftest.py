@@ -6,6 +6,7 @@ from httpx import ASGITransport, AsyncClient
 from app.config import settings
 from app.engine.calculator import SajuCalculator
 from app.llm.client import LLMClient
+from app.resilience import CircuitBreaker
 from app.services.cache_service import CacheService
 from app.services.saju_service import SajuService
 
@@ -15,13 +16,57 @@ def calculator() -> SajuCalculator:
     return SajuCalculator()
 
 
+class MemoryRedis:
+    """In-memory stand-in for the redis.asyncio calls CacheService and the rate limiter make."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def incrby(self, key, amount):
+        self.data[key] = int(self.data.get(key, 0)) + amount
+        return self.data[key]
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+
+@pytest.fixture
+def memory_cache() -> CacheService:
+    return CacheService(MemoryRedis(), breaker=CircuitBreaker("redis"))
+
+
 @pytest.fixture
 def saju_service(calculator: SajuCalculator) -> SajuService:
     return SajuService(calculator, LLMClient(None), CacheService(None))
 
 
+@pytest.fixture(scope="session")
+def celebrity_index():
+    from app.services.celebrity_index import CelebrityChartIndex
+    from app.services.compatibility_service import CompatibilityService
+
+    service = CompatibilityService(SajuCalculator(), LLMClient(None), CacheService(None))
+    return CelebrityChartIndex.build(service.calculate_person)
+
+
 @pytest.fixture
-async def client():
+async def client(celebrity_index):
     from app.main import app
     from app import dependencies
 
@@ -54,6 +99,14 @@ async def client():
     )
     dependencies._celebrity_service = CelebrityService(
         dependencies._compatibility_service,
+        celebrity_index,
+    )
+    from app.services.bundle_service import ReadingBundleService
+
+    dependencies._bundle_service = ReadingBundleService(
+        dependencies._saju_service,
+        dependencies._fortune_service,
+        dependencies._compatibility_service,
     )
 
     transport = ASGITransport(app=app)
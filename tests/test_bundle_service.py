@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.engine.calculator import SajuCalculator
+from app.llm.client import LLMClient
+from app.llm.providers import FakeProvider
+from app.middleware.error_handler import InvalidBundleError, LLMError
+from app.services.bundle_service import ReadingBundleService, validate_bundle
+from app.services.cache_service import CacheService
+from app.services.compatibility_service import CompatibilityService, swaps_pair
+from app.services.fortune_service import FortuneService
+from app.services.saju_service import SajuService
+
+
+class _ConcurrencyProvider(FakeProvider):
+    """Records how many generations run at the same time."""
+
+    def __init__(self):
+        super().__init__(latency_ms=0, tokens_per_second=0)
+        self.running = 0
+        self.peak = 0
+
+    async def create(self, **kwargs) -> str:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.05)
+            return await super().create(**kwargs)
+        finally:
+            self.running -= 1
+
+
+def _bundle_service(llm: LLMClient) -> ReadingBundleService:
+    calculator, cache = SajuCalculator(), CacheService(None)
+    return ReadingBundleService(
+        SajuService(calculator, llm, cache),
+        FortuneService(calculator, llm, cache),
+        CompatibilityService(calculator, llm, cache),
+    )
+
+
+class TestValidateBundle:
+    def test_deduplicates_in_order(self):
+        unique = validate_bundle(["monthly", "saju_reading", "monthly"], False)
+        assert unique == ["monthly", "saju_reading"]
+
+    def test_rejects_unsupported_types(self):
+        with pytest.raises(InvalidBundleError, match="pet_reading"):
+            validate_bundle(["saju_reading", "pet_reading"], False)
+
+    def test_partner_reading_needs_partner(self):
+        with pytest.raises(InvalidBundleError, match="marriage_timing"):
+            validate_bundle(["marriage_timing"], False)
+        assert validate_bundle(["marriage_timing"], True) == ["marriage_timing"]
+
+
+class TestReadingBundleService:
+    async def test_generations_run_concurrently(self):
+        provider = _ConcurrencyProvider()
+        service = _bundle_service(LLMClient(provider))
+        calculator = SajuCalculator()
+        saju = calculator.calculate(1990, 5, 15, 14, 0)
+        partner = calculator.calculate(1992, 11, 3, 9, 0)
+        types = ["saju_reading", "monthly", "career_transition", "marriage_timing"]
+
+        results = [
+            r async for r in service.generate(saju, types, partner=partner, start=date(2026, 10, 1))
+        ]
+
+        assert sorted(r.reading_type for r in results) == sorted(types)
+        assert all(r.interpretation and r.error is None for r in results)
+        assert provider.peak == len(types)
+        swapped = {r.reading_type: r.persons_swapped for r in results}
+        assert swapped.pop("marriage_timing") == swaps_pair("marriage_timing", saju, partner)
+        assert not any(swapped.values())
+
+    async def test_failures_are_reported_per_reading(self):
+        service = _bundle_service(LLMClient(None))
+        saju = SajuCalculator().calculate(1990, 5, 15, 14, 0)
+        results = [r async for r in service.generate(saju, ["saju_reading", "sinsal"])]
+        assert {r.reading_type for r in results} == {"saju_reading", "sinsal"}
+        assert all(r.interpretation is None and isinstance(r.error, LLMError) for r in results)
+
+    async def test_unexpected_errors_do_not_stop_the_bundle(self, monkeypatch: pytest.MonkeyPatch):
+        service = _bundle_service(LLMClient(FakeProvider(latency_ms=0, tokens_per_second=0)))
+
+        async def broken(*args, **kwargs):
+            raise KeyError("month")
+
+        monkeypatch.setattr(service._fortune, "monthly_interpretation", broken)
+        saju = SajuCalculator().calculate(1990, 5, 15, 14, 0)
+        results = {
+            r.reading_type: r async for r in service.generate(saju, ["saju_reading", "monthly"])
+        }
+        assert results["saju_reading"].interpretation and results["saju_reading"].error is None
+        assert results["monthly"].interpretation is None
+        assert isinstance(results["monthly"].error, LLMError)
+
+    async def test_closing_early_waits_for_cancelled_readings(self):
+        service = _bundle_service(LLMClient(_ConcurrencyProvider()))
+        saju = SajuCalculator().calculate(1990, 5, 15, 14, 0)
+        before = asyncio.all_tasks()
+        readings = service.generate(saju, ["saju_reading", "monthly", "career_transition"])
+        await readings.__anext__()
+        await readings.aclose()
+        assert asyncio.all_tasks() == before
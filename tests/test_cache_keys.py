@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from app.config import settings
+from app.engine.calculator import SajuCalculator
+from app.services.cache_keys import CACHE_KEY_VERSIONS, key_version, reading_cache_key
+
+
+@pytest.fixture
+def versions(monkeypatch):
+    overrides: dict[str, int] = {}
+    monkeypatch.setattr(settings, "cache_key_versions", overrides)
+    return overrides
+
+
+class TestReadingCacheKey:
+    def test_key_carries_namespace_and_version(self, calculator: SajuCalculator, versions):
+        saju = calculator.calculate(1990, 5, 15, 14, 0)
+        key = reading_cache_key("daily", saju, language="ko", ty=2026, tm=3, td=1)
+        assert key.startswith(f"saju:daily:v{key_version('daily')}:")
+
+    def test_same_chart_shares_key(self, calculator: SajuCalculator, versions):
+        early = calculator.calculate(1990, 5, 15, 13, 10)
+        late = calculator.calculate(1990, 5, 15, 14, 50)
+        assert reading_cache_key("career_burnout", early, language="ko") == \
+            reading_cache_key("career_burnout", late, language="ko")
+
+    def test_night_zi_flag_changes_key(self, calculator: SajuCalculator, versions):
+        early = calculator.calculate(1990, 5, 15, 23, 30, use_night_zi=False)
+        night = calculator.calculate(1990, 5, 15, 23, 30, use_night_zi=True)
+        assert reading_cache_key("career_burnout", early, language="ko") != \
+            reading_cache_key("career_burnout", night, language="ko")
+
+    def test_namespaces_are_distinct(self, calculator: SajuCalculator, versions):
+        a = calculator.calculate(1990, 5, 15, 14, 0)
+        b = calculator.calculate(1992, 8, 20, 9, 0)
+        assert reading_cache_key("compatibility", a, b, language="ko") != \
+            reading_cache_key("marriage_timing", a, b, language="ko")
+
+    def test_prompt_context_changes_key(self, calculator: SajuCalculator, versions):
+        saju = calculator.calculate(1990, 5, 15, 14, 0)
+        assert reading_cache_key("pet_reading", saju, language="ko", pet_info="이름: 콩이") != \
+            reading_cache_key("pet_reading", saju, language="ko", pet_info="이름: 보리")
+
+    def test_version_bump_invalidates_only_its_namespace(
+        self, calculator: SajuCalculator, versions,
+    ):
+        saju = calculator.calculate(1990, 5, 15, 14, 0)
+        daily = reading_cache_key("daily", saju, language="ko")
+        monthly = reading_cache_key("monthly", saju, language="ko")
+
+        versions["daily"] = CACHE_KEY_VERSIONS.get("daily", 1) + 1
+        assert reading_cache_key("daily", saju, language="ko") != daily
+        assert reading_cache_key("monthly", saju, language="ko") == monthly
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+
+from app.data import celebrities
+from app.data.celebrities import CELEBRITIES
+from app.engine.calculator import SajuCalculator
+from app.llm.client import LLMClient
+from app.llm.formatter import format_saju_for_prompt
+from app.llm.providers import FakeProvider
+from app.models.request import BirthInput
+from app.services.cache_service import CacheService
+from app.services.celebrity_index import CelebrityChartIndex, celebrity_birth_input
+from app.services.celebrity_service import CelebrityDatasetWatcher, CelebrityService
+from app.services.compatibility_service import CompatibilityService
+
+
+class TestCelebrityChartIndex:
+    def test_covers_every_celebrity(self, celebrity_index: CelebrityChartIndex):
+        assert len(celebrity_index) == len(CELEBRITIES)
+        assert [chart.celebrity for chart in celebrity_index] == list(CELEBRITIES)
+
+    def test_charts_match_direct_calculation(self, celebrity_index: CelebrityChartIndex):
+        service = CompatibilityService(SajuCalculator(), LLMClient(None), CacheService(None))
+        for celebrity in CELEBRITIES[:5]:
+            chart = celebrity_index.get(celebrity.id)
+            saju = service.calculate_person(celebrity_birth_input(celebrity))
+            assert chart.saju == saju
+            assert chart.prompt_data == format_saju_for_prompt(saju)
+
+    def test_unknown_id(self, celebrity_index: CelebrityChartIndex):
+        assert celebrity_index.get("nonexistent-idol") is None
+
+
+class _CountingCompatibilityService(CompatibilityService):
+    def __init__(self):
+        super().__init__(
+            SajuCalculator(), LLMClient(FakeProvider(latency_ms=0, tokens_per_second=0)), CacheService(None),
+        )
+        self.calculated = 0
+
+    def calculate_person(self, birth: BirthInput):
+        self.calculated += 1
+        return super().calculate_person(birth)
+
+
+@pytest.mark.asyncio
+async def test_compatibility_only_calculates_user(celebrity_index: CelebrityChartIndex):
+    compat = _CountingCompatibilityService()
+    service = CelebrityService(compat, celebrity_index)
+
+    user = BirthInput(year=1995, month=3, day=10, hour=8, gender="female")
+    _, celeb_saju, celebrity, text = await service.analyze_compatibility(user, "karina-aespa")
+
+    assert compat.calculated == 1
+    assert celeb_saju is celebrity_index.get("karina-aespa").saju
+    assert celebrity.name_ko == "카리나"
+    assert text
+
+
+@pytest.mark.asyncio
+async def test_watcher_swaps_dataset_and_charts(tmp_path, celebrity_index: CelebrityChartIndex):
+    path = tmp_path / "celebrities.csv"
+    path.write_text(
+        "id,name_ko,name_en,group,year,month,day,gender\n"
+        "solo-x,가람,Garam,X,2000,1,1,female\n",
+        encoding="utf-8",
+    )
+    compat = CompatibilityService(SajuCalculator(), LLMClient(None), CacheService(None))
+    service = CelebrityService(compat, celebrity_index)
+    watcher = CelebrityDatasetWatcher(service, interval_seconds=60)
+    try:
+        celebrities.load_celebrities()
+        # Point the served dataset at the new file, as a changed file would look
+        celebrities.activate_dataset(celebrities.CelebrityDataset(
+            path, (0, 0), celebrities.current_dataset().store, celebrities.current_dataset().search_index,
+        ))
+        assert await watcher.check_once() is True
+        assert [chart.celebrity.id for chart in service.index] == ["solo-x"]
+        assert celebrities.get_celebrity_by_id("solo-x") is not None
+        assert await watcher.check_once() is False
+    finally:
+        celebrities.load_celebrities()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from app.engine.calculator import SajuCalculator
+from app.services.celebrity_index import CelebrityChartIndex
+from app.services.celebrity_match import rank_celebrities
+
+
+class TestRankCelebrities:
+    def test_returns_limit_sorted_by_score(self, calculator: SajuCalculator, celebrity_index: CelebrityChartIndex):
+        user = calculator.calculate(1995, 3, 10, 8, 0)
+        matches = rank_celebrities(user, celebrity_index, limit=5)
+        assert len(matches) == 5
+        scores = [m.score for m in matches]
+        assert scores == sorted(scores, reverse=True)
+        assert all(0 <= s <= 100 for s in scores)
+
+    def test_is_deterministic(self, calculator: SajuCalculator, celebrity_index: CelebrityChartIndex):
+        user = calculator.calculate(1990, 5, 15, 14, 0)
+        first = rank_celebrities(user, celebrity_index, limit=10)
+        second = rank_celebrities(user, celebrity_index, limit=10)
+        assert [m.chart.celebrity.id for m in first] == [m.chart.celebrity.id for m in second]
+
+    def test_gender_filter(self, calculator: SajuCalculator, celebrity_index: CelebrityChartIndex):
+        user = calculator.calculate(1990, 5, 15, 14, 0)
+        matches = rank_celebrities(user, celebrity_index, limit=50, gender="male")
+        assert matches
+        assert all(m.chart.celebrity.gender == "male" for m in matches)
+
+    def test_highlights_explain_relations(self, calculator: SajuCalculator, celebrity_index: CelebrityChartIndex):
+        user = calculator.calculate(1995, 3, 10, 8, 0)
+        best = rank_celebrities(user, celebrity_index, limit=1)[0]
+        assert best.highlights
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from app.engine.calculator import SajuCalculator
+from app.llm.client import LLMClient
+from app.llm.providers import FakeProvider
+from app.models.request import BirthInput
+from app.services.cache_service import CacheService
+from app.services.compatibility_service import CompatibilityService
+
+_A = BirthInput(year=1990, month=5, day=15, hour=14, gender="male")
+_B = BirthInput(year=1992, month=8, day=20, hour=9, gender="female")
+
+
+class _RecordingProvider(FakeProvider):
+    def __init__(self):
+        super().__init__(latency_ms=0, tokens_per_second=0)
+        self.prompts: list[str] = []
+
+    async def create(self, **kwargs) -> str:
+        self.prompts.append(kwargs["user_prompt"])
+        return await super().create(**kwargs)
+
+
+@pytest.fixture
+def provider() -> _RecordingProvider:
+    return _RecordingProvider()
+
+
+@pytest.fixture
+def service(provider: _RecordingProvider, memory_cache: CacheService) -> CompatibilityService:
+    return CompatibilityService(SajuCalculator(), LLMClient(provider), memory_cache)
+
+
+@pytest.mark.asyncio
+class TestPairOrdering:
+    async def test_symmetric_pair_shares_cache_entry(self, service, provider):
+        ab1, ab2, ab_text = await service.analyze(_A, _B)
+        ba1, ba2, ba_text = await service.analyze(_B, _A)
+
+        assert len(provider.prompts) == 1
+        assert ab_text == ba_text
+        # Charts are returned in the order the interpretation names them
+        assert (ab1.solar_year, ab2.solar_year) == (ba1.solar_year, ba2.solar_year)
+
+    async def test_symmetric_prompt_is_order_independent(self, provider):
+        uncached = CompatibilityService(SajuCalculator(), LLMClient(provider), CacheService(None))
+        for pair in ((_A, _B), (_B, _A)):
+            await uncached.analyze(
+                *pair, reading_type="marriage_timing", prompt_template="{person1_data}|{person2_data}",
+            )
+        assert provider.prompts[0] == provider.prompts[1]
+
+    async def test_directional_pair_keeps_order(self, service, provider):
+        kwargs = {
+            "reading_type": "celebrity_compatibility",
+            "prompt_template": "{person1_data}|{person2_data}",
+        }
+        await service.analyze(_A, _B, **kwargs)
+        await service.analyze(_B, _A, **kwargs)
+
+        assert len(provider.prompts) == 2
+        assert provider.prompts[0] != provider.prompts[1]
+
+
+@pytest.mark.asyncio
+async def test_prompt_lists_cross_chart_relations(service, provider):
+    saju1, saju2, _ = await service.analyze(_A, _B, prompt_template="{person1_data}\f{person2_data}")
+    person1, person2 = provider.prompts[0].split("\f")
+
+    assert "상대 사주와의 합충형파해" not in person1
+    assert "## 상대 사주와의 합충형파해 (확정)" in person2
+
+    precomputed = await service.analyze_charts(
+        saju1, saju2, reading_type="celebrity_compatibility", prompt_template="{person2_data}",
+        person2_data="(precomputed)",
+    )
+    assert precomputed
+    assert provider.prompts[1].startswith("(precomputed)\n\n## 상대 사주와의 합충형파해 (확정)")
+
+
+@pytest.mark.asyncio
+class TestGroupSummary:
+    async def test_prompt_carries_summary_not_charts(self, service, provider):
+        births = [_A, _B, BirthInput(year=1985, month=1, day=1, hour=None, gender="male")]
+        sajus, matrix = service.group_matrix(births)
+        labels = ["민수", "지영", "철수"]
+
+        first = await service.group_summary(sajus, labels, matrix)
+        second = await service.group_summary(sajus, labels, matrix)
+
+        assert first == second
+        assert len(provider.prompts) == 1
+        prompt = provider.prompts[0]
+        assert "3명" in prompt
+        assert "- 민수: 庚午 辛巳 庚辰 癸未" in prompt
+        assert f"그룹 평균 궁합 (규칙 계산, 확정): {matrix.average}점" in prompt
+        assert "사주팔자" not in prompt
@@ -118,3 +118,79 @@ class TestSearchCelebrities:
     def test_results_are_immutable_tuple(self):
         results = search_celebrities("aespa")
         assert isinstance(results, tuple)
+
+    def test_search_by_choseong(self):
+        results = search_celebrities("ㅈㄱ")
+        assert [c.id for c in results] == ["jungkook-bts"]
+
+    def test_search_by_incomplete_syllable(self):
+        # "정구" is what an IME shows halfway through typing "정국"
+        results = search_celebrities("정구")
+        assert [c.id for c in results] == ["jungkook-bts"]
+
+    def test_single_character_matches_substrings(self):
+        results = search_celebrities("수")
+        assert "jisoo-blackpink" in {c.id for c in results}
+
+    def test_single_character_prefix_ranks_first(self):
+        results = search_celebrities("민")
+        assert {c.id for c in results[:2]} == {"minji-newjeans", "mingyu-seventeen"}
+        assert len(results) > 2
+
+    def test_single_characters_match_linear_scan(self):
+        characters = {
+            ch for c in CELEBRITIES for text in (c.name_ko, c.name_en, c.group)
+            for ch in text.lower() if not ch.isspace()
+        }
+        for ch in characters:
+            expected = {
+                c.id for c in CELEBRITIES
+                if ch in c.name_ko.lower() or ch in c.name_en.lower() or ch in c.group.lower()
+            }
+            found = {c.id for c in search_celebrities(ch, limit=len(CELEBRITIES))}
+            assert expected <= found, ch
+            if not ("가" <= ch <= "힣"):
+                assert found == expected, ch
+
+    def test_exact_match_ranks_first(self):
+        results = search_celebrities("ive")
+        assert results[0].group == "IVE"
+        assert all(c.group == "IVE" for c in results)
+
+    def test_limit(self):
+        assert len(search_celebrities("bts", limit=3)) == 3
+        assert search_celebrities("bts", limit=0) == ()
+
+
+class TestCelebritySearchIndex:
+    """The index must find what a linear scan finds, at any size."""
+
+    @staticmethod
+    def _dataset(n: int) -> list[Celebrity]:
+        syllables = "가나다라마바사아자차카타파하민지수현진"
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        return [
+            Celebrity(
+                f"idol-{i}",
+                syllables[i % 19] + syllables[i // 19 % 19] + syllables[i // 361 % 19],
+                letters[i % 26] + letters[i // 26 % 26] + letters[i // 676 % 26] + "ie",
+                f"Group {i // 7}",
+                2000, 1, 1, "female",
+            )
+            for i in range(n)
+        ]
+
+    def test_matches_linear_scan(self):
+        from app.data.celebrity_search import CelebritySearchIndex
+
+        dataset = self._dataset(5000)
+        index = CelebritySearchIndex(dataset)
+        for query in ("abc", "bie", "group 12", "roup 4", "kz", "지수", "나다"):
+            expected = {
+                c.id for c in dataset
+                if query in c.name_ko.lower() or query in c.name_en.lower() or query in c.group.lower()
+            }
+            found = {c.id for c in index.search(query, limit=len(dataset))}
+            assert expected <= found, query
+            if not any("가" <= ch <= "힣" for ch in query):
+                assert found == expected, query
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.data import celebrities
+from app.data.celebrity_store import (
+    Celebrity,
+    CelebrityStore,
+    read_celebrities_csv,
+    write_celebrity_store,
+)
+
+_HEADER = "id,name_ko,name_en,group,year,month,day,gender\n"
+
+
+def _write_csv(path, rows: list[str]) -> None:
+    path.write_text(_HEADER + "".join(row + "\n" for row in rows), encoding="utf-8")
+    # Make sure the change is visible even on filesystems with coarse mtimes
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def restore_dataset():
+    yield
+    celebrities.load_celebrities()
+
+
+class TestCelebrityStore:
+    def test_columnar_round_trip(self, tmp_path):
+        source = read_celebrities_csv(celebrities.DEFAULT_DATASET_PATH)
+        path = tmp_path / "celebrities.bin"
+        write_celebrity_store(source, path)
+
+        store = CelebrityStore.open(path)
+        assert len(store) == len(source)
+        assert list(store) == source
+        assert store[-1] == source[-1]
+
+    def test_get_by_id(self, tmp_path):
+        source = read_celebrities_csv(celebrities.DEFAULT_DATASET_PATH)
+        path = tmp_path / "celebrities.bin"
+        write_celebrity_store(source, path)
+
+        store = CelebrityStore.open(path)
+        for celebrity in source:
+            assert store.get(celebrity.id) == celebrity
+        assert store.get("nonexistent-idol") is None
+        assert store.get("") is None
+
+    def test_duplicate_ids_rejected(self, tmp_path):
+        row = Celebrity("a", "가", "A", "G", 2000, 1, 1, "female")
+        with pytest.raises(ValueError):
+            write_celebrity_store([row, row], tmp_path / "dup.bin")
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a store file")
+        with pytest.raises(ValueError):
+            CelebrityStore.open(path)
+
+
+class TestHotReload:
+    def test_reload_picks_up_changes(self, tmp_path, restore_dataset):
+        path = tmp_path / "celebrities.csv"
+        _write_csv(path, ["a-x,가람,Garam,X,2000,1,1,female"])
+        celebrities.load_celebrities(path)
+        assert celebrities.reload_if_changed() is False
+        assert celebrities.get_celebrity_by_id("b-x") is None
+
+        _write_csv(path, ["a-x,가람,Garam,X,2000,1,1,female", "b-x,나래,Narae,X,2001,2,2,female"])
+        assert celebrities.reload_if_changed() is True
+        assert celebrities.get_celebrity_by_id("b-x").name_ko == "나래"
+        assert [c.id for c in celebrities.search_celebrities("나래")] == ["b-x"]
+
+    def test_import_does_not_load(self):
+        code = (
+            "import app.data.celebrities as c, app.services.celebrity_service; "
+            "assert c._dataset is None"
+        )
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from app.engine.analysis import BALANCED, BRANCH_MAIN_STEMS, STRONG, WEAK, analyze_chart, ten_god_of
+from app.engine.calculator import SajuCalculator
+from app.engine.relations import BRANCH_INDEX, STEM_INDEX, Interaction
+from app.llm.formatter import format_saju_for_prompt
+
+
+class TestAnalyzeChart:
+    def test_strong_chart(self, calculator: SajuCalculator):
+        # 庚午 辛巳 庚辰 癸未: metal day master with earth and metal support
+        analysis = analyze_chart(calculator.calculate(1990, 5, 15, 14, 0))
+        assert analysis.strength == STRONG
+        assert analysis.strength_score == 60
+        assert analysis.useful_element == "木"
+        assert analysis.favorable_element == "水"
+        assert analysis.group_counts == {"비겁": 2, "식상": 1, "재성": 0, "관성": 2, "인성": 2}
+        assert analysis.missing_groups == ("재성",)
+        assert analysis.excess_elements == ("金",)
+        assert analysis.missing_elements == ("木",)
+        assert analysis.relations == (Interaction("연지-시지", "午未", ("육합",)),)
+
+    def test_weak_chart_with_heavy_wealth(self, calculator: SajuCalculator):
+        analysis = analyze_chart(calculator.calculate(1980, 1, 10, 12, 0))
+        assert analysis.strength == WEAK
+        assert analysis.useful_element == "水"  # 비겁 of the water day master
+        assert analysis.favorable_element == "金"
+
+    def test_balanced_chart_uses_scarcest_element(self, calculator: SajuCalculator):
+        saju = calculator.calculate(1985, 4, 10, 12, 0)
+        analysis = analyze_chart(saju)
+        assert analysis.strength == BALANCED
+        assert saju.element_counts[analysis.useful_element] == min(saju.element_counts.values())
+
+    def test_ten_god_counts_skip_day_master(self, calculator: SajuCalculator):
+        analysis = analyze_chart(calculator.calculate(1990, 5, 15, 14, 0))
+        assert sum(analysis.ten_god_counts.values()) == 7
+        assert analysis.dominant_ten_gods == ()
+
+    def test_unknown_birth_time(self, calculator: SajuCalculator):
+        analysis = analyze_chart(calculator.calculate(1990, 5, 15))
+        assert sum(analysis.ten_god_counts.values()) == 5
+        assert all("시" not in relation.positions for relation in analysis.relations)
+
+    def test_prompt_includes_analysis(self, calculator: SajuCalculator):
+        prompt = format_saju_for_prompt(calculator.calculate(1990, 5, 15, 14, 0))
+        assert "## 규칙 기반 분석 (확정)" in prompt
+        assert "- 신강약: 신강 (60/100)" in prompt
+        assert "- 합충형파해: 연지-시지 午未 육합" in prompt
+
+
+class TestTenGodOf:
+    def test_matches_calculator(self, calculator: SajuCalculator):
+        saju = calculator.calculate(1992, 11, 3, 9, 0)
+        day_stem = STEM_INDEX[saju.day_pillar.gan]
+        for pillar in (saju.year_pillar, saju.month_pillar, saju.day_pillar, saju.time_pillar):
+            if pillar is not saju.day_pillar:
+                assert ten_god_of(day_stem, STEM_INDEX[pillar.gan]) == pillar.shi_shen_gan
+            main_stem = BRANCH_MAIN_STEMS[BRANCH_INDEX[pillar.zhi]]
+            assert ten_god_of(day_stem, STEM_INDEX[main_stem]) == pillar.shi_shen_zhi[0]
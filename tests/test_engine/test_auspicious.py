@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.engine.auspicious import DateScorer, HourScorer
+from app.engine.calculator import SajuCalculator
+from app.engine.ganzhi_calendar import GanZhiCalendar
+
+
+@pytest.fixture(scope="module")
+def calendar() -> GanZhiCalendar:
+    return GanZhiCalendar(window_days=400, today=lambda: date(2027, 1, 1))
+
+
+@pytest.fixture(scope="module")
+def couple() -> list:
+    calculator = SajuCalculator()
+    # 庚午 辛巳 庚辰 癸未 / 壬申 庚戌 癸未 丁巳
+    return [calculator.calculate(1990, 5, 15, 14, 0), calculator.calculate(1992, 11, 3, 9, 0)]
+
+
+class TestDateScorer:
+    def test_rank_is_sorted_and_matches_single_scores(self, calendar, couple):
+        scorer = DateScorer(couple)
+        ranked = scorer.rank(calendar, date(2027, 1, 1), date(2027, 12, 31), limit=15)
+        assert len(ranked) == 15
+        assert [d.score for d in ranked] == sorted((d.score for d in ranked), reverse=True)
+        for day in ranked:
+            assert scorer.score(calendar, day.date) == day
+            assert 0 <= day.score <= 100
+            assert not any(note.startswith("월파") for note in day.notes)
+
+    def test_best_days_beat_every_other_day(self, calendar, couple):
+        scorer = DateScorer(couple)
+        start = date(2027, 3, 1)
+        ranked = scorer.rank(calendar, start, start + timedelta(days=59), limit=3)
+        others = [
+            scorer.score(calendar, start + timedelta(days=i)) for i in range(60)
+        ]
+        eligible = [d for d in others if not any(n.startswith("월파") for n in d.notes)]
+        assert ranked[-1].score == sorted((d.score for d in eligible), reverse=True)[2]
+
+    def test_month_filter(self, calendar, couple):
+        ranked = DateScorer(couple).rank(
+            calendar, date(2027, 1, 1), date(2027, 12, 31), months=[5, 10], limit=30,
+        )
+        assert {d.date.month for d in ranked} <= {5, 10}
+
+    def test_pair_order_only_changes_labels(self, calendar, couple):
+        span = (date(2027, 1, 1), date(2027, 6, 30))
+        forward = DateScorer(couple).rank(calendar, *span)
+        backward = DateScorer(couple[::-1]).rank(calendar, *span)
+        assert [(d.date, d.score) for d in forward] == [(d.date, d.score) for d in backward]
+
+    def test_day_branch_clash_scores_low(self, calendar, couple):
+        # 庚辰 day master: a 戌 day clashes the spouse palace
+        scorer = DateScorer(couple[:1])
+        start = date(2027, 1, 1)
+        scores = [scorer.score(calendar, start + timedelta(days=i)) for i in range(60)]
+        clash = [d for d in scores if d.day_pillar[1] == "戌"]
+        harmony = [d for d in scores if d.day_pillar[1] == "酉"]
+        assert max(d.score for d in clash) < min(d.score for d in harmony)
+        assert any("일지 辰戌 충" in note for note in clash[0].notes)
+
+
+class TestHourScorer:
+    def test_scores_twelve_hours_in_order(self, calendar, couple):
+        day = calendar.pillars(2027, 3, 3).day
+        hours = calendar.shi_chen_pillars(2027, 3, 3)
+        scores = HourScorer(couple[0]).score(day, hours)
+        assert [s.shi_chen for s in scores] == list(range(12))
+        assert [s.hour_pillar for s in scores] == hours
+        assert all(0 <= s.score <= 100 for s in scores)
+
+    def test_spouse_palace_clash_and_harmony(self, calendar, couple):
+        # 庚辰 day pillar: the 戌 hour clashes it, the 酉 hour combines with it
+        scores = HourScorer(couple[0]).score(calendar.pillars(2027, 3, 3).day, calendar.shi_chen_pillars(2027, 3, 3))
+        assert "일지 辰戌 충" in scores[10].notes
+        assert "일지 辰酉 육합" in scores[9].notes
+        assert scores[10].score < scores[9].score
+
+    def test_day_branch_relation_is_noted(self, couple):
+        # 寅 day: the 申 hour clashes the day itself
+        hours = ["戊子", "己丑", "庚寅", "辛卯", "壬辰", "癸巳", "甲午", "乙未", "丙申", "丁酉", "戊戌", "己亥"]
+        scores = HourScorer(couple[0]).score("丙寅", hours)
+        assert "일진 寅申 충" in scores[8].notes
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from app.engine.calculator import SajuCalculator
+from app.engine.fingerprint import chart_fingerprint
+from app.llm.formatter import format_saju_for_prompt
+
+
+class TestChartFingerprint:
+    def test_same_branch_shares_chart(self, calculator: SajuCalculator):
+        # 13:00-15:00 is 미시 (未時)
+        early = calculator.calculate(1990, 5, 15, 13, 10)
+        late = calculator.calculate(1990, 5, 15, 14, 50)
+        assert chart_fingerprint(early) == chart_fingerprint(late)
+        assert format_saju_for_prompt(early) == format_saju_for_prompt(late)
+
+    def test_different_branch_differs(self, calculator: SajuCalculator):
+        a = calculator.calculate(1990, 5, 15, 14, 50)
+        b = calculator.calculate(1990, 5, 15, 15, 10)
+        assert chart_fingerprint(a) != chart_fingerprint(b)
+
+    def test_gender_differs_through_da_yun(self, calculator: SajuCalculator):
+        male = calculator.calculate(1990, 5, 15, 14, 0, gender_male=True)
+        female = calculator.calculate(1990, 5, 15, 14, 0, gender_male=False)
+        assert chart_fingerprint(male) != chart_fingerprint(female)
+
+    def test_unknown_time_differs(self, calculator: SajuCalculator):
+        known = calculator.calculate(1990, 5, 15, 12, 0)
+        unknown = calculator.calculate(1990, 5, 15)
+        assert chart_fingerprint(known) != chart_fingerprint(unknown)
+
+    def test_true_solar_time_flag_differs(self, calculator: SajuCalculator):
+        plain = calculator.calculate(1990, 5, 15, 14, 50)
+        corrected = calculator.calculate(1990, 5, 15, 14, 50, use_true_solar_time=True)
+        assert chart_fingerprint(plain) != chart_fingerprint(corrected)
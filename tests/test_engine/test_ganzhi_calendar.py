@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from lunar_python import Solar
+
+from app.engine.ganzhi_calendar import (
+    GANZHI_60,
+    SHI_CHEN_HOURS,
+    GanZhiCalendar,
+    GanZhiTable,
+    _direct_pillars,
+    lunar_day_column,
+)
+
+
+class TestGanZhiTable:
+    def test_matches_lunar_python_around_li_chun(self):
+        # 2026 立春 falls on Feb 4; covers the year and month switch mid-day
+        table = GanZhiTable(date(2026, 1, 1), date(2026, 3, 31))
+        day = date(2026, 2, 2)
+        while day <= date(2026, 2, 6):
+            for hour in range(24):
+                assert table.pillars(day, hour) == _direct_pillars(day, hour), (day, hour)
+            day += timedelta(days=1)
+
+    def test_matches_lunar_python_sampled(self):
+        table = GanZhiTable(date(2025, 1, 1), date(2026, 12, 31))
+        day = date(2025, 1, 1)
+        while day <= date(2026, 12, 31):
+            for hour in (0, 11, 23):
+                assert table.pillars(day, hour) == _direct_pillars(day, hour), (day, hour)
+            day += timedelta(days=17)
+
+    def test_late_zi_uses_next_day_stem(self):
+        table = GanZhiTable(date(2026, 5, 1), date(2026, 5, 31))
+        late = table.pillars(date(2026, 5, 10), 23)
+        early = table.pillars(date(2026, 5, 11), 0)
+        assert late.time == early.time
+        assert late.day != early.day
+
+
+class TestGanZhiCalendar:
+    def test_lookup_inside_window(self):
+        calendar = GanZhiCalendar(window_days=30, today=lambda: date(2026, 6, 1))
+        assert calendar.pillars(2026, 6, 15, 14) == _direct_pillars(date(2026, 6, 15), 14)
+        assert calendar.snapshot() == {"start": "2026-05-02", "end": "2026-07-01"}
+
+    def test_lookup_outside_window_falls_back(self):
+        calendar = GanZhiCalendar(window_days=30, today=lambda: date(2026, 6, 1))
+        assert calendar.pillars(1999, 12, 31, 8) == _direct_pillars(date(1999, 12, 31), 8)
+
+    def test_window_rolls_forward(self):
+        today = [date(2026, 6, 1)]
+        calendar = GanZhiCalendar(window_days=10, refresh_days=5, today=lambda: today[0])
+        calendar.warm()
+        today[0] = date(2026, 6, 4)
+        calendar.pillars(2026, 6, 4)
+        assert calendar.snapshot()["start"] == "2026-05-22"
+        today[0] = date(2026, 6, 20)
+        calendar.pillars(2026, 6, 20)
+        assert calendar.snapshot()["start"] == "2026-06-10"
+
+    def test_shi_chen_pillars(self):
+        calendar = GanZhiCalendar(window_days=10, today=lambda: date(2026, 6, 1))
+        pillars = calendar.shi_chen_pillars(2026, 6, 3)
+        assert pillars == [_direct_pillars(date(2026, 6, 3), h).time for h in SHI_CHEN_HOURS]
+
+    def test_columns_inside_and_outside_window(self):
+        calendar = GanZhiCalendar(window_days=30, today=lambda: date(2026, 6, 1))
+        for start in (date(2026, 5, 20), date(2030, 2, 1)):
+            end = start + timedelta(days=20)
+            days, months = calendar.columns(start, end)
+            assert len(days) == len(months) == 21
+            for i in range(21):
+                expected = _direct_pillars(start + timedelta(days=i), 12)
+                assert (GANZHI_60[days[i]], GANZHI_60[months[i]]) == (expected.day, expected.month)
+
+
+def test_lunar_day_column():
+    start, end = date(2025, 12, 1), date(2026, 3, 31)
+    column = lunar_day_column(start, end)
+    for i, lunar_day in enumerate(column):
+        day = start + timedelta(days=i)
+        assert lunar_day == Solar.fromYmd(day.year, day.month, day.day).getLunar().getDay(), day
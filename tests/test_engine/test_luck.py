@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from app.config import settings
+from app.engine.calculator import SajuCalculator
+from app.engine.ganzhi_calendar import GanZhiCalendar
+from app.engine.luck import DA_YUN, SE_UN, WOL_UN, luck_timeline, year_ganzhi
+from app.llm.client import LLMClient
+from app.llm.formatter import format_saju_for_prompt
+from app.services.cache_service import CacheService
+from app.services.fortune_service import FortuneService
+
+
+@pytest.fixture(scope="module")
+def calendar() -> GanZhiCalendar:
+    return GanZhiCalendar(window_days=400, today=lambda: date(2027, 1, 1))
+
+
+@pytest.fixture(scope="module")
+def saju():
+    # 庚午 辛巳 庚辰 癸未, 대운 甲申 from 2017 and 乙酉 from 2027
+    return SajuCalculator().calculate(1990, 5, 15, 14, 0)
+
+
+class TestLuckTimeline:
+    def test_horizon(self, saju, calendar):
+        timeline = luck_timeline(saju, calendar, 2026, 10, years=3, months=4)
+        assert [(p.kind, p.year, p.gan_zhi) for p in timeline.da_yun] == [
+            (DA_YUN, 2017, "甲申"), (DA_YUN, 2027, "乙酉"),
+        ]
+        assert [(p.kind, p.year, p.gan_zhi) for p in timeline.years] == [
+            (SE_UN, 2026, "丙午"), (SE_UN, 2027, "丁未"), (SE_UN, 2028, "戊申"),
+        ]
+        assert [(p.kind, p.year, p.month, p.gan_zhi) for p in timeline.months] == [
+            (WOL_UN, 2026, 10, "戊戌"), (WOL_UN, 2026, 11, "己亥"),
+            (WOL_UN, 2026, 12, "庚子"), (WOL_UN, 2027, 1, "辛丑"),
+        ]
+
+    def test_ten_gods_match_calculator(self, saju, calendar):
+        # The 1990 세운 and May 1990 월운 are the chart's own year and month pillars
+        timeline = luck_timeline(saju, calendar, 1990, 5, years=1, months=1)
+        for period, pillar in ((timeline.years[0], saju.year_pillar), (timeline.months[0], saju.month_pillar)):
+            assert period.gan_zhi == pillar.gan + pillar.zhi
+            assert period.stem_ten_god == pillar.shi_shen_gan
+            assert period.branch_ten_god == pillar.shi_shen_zhi[0]
+
+    def test_relations_with_chart(self, saju, calendar):
+        month = luck_timeline(saju, calendar, 2026, 10, years=1, months=1).months[0]
+        assert any(i.positions == "일지-월운 지지" and i.relations == ("충",) for i in month.relations)
+
+    def test_year_ganzhi(self):
+        assert year_ganzhi(1984) == "甲子"
+        assert year_ganzhi(2026) == "丙午"
+
+
+class TestLuckTimelineCache:
+    def test_reused_per_chart_and_bounded(self, saju, calendar, monkeypatch):
+        monkeypatch.setattr(settings, "luck_timeline_cache_size", 2)
+        service = FortuneService(SajuCalculator(), LLMClient(None), CacheService(None), calendar)
+        first = service.luck_timeline(saju, 2026, 10)
+        assert service.luck_timeline(SajuCalculator().calculate(1990, 5, 15, 14, 30), 2026, 10) is first
+        service.luck_timeline(saju, 2026, 11)
+        service.luck_timeline(saju, 2026, 12)
+        assert service.luck_timeline(saju, 2026, 10) is not first
+
+    def test_prompt_section(self, saju, calendar):
+        prompt = format_saju_for_prompt(saju, luck=luck_timeline(saju, calendar, 2026, 10, years=1, months=1))
+        assert "## 운세 흐름 (대운·세운·월운, 확정, 괄호는 천간/지지 십신)" in prompt
+        assert "- 세운 2026년 丙午 (칠살/정관): 월간 辛丙 합, 연지 午午 형, 시지 未午 육합" in prompt
+        assert "- 월운 2026년 10월 戊戌 (편인/편인):" in prompt
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from app.engine.calculator import SajuCalculator
+from app.engine.relations import (
+    BRANCH_CHUNG,
+    BRANCH_CHUNG_BIT,
+    BRANCH_HAE_BIT,
+    BRANCH_HYUNG_BIT,
+    BRANCH_INDEX,
+    BRANCH_MASK_LABELS,
+    BRANCH_MASKS,
+    BRANCH_NONE,
+    BRANCH_PA_BIT,
+    BRANCH_RELATIONS,
+    BRANCH_SAMHAP,
+    BRANCH_SAMHAP_BIT,
+    BRANCH_YUKHAP,
+    BRANCH_YUKHAP_BIT,
+    STEM_CHUNG,
+    STEM_HAP,
+    STEM_HAP_BIT,
+    STEM_INDEX,
+    STEM_MASKS,
+    STEM_NONE,
+    STEM_RELATIONS,
+    Interaction,
+    chart_interactions,
+    date_interactions,
+    pair_interactions,
+)
+
+
+def _stem(a: str, b: str) -> int:
+    return STEM_RELATIONS[STEM_INDEX[a]][STEM_INDEX[b]]
+
+
+def _branch(a: str, b: str) -> int:
+    return BRANCH_RELATIONS[BRANCH_INDEX[a]][BRANCH_INDEX[b]]
+
+
+class TestStemRelations:
+    def test_combinations(self):
+        for a, b in ("甲己", "乙庚", "丙辛", "丁壬", "戊癸"):
+            assert _stem(a, b) == _stem(b, a) == STEM_HAP
+
+    def test_clashes(self):
+        for a, b in ("甲庚", "乙辛", "丙壬", "丁癸"):
+            assert _stem(a, b) == _stem(b, a) == STEM_CHUNG
+
+    def test_unrelated(self):
+        assert _stem("甲", "甲") == STEM_NONE
+        assert _stem("戊", "甲") == STEM_NONE
+
+
+class TestBranchRelations:
+    def test_six_harmonies(self):
+        for a, b in ("子丑", "寅亥", "卯戌", "辰酉", "巳申", "午未"):
+            assert _branch(a, b) == _branch(b, a) == BRANCH_YUKHAP
+
+    def test_three_harmonies(self):
+        for triad in ("申子辰", "亥卯未", "寅午戌", "巳酉丑"):
+            for a in triad:
+                for b in triad:
+                    if a != b:
+                        assert _branch(a, b) == BRANCH_SAMHAP
+
+    def test_clashes(self):
+        for a, b in ("子午", "丑未", "寅申", "卯酉", "辰戌", "巳亥"):
+            assert _branch(a, b) == _branch(b, a) == BRANCH_CHUNG
+
+    def test_same_branch_unrelated(self):
+        assert _branch("子", "子") == BRANCH_NONE
+
+
+def _mask(a: str, b: str) -> int:
+    return BRANCH_MASKS[BRANCH_INDEX[a]][BRANCH_INDEX[b]]
+
+
+class TestRelationMasks:
+    def test_symmetric(self):
+        for a in range(12):
+            for b in range(12):
+                assert BRANCH_MASKS[a][b] == BRANCH_MASKS[b][a]
+        for a in range(10):
+            for b in range(10):
+                assert STEM_MASKS[a][b] == STEM_MASKS[b][a]
+
+    def test_agrees_with_main_relation(self):
+        bits = {BRANCH_YUKHAP: BRANCH_YUKHAP_BIT, BRANCH_SAMHAP: BRANCH_SAMHAP_BIT, BRANCH_CHUNG: BRANCH_CHUNG_BIT}
+        for a in range(12):
+            for b in range(12):
+                relation = BRANCH_RELATIONS[a][b]
+                if relation != BRANCH_NONE:
+                    assert BRANCH_MASKS[a][b] & bits[relation]
+        assert STEM_MASKS[STEM_INDEX["甲"]][STEM_INDEX["己"]] == STEM_HAP_BIT
+
+    def test_punishments(self):
+        for a, b in ("寅巳", "巳申", "寅申", "丑戌", "戌未", "丑未", "子卯"):
+            assert _mask(a, b) & BRANCH_HYUNG_BIT
+        for a in "辰午酉亥":
+            assert _mask(a, a) == BRANCH_HYUNG_BIT
+        assert _mask("子", "子") == 0
+
+    def test_breaks_and_harms(self):
+        for a, b in ("子酉", "丑辰", "寅亥", "卯午", "巳申", "未戌"):
+            assert _mask(a, b) & BRANCH_PA_BIT
+        for a, b in ("子未", "丑午", "寅巳", "卯辰", "申亥", "酉戌"):
+            assert _mask(a, b) & BRANCH_HAE_BIT
+
+    def test_multiple_relations(self):
+        assert BRANCH_MASK_LABELS[_mask("巳", "申")] == ("육합", "형", "파")
+        assert BRANCH_MASK_LABELS[_mask("寅", "申")] == ("충", "형")
+
+
+class TestInteractions:
+    def test_chart(self, calculator: SajuCalculator):
+        # 庚午 辛巳 庚辰 癸未
+        saju = calculator.calculate(1990, 5, 15, 14, 0)
+        assert chart_interactions(saju) == (Interaction("연지-시지", "午未", ("육합",)),)
+
+    def test_pair(self, calculator: SajuCalculator):
+        # 庚午 辛巳 庚辰 癸未 / 壬申 庚戌 癸未 丁巳
+        first = calculator.calculate(1990, 5, 15, 14, 0)
+        second = calculator.calculate(1992, 11, 3, 9, 0)
+        found = pair_interactions(first, second)
+        assert Interaction("월지-상대 연지", "巳申", ("육합", "형", "파")) in found
+        assert Interaction("일지-상대 월지", "辰戌", ("충",)) in found
+        reverse = pair_interactions(second, first)
+        assert len(reverse) == len(found)
+
+    def test_date(self, calculator: SajuCalculator):
+        saju = calculator.calculate(1990, 5, 15, 14, 0)
+        found = date_interactions(saju, [("일진", "甲子")])
+        assert Interaction("일간-일진 천간", "庚甲", ("충",)) in found
+        assert Interaction("연지-일진 지지", "午子", ("충",)) in found
+        # Stem relations are listed before branch relations
+        kinds = [i.positions.split("-")[0][-1] for i in found]
+        assert kinds == sorted(kinds)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from app.engine.calculator import SajuCalculator
+from app.engine.sinsal import BAD, GOOD, SPECIAL, Sinsal, find_sinsal, void_branches
+from app.llm.formatter import format_sinsal
+
+
+def _by_name(found: tuple[Sinsal, ...]) -> dict[str, list[Sinsal]]:
+    grouped: dict[str, list[Sinsal]] = {}
+    for sinsal in found:
+        grouped.setdefault(sinsal.name, []).append(sinsal)
+    return grouped
+
+
+class TestVoidBranches:
+    def test_each_decade(self):
+        assert void_branches("甲子") == "戌亥"
+        assert void_branches("癸酉") == "戌亥"
+        assert void_branches("甲戌") == "申酉"
+        assert void_branches("癸亥") == "子丑"
+
+
+class TestFindSinsal:
+    def test_chart_with_goegang(self, calculator: SajuCalculator):
+        # 庚午 辛巳 庚辰 癸未
+        found = _by_name(find_sinsal(calculator.calculate(1990, 5, 15, 14, 0)))
+        assert found["천을귀인"] == [Sinsal("천을귀인", GOOD, ("시지",), "일간 庚")]
+        assert found["괴강"] == [Sinsal("괴강", SPECIAL, ("일주",), "일주 庚辰")]
+        assert found["월덕귀인"][0].positions == ("연간", "일간")
+        assert found["겁살"] == [Sinsal("겁살", BAD, ("월지",), "일지 辰")]
+        assert "도화" not in found
+
+    def test_frame_sinsal_read_from_year_and_day(self, calculator: SajuCalculator):
+        # 壬申 庚戌 癸未 丁巳
+        found = _by_name(find_sinsal(calculator.calculate(1992, 11, 3, 9, 0)))
+        assert found["역마"] == [Sinsal("역마", SPECIAL, ("시지",), "일지 未")]
+        assert [s.basis for s in found["겁살"]] == ["연지 申", "일지 未"]
+        assert found["공망"] == [Sinsal("공망", BAD, ("연지",), "일주 癸未 (申酉 공망)")]
+        assert found["원진"] == [Sinsal("원진", BAD, ("월지-시지",), "지지 쌍")]
+        assert found["홍염"][0].positions == ("연지",)
+
+    def test_unknown_birth_time(self, calculator: SajuCalculator):
+        for sinsal in find_sinsal(calculator.calculate(1992, 11, 3)):
+            assert all("시" not in position for position in sinsal.positions)
+
+    def test_prompt_rendering(self, calculator: SajuCalculator):
+        text = format_sinsal(find_sinsal(calculator.calculate(1990, 5, 15, 14, 0)))
+        assert "- 천을귀인 (길신): 시지 [일간 庚 기준]" in text
+        assert format_sinsal(()) == "- 없음"
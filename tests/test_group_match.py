@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from itertools import combinations
+
+from app.engine.calculator import SajuCalculator
+from app.services.celebrity_index import ChartColumns
+from app.services.celebrity_match import ChartRows, normalized, raw_scores
+from app.services.group_match import score_group
+
+_BIRTHS = [
+    (1990, 5, 15, 14), (1992, 11, 3, 9), (1985, 1, 1, 12), (1978, 7, 21, 6),
+    (2001, 2, 14, 18), (1995, 3, 10, 8), (1969, 10, 30, 22), (1988, 8, 8, 0),
+]
+
+
+def _group(calculator: SajuCalculator):
+    return [calculator.calculate(y, m, d, h, 0) for y, m, d, h in _BIRTHS]
+
+
+class TestScoreGroup:
+    def test_matrix_is_symmetric_mean_of_both_directions(self, calculator: SajuCalculator):
+        sajus = _group(calculator)
+        matrix = score_group(sajus)
+        columns = ChartColumns(sajus)
+        directional = []
+        for saju in sajus:
+            rows = ChartRows(saju)
+            directional.append([normalized(rows, raw) for raw in raw_scores(rows, columns)])
+
+        for i, j in combinations(range(len(sajus)), 2):
+            assert matrix.scores[i][j] == matrix.scores[j][i]
+            assert matrix.scores[i][j] == round((directional[i][j] + directional[j][i]) / 2)
+            assert 0 <= matrix.scores[i][j] <= 100
+        assert all(matrix.scores[i][i] is None for i in range(len(sajus)))
+
+    def test_clusters_partition_the_group(self, calculator: SajuCalculator):
+        matrix = score_group(_group(calculator))
+        members = sorted(i for cluster in matrix.clusters for i in cluster.members)
+        assert members == list(range(len(_BIRTHS)))
+        sizes = [len(cluster.members) for cluster in matrix.clusters]
+        assert sizes == sorted(sizes, reverse=True)
+        for cluster in matrix.clusters:
+            assert (cluster.cohesion is None) == (len(cluster.members) == 1)
+
+    def test_threshold_bounds(self, calculator: SajuCalculator):
+        sajus = _group(calculator)
+        assert len(score_group(sajus, cluster_threshold=0).clusters) == 1
+        assert len(score_group(sajus, cluster_threshold=101).clusters) == len(sajus)
+
+    def test_merged_clusters_reach_threshold(self, calculator: SajuCalculator):
+        matrix = score_group(_group(calculator), cluster_threshold=60)
+        for cluster in matrix.clusters:
+            if cluster.cohesion is not None:
+                assert cluster.cohesion >= 60
+
+    def test_best_and_worst_pairs(self, calculator: SajuCalculator):
+        matrix = score_group(_group(calculator), pair_limit=3)
+        assert len(matrix.best_pairs) == len(matrix.worst_pairs) == 3
+        best = [pair.score for pair in matrix.best_pairs]
+        worst = [pair.score for pair in matrix.worst_pairs]
+        assert best == sorted(best, reverse=True)
+        assert worst == sorted(worst)
+        pair_scores = [s for row in matrix.scores for s in row if s is not None]
+        assert best[0] == max(pair_scores)
+        assert worst[0] == min(pair_scores)
+        assert all(pair.first < pair.second for pair in matrix.best_pairs)
+        assert matrix.best_pairs[0].highlights
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.llm.hedging import HedgeMetrics, run_hedged
+
+
+def _streams(delays: dict[str, float], fail: frozenset[str] = frozenset()):
+    """Build an open_stream factory where each model waits `delay` before its text."""
+    cancelled: list[str] = []
+
+    def open_stream(model: str) -> AsyncIterator[str]:
+        async def gen() -> AsyncIterator[str]:
+            try:
+                await asyncio.sleep(delays[model])
+                if model in fail:
+                    raise RuntimeError(f"{model} failed")
+                yield f"{model}-a"
+                yield f"{model}-b"
+            except asyncio.CancelledError:
+                cancelled.append(model)
+                raise
+
+        return gen()
+
+    return open_stream, cancelled
+
+
+@pytest.mark.asyncio
+class TestRunHedged:
+    async def test_fast_primary_is_not_hedged(self):
+        open_stream, _ = _streams({"primary": 0.0, "hedge": 0.0})
+        metrics = HedgeMetrics()
+        text = await run_hedged(
+            open_stream, primary_model="primary", hedge_model="hedge",
+            budget_seconds=0.5, metrics=metrics,
+        )
+        assert text == "primary-aprimary-b"
+        assert metrics.hedged == 0
+        assert metrics.primary_wins == 1
+
+    async def test_slow_primary_loses_to_hedge(self):
+        open_stream, cancelled = _streams({"primary": 1.0, "hedge": 0.0})
+        metrics = HedgeMetrics()
+        text = await run_hedged(
+            open_stream, primary_model="primary", hedge_model="hedge",
+            budget_seconds=0.01, metrics=metrics,
+        )
+        assert text == "hedge-ahedge-b"
+        assert metrics.hedge_wins == 1
+        assert metrics.hedge_calls_by_model == {"hedge": 1}
+        assert cancelled == ["primary"]
+        assert metrics.snapshot()["hedge_win_rate"] == 1.0
+
+    async def test_primary_can_still_win_after_hedge(self):
+        open_stream, cancelled = _streams({"primary": 0.05, "hedge": 1.0})
+        metrics = HedgeMetrics()
+        text = await run_hedged(
+            open_stream, primary_model="primary", hedge_model="hedge",
+            budget_seconds=0.01, metrics=metrics,
+        )
+        assert text == "primary-aprimary-b"
+        assert metrics.hedged == 1
+        assert metrics.primary_wins == 1
+        assert cancelled == ["hedge"]
+
+    async def test_failed_hedge_falls_back_to_primary(self):
+        open_stream, _ = _streams({"primary": 0.05, "hedge": 0.0}, fail=frozenset({"hedge"}))
+        text = await run_hedged(
+            open_stream, primary_model="primary", hedge_model="hedge",
+            budget_seconds=0.01, metrics=HedgeMetrics(),
+        )
+        assert text == "primary-aprimary-b"
+
+    async def test_both_failing_raises(self):
+        open_stream, _ = _streams(
+            {"primary": 0.05, "hedge": 0.0}, fail=frozenset({"primary", "hedge"}),
+        )
+        with pytest.raises(RuntimeError):
+            await run_hedged(
+                open_stream, primary_model="primary", hedge_model="hedge",
+                budget_seconds=0.01, metrics=HedgeMetrics(),
+            )
+
+
+@pytest.mark.asyncio
+class TestCancellation:
+    async def test_caller_cancellation_during_cleanup_propagates(self):
+        def open_stream(model: str) -> AsyncIterator[str]:
+            async def gen() -> AsyncIterator[str]:
+                if model == "hedge":
+                    yield "hedge"
+                    return
+                try:
+                    await asyncio.sleep(10)
+                    yield "primary"
+                except asyncio.CancelledError:
+                    await asyncio.sleep(0.2)  # slow cleanup of the losing request
+                    raise
+
+            return gen()
+
+        task = asyncio.create_task(run_hedged(
+            open_stream, primary_model="primary", hedge_model="hedge",
+            budget_seconds=0.01, metrics=HedgeMetrics(),
+        ))
+        await asyncio.sleep(0.05)  # hedge has won; run_hedged is cancelling the primary
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+from anthropic import AsyncAnthropic
+
+from app.config import Settings
+from app.llm.http_pool import InstrumentedTransport, PoolMetrics, build_http_client, httpx
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=b"ok")
+
+
+@pytest.mark.asyncio
+class TestInstrumentedTransport:
+    async def test_counts_requests_and_releases_slot(self):
+        metrics = PoolMetrics(max_connections=4)
+        transport = InstrumentedTransport(httpx.MockTransport(_ok), metrics)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            async with client.stream("GET", "/") as response:
+                assert metrics.in_flight == 1
+                assert metrics.snapshot()["utilization"] == 0.25
+                await response.aread()
+            assert metrics.in_flight == 0
+        assert metrics.requests == 1
+        assert metrics.peak_in_flight == 1
+
+    async def test_failed_request_releases_slot(self):
+        def boom(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("down")
+
+        metrics = PoolMetrics(max_connections=4)
+        transport = InstrumentedTransport(httpx.MockTransport(boom), metrics)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("/")
+        assert metrics.in_flight == 0
+        assert metrics.requests == 0
+
+
+@pytest.mark.asyncio
+class TestBuildHttpClient:
+    async def test_client_uses_settings(self):
+        config = Settings(llm_max_connections=7, llm_http2=False, llm_connect_timeout=2.0)
+        client, metrics = build_http_client(config)
+        assert metrics.max_connections == 7
+        assert client.timeout.connect == 2.0
+        await client.aclose()
+
+    async def test_client_is_accepted_by_anthropic_sdk(self):
+        client, _ = build_http_client(Settings(llm_http2=False))
+        anthropic = AsyncAnthropic(api_key="test", http_client=client)
+        await anthropic.close()
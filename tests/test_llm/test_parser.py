@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from app.llm.parser import parse_interpretation
+import json
+from pathlib import Path
+
+import pytest
+
+from app.llm.parser import StreamingInterpretationParser, parse_interpretation
 
 
 class TestParseInterpretation:
@@ -97,3 +102,110 @@ class TestParseInterpretation:
         assert len(d["sections"]) == 1
         assert d["sections"][0]["title"] == "섹션"
         assert d["sections"][0]["content"] == "내용"
+
+    def test_title_on_following_line(self):
+        # "###" with nothing after it takes the next non-blank line as its title
+        result = parse_interpretation("요약\n###\n\n첫 섹션\n내용")
+        assert [(s.title, s.content) for s in result.sections] == [("첫 섹션", "내용")]
+
+    def test_numbering_without_title(self):
+        result = parse_interpretation("### 1.\n제목\n내용\n\n### 2\n끝")
+        assert [(s.title, s.content) for s in result.sections] == [("제목", "내용"), ("2", "끝")]
+
+    def test_hashes_inside_line_are_not_headers(self):
+        result = parse_interpretation("요약\n\n### 1. 분석\n내용 ### 아님\n#### 소제목")
+        assert len(result.sections) == 1
+        assert result.sections[0].content == "내용 ### 아님\n#### 소제목"
+
+
+_CORPUS_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "llm_outputs"
+
+
+@pytest.mark.parametrize("path", sorted(_CORPUS_DIR.glob("*.md")), ids=lambda p: p.stem)
+def test_corpus_matches_expected(path):
+    expected = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+    assert parse_interpretation(path.read_text(encoding="utf-8")).model_dump() == expected
+
+
+_STREAM_SAMPLES = [
+    """핵심 요약 문장입니다.
+
+### 1. 첫 번째 섹션
+첫 번째 내용입니다.
+
+두 번째 문단입니다.
+
+### 2. 조언
+조언 내용
+
+(본 분석은 전통 역학에 기반한 참고 정보입니다.)
+""",
+    """## 사주 해석
+
+### 1. 성격
+**강한** 리더십을 가진 성격입니다. 추가 설명.
+
+### 2. 재물
+본인의 노력이 중요합니다.
+""",
+    """### 1. 분석
+본 분석은 중간에 등장하지만 면책 문구가 아닙니다.
+이후 내용이 계속 이어집니다.
+한 줄 더.
+또 한 줄.
+마지막 줄.
+
+### 2. 마무리
+끝.
+""",
+    "요약만 있는 응답입니다.\n\n본 해석은 참고용입니다.",
+    "",
+]
+
+
+def _collect_stream(raw: str, chunk_size: int) -> tuple[list, dict]:
+    parser = StreamingInterpretationParser()
+    events = []
+    for i in range(0, len(raw), chunk_size):
+        events.extend(parser.feed(raw[i:i + chunk_size]))
+    events.extend(parser.close())
+
+    result = {"summary": None, "sections": [], "disclaimer": None}
+    for event in events:
+        if event.event == "section_start":
+            result["sections"].append({"title": event.data["title"], "content": ""})
+        elif event.event == "section_delta":
+            result["sections"][event.data["index"]]["content"] += event.data["text"]
+        else:
+            result[event.event] = event.data["text"]
+    for section in result["sections"]:
+        section["content"] = section["content"].strip()
+    return events, result
+
+
+class TestStreamingInterpretationParser:
+    @pytest.mark.parametrize("raw", _STREAM_SAMPLES)
+    @pytest.mark.parametrize("chunk_size", [1, 3, 17, 10_000])
+    def test_matches_batch_parser(self, raw, chunk_size):
+        _, result = _collect_stream(raw, chunk_size)
+        assert result == parse_interpretation(raw).model_dump()
+
+    def test_section_text_streams_before_line_ends(self):
+        parser = StreamingInterpretationParser()
+        parser.feed("요약\n### 1. 분석\n")
+        events = parser.feed("긴 내용이 아직 ")
+        assert [e.event for e in events] == ["section_delta"]
+        assert events[0].data == {"index": 0, "text": "긴 내용이 아직 "}
+
+    def test_event_order(self):
+        events, _ = _collect_stream(_STREAM_SAMPLES[0], 5)
+        names = [e.event for e in events]
+        assert names[0] == "summary"
+        assert names[1] == "section_start"
+        assert names[-1] == "disclaimer"
+        assert names.count("section_start") == 2
+
+    def test_disclaimer_not_streamed_as_content(self):
+        events, _ = _collect_stream(_STREAM_SAMPLES[0], 4)
+        streamed = "".join(e.data["text"] for e in events if e.event == "section_delta")
+        assert "본 분석은" not in streamed
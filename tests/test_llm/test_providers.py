@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+from app.llm.client import LLMClient
+from app.llm.parser import parse_interpretation
+from app.llm.providers import FakeProvider, FakeProviderError
+from app.middleware.error_handler import LLMError
+from app.resilience import RetryPolicy
+
+_KWARGS = {
+    "model": "fake-model",
+    "system_prompt": "system",
+    "user_prompt": "prompt",
+    "max_tokens": 3000,
+    "temperature": 0.4,
+}
+
+
+@pytest.mark.asyncio
+class TestFakeProvider:
+    async def test_output_is_deterministic(self):
+        provider = FakeProvider(latency_ms=0, tokens_per_second=0)
+        first = await provider.create(**_KWARGS)
+        second = await provider.create(**_KWARGS)
+        assert first == second
+
+    async def test_output_depends_on_prompt(self):
+        provider = FakeProvider(latency_ms=0, tokens_per_second=0)
+        first = await provider.create(**_KWARGS)
+        second = await provider.create(**{**_KWARGS, "user_prompt": "other"})
+        assert first != second
+
+    async def test_stream_matches_create(self):
+        provider = FakeProvider(latency_ms=0, tokens_per_second=0)
+        chunks = [c async for c in provider.stream(**_KWARGS)]
+        assert len(chunks) > 1
+        assert "".join(chunks) == await provider.create(**_KWARGS)
+
+    async def test_output_parses_into_sections(self):
+        provider = FakeProvider(latency_ms=0, tokens_per_second=0, output_tokens=60)
+        result = parse_interpretation(await provider.create(**_KWARGS))
+        assert result.summary
+        assert len(result.sections) >= 1
+        assert result.disclaimer is not None
+
+    async def test_error_rate_one_always_fails(self):
+        provider = FakeProvider(latency_ms=0, tokens_per_second=0, error_rate=1.0)
+        with pytest.raises(FakeProviderError):
+            await provider.create(**_KWARGS)
+
+    async def test_error_sequence_is_seeded(self):
+        async def outcomes(seed: int) -> list[bool]:
+            provider = FakeProvider(
+                latency_ms=0, tokens_per_second=0, error_rate=0.5, seed=seed,
+            )
+            results = []
+            for _ in range(20):
+                try:
+                    await provider.create(**_KWARGS)
+                    results.append(True)
+                except FakeProviderError:
+                    results.append(False)
+            return results
+
+        assert await outcomes(7) == await outcomes(7)
+
+
+@pytest.mark.asyncio
+class TestLLMClientWithProvider:
+    async def test_generate_uses_provider(self):
+        client = LLMClient(FakeProvider(latency_ms=0, tokens_per_second=0))
+        text = await client.generate("prompt", reading_type="daily")
+        assert "###" in text
+        assert client.provider_name == "fake"
+
+    async def test_provider_error_is_wrapped(self):
+        client = LLMClient(
+            FakeProvider(latency_ms=0, tokens_per_second=0, error_rate=1.0),
+            retry_policy=RetryPolicy(attempts=1),
+        )
+        with pytest.raises(LLMError):
+            await client.generate("prompt")
+
+    async def test_missing_provider_raises(self):
+        with pytest.raises(LLMError):
+            await LLMClient(None).generate("prompt")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.llm.scheduler import LLMScheduler
+from app.middleware.error_handler import LLMOverloadedError
+
+
+@pytest.mark.asyncio
+class TestLLMScheduler:
+    async def test_limits_concurrency_per_model(self):
+        scheduler = LLMScheduler(default_limit=2, queue_timeout=1.0)
+        active = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal active, peak
+            async with scheduler.slot("m", "daily"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert scheduler.snapshot()["m"]["active"] == 0
+
+    async def test_models_have_independent_limits(self):
+        scheduler = LLMScheduler(
+            default_limit=1, limits_by_model={"big": 3}, queue_timeout=1.0,
+        )
+        async with (
+            scheduler.slot("small", "daily"),
+            scheduler.slot("big", "daily"),
+            scheduler.slot("big", "daily"),
+        ):
+            snapshot = scheduler.snapshot()
+        assert snapshot["small"]["limit"] == 1
+        assert snapshot["big"]["active"] == 2
+
+    async def test_premium_waiters_are_served_first(self):
+        scheduler = LLMScheduler(default_limit=1, queue_timeout=1.0)
+        order: list[str] = []
+
+        async def call(reading_type: str) -> None:
+            async with scheduler.slot("m", reading_type):
+                order.append(reading_type)
+
+        async with scheduler.slot("m", "daily"):
+            standard = asyncio.create_task(call("daily"))
+            await asyncio.sleep(0)
+            premium = asyncio.create_task(call("saju_reading"))
+            await asyncio.sleep(0)
+            assert scheduler.snapshot()["m"]["queued"] == 2
+        await asyncio.gather(standard, premium)
+        assert order == ["saju_reading", "daily"]
+
+    async def test_queue_deadline_fails_fast(self):
+        scheduler = LLMScheduler(default_limit=1, queue_timeout=0.01)
+        async with scheduler.slot("m", "daily"):
+            with pytest.raises(LLMOverloadedError) as exc_info:
+                async with scheduler.slot("m", "daily"):
+                    pass
+        assert exc_info.value.status_code == 503
+        snapshot = scheduler.snapshot()["m"]
+        assert snapshot["rejected"] == 1
+        assert snapshot["active"] == 0
+        assert snapshot["queued"] == 0
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        scheduler = LLMScheduler(default_limit=1, queue_timeout=1.0)
+        async with scheduler.slot("m", "daily"):
+            waiter = asyncio.create_task(scheduler.slot("m", "daily").__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        async with scheduler.slot("m", "daily"):
+            assert scheduler.snapshot()["m"]["active"] == 1
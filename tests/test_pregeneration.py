@@ -0,0 +1,163 @@
+"""Tests for overnight daily fortune pre-generation."""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+
+import pytest
+
+from app.engine.calculator import SajuCalculator
+from app.llm.client import LLMClient
+from app.llm.providers import FakeProvider
+from app.middleware.error_handler import LLMOverloadedError
+from app.models.request import BirthInput, FortuneRequest
+from app.services.cache_service import CacheService
+from app.services.fortune_service import FortuneService
+from app.services.pregeneration_service import (
+    DailyFortunePregenerator,
+    DailyPregenerationScheduler,
+    load_profiles,
+)
+
+_TARGET = date(2026, 10, 20)
+
+
+class _CountingProvider(FakeProvider):
+    def __init__(self, fail_first: int = 0):
+        super().__init__(latency_ms=0, tokens_per_second=0)
+        self.calls = 0
+        self._fail_first = fail_first
+
+    def _count(self) -> None:
+        self.calls += 1
+        if self.calls <= self._fail_first:
+            raise LLMOverloadedError("busy")
+
+    async def create(self, **kwargs) -> str:
+        self._count()
+        return await super().create(**kwargs)
+
+    async def stream(self, **kwargs):
+        # daily() is hedged, which streams
+        self._count()
+        async for chunk in super().stream(**kwargs):
+            yield chunk
+
+
+def _profiles(n: int) -> list[FortuneRequest]:
+    return [
+        FortuneRequest(birth=BirthInput(year=1990, month=1 + i % 12, day=1 + i, hour=10, gender="male"))
+        for i in range(n)
+    ]
+
+
+def _setup(provider: FakeProvider, cache: CacheService) -> tuple[FortuneService, CacheService]:
+    service = FortuneService(SajuCalculator(), LLMClient(provider), cache)
+    return service, cache
+
+
+def _pregenerator(service: FortuneService, cache: CacheService) -> DailyFortunePregenerator:
+    return DailyFortunePregenerator(
+        service, cache, requests_per_minute=0, concurrency=3, busy_backoff_seconds=0,
+    )
+
+
+@pytest.mark.asyncio
+class TestDailyFortunePregenerator:
+    async def test_fills_endpoint_cache_keys(self, memory_cache):
+        provider = _CountingProvider()
+        service, cache = _setup(provider, memory_cache)
+        profiles = _profiles(5)
+
+        report = await _pregenerator(service, cache).run(profiles, _TARGET)
+
+        assert (report.generated, report.skipped, report.failed) == (5, 0, 0)
+        # The endpoint path now hits the cache instead of the LLM
+        await service.daily(profiles[0].birth, _TARGET.year, _TARGET.month, _TARGET.day)
+        assert provider.calls == 5
+
+    async def test_rerun_resumes_without_regenerating(self, memory_cache):
+        provider = _CountingProvider()
+        service, cache = _setup(provider, memory_cache)
+        profiles = _profiles(4)
+        await _pregenerator(service, cache).run(profiles[:2], _TARGET)
+
+        report = await _pregenerator(service, cache).run(profiles, _TARGET)
+
+        assert (report.generated, report.skipped) == (2, 2)
+        assert provider.calls == 4
+
+    async def test_backs_off_when_llm_busy(self, memory_cache):
+        provider = _CountingProvider(fail_first=1)
+        service, cache = _setup(provider, memory_cache)
+        report = await _pregenerator(service, cache).run(_profiles(1), _TARGET)
+        assert report.generated == 1
+        assert provider.calls == 2
+
+    async def test_skips_without_cache(self):
+        provider = _CountingProvider()
+        service = FortuneService(SajuCalculator(), LLMClient(provider), CacheService(None))
+        report = await _pregenerator(service, CacheService(None)).run(_profiles(2), _TARGET)
+        assert report.generated == 0
+        assert provider.calls == 0
+
+
+@pytest.mark.asyncio
+class TestDailyPregenerationScheduler:
+    async def test_run_once_marks_done(self, tmp_path, memory_cache):
+        path = tmp_path / "profiles.jsonl"
+        path.write_text(
+            "\n".join(p.model_dump_json() for p in _profiles(2)) + "\n", encoding="utf-8",
+        )
+        provider = _CountingProvider()
+        service, cache = _setup(provider, memory_cache)
+        scheduler = DailyPregenerationScheduler(
+            _pregenerator(service, cache), cache, path,
+            hour=2, lock_seconds=60, now=lambda: datetime(2026, 10, 19, 2, 0),
+        )
+
+        assert await scheduler.run_once(_TARGET) is True
+        assert await scheduler.run_once(_TARGET) is True
+        assert provider.calls == 2
+
+    async def test_failed_run_is_retried(self, tmp_path, memory_cache):
+        path = tmp_path / "profiles.jsonl"
+        path.write_text(
+            "\n".join(p.model_dump_json() for p in _profiles(2)) + "\n", encoding="utf-8",
+        )
+        # Busy for every attempt of the first run
+        provider = _CountingProvider(fail_first=6)
+        service, cache = _setup(provider, memory_cache)
+        pregenerator = DailyFortunePregenerator(
+            service, cache, requests_per_minute=0, concurrency=1, busy_backoff_seconds=0,
+        )
+        scheduler = DailyPregenerationScheduler(
+            pregenerator, cache, path,
+            hour=2, lock_seconds=60, now=lambda: datetime(2026, 10, 19, 2, 0),
+        )
+
+        assert await scheduler.run_once(_TARGET) is False
+        assert provider.calls == 6
+        assert await scheduler.run_once(_TARGET) is True
+        assert provider.calls == 8
+        assert await scheduler.run_once(_TARGET) is True
+        assert provider.calls == 8
+
+    async def test_lock_held_elsewhere(self, tmp_path, memory_cache):
+        provider = _CountingProvider()
+        service, cache = _setup(provider, memory_cache)
+        scheduler = DailyPregenerationScheduler(
+            _pregenerator(service, cache), cache, tmp_path / "missing.jsonl",
+            hour=2, lock_seconds=60,
+        )
+        await cache.add(f"saju:pregen:daily:{_TARGET.isoformat()}:lock", "running", ttl=60)
+        assert await scheduler.run_once(_TARGET) is False
+
+
+def test_load_profiles(tmp_path):
+    path = tmp_path / "profiles.jsonl"
+    body = {"birth": {"year": 1990, "month": 5, "day": 15, "gender": "female"}, "language": "en"}
+    path.write_text(json.dumps(body) + "\n\n", encoding="utf-8")
+    profiles = load_profiles(path)
+    assert len(profiles) == 1
+    assert profiles[0].language == "en"
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from app.config import settings
+from app.middleware.rate_limiter import RateLimiterMiddleware
+from tests.conftest import MemoryRedis
+
+
+async def _echo(request: Request) -> Response:
+    return Response(await request.body(), media_type="application/json")
+
+
+async def _as_user(request: Request, call_next):
+    request.state.user_id = "user-1"
+    return await call_next(request)
+
+
+@pytest.fixture
+async def limited(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "require_service_token", True)
+    redis = MemoryRedis()
+
+    async def get_redis(self):
+        return redis
+
+    monkeypatch.setattr(RateLimiterMiddleware, "_get_redis", get_redis)
+    app = Starlette(routes=[
+        Route("/api/v1/bundle/readings", _echo, methods=["POST"]),
+        Route("/api/v1/saju/reading", _echo, methods=["POST"]),
+    ])
+    app.add_middleware(RateLimiterMiddleware)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=_as_user)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client, redis
+
+
+class TestRateLimiter:
+    async def test_single_reading_costs_one_unit(self, limited):
+        client, redis = limited
+        response = await client.post("/api/v1/saju/reading", json={"reading_types": ["a", "b"]})
+        assert response.status_code == 200
+        assert list(redis.data.values()) == [1]
+
+    async def test_bundle_costs_one_unit_per_reading(self, limited):
+        client, redis = limited
+        body = {"reading_types": ["saju_reading", "monthly", "saju_reading", "career_startup"]}
+        response = await client.post("/api/v1/bundle/readings", json=body)
+        assert response.status_code == 200
+        assert response.json() == body  # the body still reaches the route
+        assert list(redis.data.values()) == [3]
+
+    async def test_bundles_exhaust_the_window(self, limited):
+        client, _ = limited
+        body = {"reading_types": [f"type_{i}" for i in range(8)]}
+        statuses = [
+            (await client.post("/api/v1/bundle/readings", json=body)).status_code for _ in range(4)
+        ]
+        assert statuses == [200, 200, 200, 429]
+
+    async def test_malformed_bundle_costs_one_unit(self, limited):
+        client, redis = limited
+        await client.post("/api/v1/bundle/readings", content=b"not json")
+        assert list(redis.data.values()) == [1]
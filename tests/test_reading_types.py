@@ -41,6 +41,7 @@ class TestGetPromptForType:
     def test_sinsal_prompt(self):
         result = get_prompt_for_type("sinsal")
         assert result is SINSAL_READING_PROMPT
+        assert "{sinsal_data}" in result
 
     def test_unknown_type_falls_back_to_saju_reading(self):
         result = get_prompt_for_type("unknown_type")
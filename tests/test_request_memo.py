@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.engine.calculator import SajuCalculator
+from app.models.request import BirthInput
+from app.services.request_memo import memoized, request_scope
+from app.services.saju_service import calculate_birth
+
+
+class _CountingCalculator(SajuCalculator):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def calculate(self, *args, **kwargs):
+        self.calls += 1
+        return super().calculate(*args, **kwargs)
+
+
+class TestMemoized:
+    def test_computes_every_time_outside_a_scope(self):
+        calls = []
+        memoized("key", lambda: calls.append(1))
+        memoized("key", lambda: calls.append(1))
+        assert len(calls) == 2
+
+    def test_computes_once_per_scope(self):
+        calls = []
+        with request_scope():
+            assert memoized("key", lambda: calls.append(1) or len(calls)) == 1
+            assert memoized("key", lambda: calls.append(1) or len(calls)) == 1
+        with request_scope():
+            assert memoized("key", lambda: calls.append(1) or len(calls)) == 2
+
+    async def test_tasks_share_the_scope(self):
+        calls = []
+
+        async def use() -> int:
+            return memoized("key", lambda: calls.append(1) or len(calls))
+
+        with request_scope():
+            assert await asyncio.gather(use(), use()) == [1, 1]
+
+
+class TestCalculateBirth:
+    def test_same_birth_is_calculated_once_per_scope(self):
+        calculator = _CountingCalculator()
+        birth = BirthInput(year=1990, month=5, day=15, hour=14, gender="male")
+        with request_scope():
+            first = calculate_birth(calculator, birth)
+            assert calculate_birth(calculator, birth.model_copy()) is first
+            calculate_birth(calculator, birth.model_copy(update={"gender": "female"}))
+        assert calculator.calls == 2
@@ -0,0 +1,185 @@
+"""Tests for retry/backoff and circuit breakers (app.resilience)."""
+from __future__ import annotations
+
+import pytest
+
+from app.middleware.error_handler import CircuitOpenError
+from app.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    call_with_resilience,
+    retry_after_seconds,
+    stream_with_resilience,
+)
+from app.services.cache_service import CacheService
+
+_NO_DELAY = RetryPolicy(attempts=3, base_delay=0.0, max_delay=0.0)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Response:
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+
+
+class _ApiError(Exception):
+    def __init__(self, headers: dict[str, str]):
+        super().__init__("rate limited")
+        self.response = _Response(headers)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("dep", failure_threshold=2, reset_timeout=10)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_half_open_allows_single_probe(self):
+        clock = _Clock()
+        breaker = CircuitBreaker("dep", failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+
+    def test_successful_probe_closes(self):
+        clock = _Clock()
+        breaker = CircuitBreaker("dep", failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self):
+        clock = _Clock()
+        breaker = CircuitBreaker("dep", failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        clock.now = 15
+        assert not breaker.allow()
+
+
+class TestRetryPolicy:
+    def test_retry_after_seconds_header(self):
+        assert retry_after_seconds(_ApiError({"retry-after": "2"})) == 2.0
+
+    def test_retry_after_missing(self):
+        assert retry_after_seconds(ValueError("x")) is None
+
+    def test_respects_retry_after(self):
+        policy = RetryPolicy(attempts=3, base_delay=0.1, max_delay=5)
+        assert policy.delay_for(1, _ApiError({"retry-after": "3"})) == 3.0
+
+    def test_gives_up_when_retry_after_exceeds_max(self):
+        policy = RetryPolicy(attempts=3, base_delay=0.1, max_delay=5)
+        assert policy.delay_for(1, _ApiError({"retry-after": "60"})) is None
+
+    def test_jitter_is_bounded(self):
+        policy = RetryPolicy(attempts=5, base_delay=0.5, max_delay=1.0)
+        for attempt in range(1, 5):
+            assert 0 <= policy.delay_for(attempt, ValueError()) <= 1.0
+
+
+@pytest.mark.asyncio
+class TestCallWithResilience:
+    async def test_retries_transient_then_succeeds(self):
+        calls = 0
+
+        async def flaky() -> str:
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise ConnectionError("down")
+            return "ok"
+
+        breaker = CircuitBreaker("dep", failure_threshold=5)
+        result = await call_with_resilience(
+            flaky, breaker=breaker, policy=_NO_DELAY, is_retryable=lambda e: True,
+        )
+        assert result == "ok"
+        assert calls == 3
+        assert breaker.state == "closed"
+
+    async def test_non_retryable_is_not_retried(self):
+        calls = 0
+
+        async def bad() -> str:
+            nonlocal calls
+            calls += 1
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            await call_with_resilience(
+                bad, breaker=CircuitBreaker("dep"), policy=_NO_DELAY,
+                is_retryable=lambda e: False,
+            )
+        assert calls == 1
+
+    async def test_open_breaker_rejects_without_calling(self):
+        breaker = CircuitBreaker("dep", failure_threshold=1)
+        breaker.record_failure()
+
+        async def never() -> str:
+            raise AssertionError("should not be called")
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await call_with_resilience(
+                never, breaker=breaker, policy=_NO_DELAY, is_retryable=lambda e: True,
+            )
+        assert exc_info.value.status_code == 503
+
+    async def test_stream_not_retried_after_first_item(self):
+        attempts = 0
+
+        def open_stream():
+            async def gen():
+                nonlocal attempts
+                attempts += 1
+                yield "a"
+                raise ConnectionError("dropped")
+
+            return gen()
+
+        received = []
+        with pytest.raises(ConnectionError):
+            async for item in stream_with_resilience(
+                open_stream, breaker=CircuitBreaker("dep"), policy=_NO_DELAY,
+                is_retryable=lambda e: True,
+            ):
+                received.append(item)
+        assert received == ["a"]
+        assert attempts == 1
+
+
+class _DeadRedis:
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+
+@pytest.mark.asyncio
+class TestCacheServiceBreaker:
+    async def test_dead_redis_is_skipped_once_open(self):
+        redis = _DeadRedis()
+        cache = CacheService(redis, breaker=CircuitBreaker("redis", failure_threshold=2))
+        for _ in range(5):
+            assert await cache.get("k") is None
+        assert redis.calls == 2
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from httpx import AsyncClient
+
+_BIRTH = {"year": 1990, "month": 5, "day": 15, "hour": 14, "gender": "male"}
+
+
+class TestBundleEndpoint:
+    async def test_streams_each_reading(self, client: AsyncClient):
+        # The test LLM client has no provider, so every reading reports an error event
+        response = await client.post(
+            "/api/v1/bundle/readings",
+            json={"birth": _BIRTH, "reading_types": ["saju_reading", "monthly"]},
+        )
+        assert response.status_code == 200
+        events = [
+            line.removeprefix("event: ").strip()
+            for line in response.text.splitlines()
+            if line.startswith("event:")
+        ]
+        assert events == ["calculation", "error", "error", "done"]
+
+    async def test_rejects_unsupported_reading_type(self, client: AsyncClient):
+        response = await client.post(
+            "/api/v1/bundle/readings",
+            json={"birth": _BIRTH, "reading_types": ["pet_reading"]},
+        )
+        assert response.status_code == 422
+        assert response.json()["error"] == "InvalidBundleError"
@@ -179,3 +179,25 @@ class TestCelebrityCompatibilityEndpoint:
             },
         )
         assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+class TestCelebrityBestMatchEndpoint:
+    @patch("app.llm.client.LLMClient.generate", new_callable=AsyncMock)
+    async def test_ranks_without_llm(self, mock_generate: AsyncMock, client: AsyncClient):
+        response = await client.post(
+            "/api/v1/celebrity/best-match",
+            json={
+                "birth": {"year": 1995, "month": 3, "day": 10, "hour": 8, "gender": "female"},
+                "limit": 3,
+                "gender": "male",
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 3
+        assert [m["score"] for m in data["matches"]] == sorted(
+            (m["score"] for m in data["matches"]), reverse=True,
+        )
+        assert all(m["celebrity"]["id"] for m in data["matches"])
+        mock_generate.assert_not_called()
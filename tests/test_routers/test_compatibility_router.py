@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+_A = {"year": 1990, "month": 5, "day": 15, "hour": 14, "gender": "male"}
+_B = {"year": 1992, "month": 8, "day": 20, "hour": 9, "gender": "female"}
+_PERSON1_BIRTH = re.compile(r"## 사람 1 사주 데이터\n생년월일: (\d+)년 (\d+)월 (\d+)일")
+
+
+async def _name_person1(prompt: str, **kwargs) -> str:
+    """Narrative naming 사람 1 by the birth date the prompt gives it."""
+    year, month, day = _PERSON1_BIRTH.search(prompt).groups()
+    return f"## 궁합 개요\n사람 1은 {int(year)}-{int(month):02d}-{int(day):02d}생입니다."
+
+
+def _member(label: str | None, year: int, month: int, day: int) -> dict:
+    return {"label": label, "birth": {"year": year, "month": month, "day": day, "gender": "female"}}
+
+
+class TestGroupEndpoint:
+    async def test_matrix_without_interpretation(self, client: AsyncClient):
+        response = await client.post(
+            "/api/v1/compatibility/group",
+            json={
+                "members": [
+                    _member("민수", 1990, 5, 15),
+                    _member(None, 1992, 11, 3),
+                    _member("철수", 1985, 1, 1),
+                ],
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["interpretation"] is None
+        assert [m["label"] for m in data["members"]] == ["민수", "사람 2", "철수"]
+        assert data["members"][0]["pillars"] == "庚午 辛巳 庚辰"
+        matrix = data["matrix"]
+        assert len(matrix) == 3
+        assert matrix[0][0] is None
+        assert matrix[0][1] == matrix[1][0]
+        assert sorted(i for c in data["clusters"] for i in c["members"]) == [0, 1, 2]
+        assert len(data["best_pairs"]) == 3  # every pair of three members
+
+    async def test_rejects_more_than_50_members(self, client: AsyncClient):
+        members = [_member(None, 1990, 1, 1 + i % 28) for i in range(51)]
+        response = await client.post("/api/v1/compatibility/group", json={"members": members})
+        assert response.status_code == 422
+
+
+class TestPairOrder:
+    @pytest.mark.parametrize("path", ["/api/v1/compatibility/analyze", "/api/v1/marriage/timing"])
+    @patch("app.llm.client.LLMClient.generate", new_callable=AsyncMock)
+    async def test_response_matches_the_narrative(
+        self, mock_generate: AsyncMock, client: AsyncClient, path: str,
+    ):
+        mock_generate.side_effect = _name_person1
+        results = []
+        for first, second in ((_A, _B), (_B, _A)):
+            response = await client.post(path, json={"person1": first, "person2": second})
+            assert response.status_code == 200
+            data = response.json()
+            named = re.search(r"사람 1은 ([\d-]+)생", json.dumps(data["interpretation"], ensure_ascii=False))
+            assert named.group(1) == data["person1"]["solar_date"]
+            results.append(data)
+
+        assert results[0]["person1"] == results[1]["person1"]
+        assert results[0]["persons_swapped"] != results[1]["persons_swapped"]
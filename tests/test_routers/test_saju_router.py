@@ -11,6 +11,15 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ok"
+        assert data["breakers"]["llm"]["state"] == "closed"
+        assert data["breakers"]["redis"]["state"] == "closed"
+
+    async def test_llm_metrics(self, client: AsyncClient):
+        response = await client.get("/health/llm")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["provider"] is None
+        assert data["hedging"]["requests"] == 0
 
 
 @pytest.mark.asyncio
@@ -194,3 +203,20 @@ class TestSajuCalculateEndpoint:
         assert len(data["da_yun_list"]) > 0
         assert "start_age" in data["da_yun_list"][0]
         assert "gan_zhi" in data["da_yun_list"][0]
+
+
+@pytest.mark.asyncio
+class TestSinsalEndpoint:
+    async def test_computed_sinsal_without_interpretation(self, client: AsyncClient):
+        response = await client.post(
+            "/api/v1/saju/sinsal",
+            json={
+                "birth": {"year": 1990, "month": 5, "day": 15, "hour": 14, "gender": "male"},
+                "interpret": False,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["interpretation"] is None
+        assert data["calculation"]["day_master"] == "庚"
+        assert {"name": "천을귀인", "kind": "길신", "positions": ["시지"], "basis": "일간 庚"} in data["sinsal"]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from app.engine.auspicious import HourScorer
+from app.llm.client import LLMClient
+
+
+class TestBestHoursEndpoint:
+    async def test_scores_without_interpretation(self, client: AsyncClient):
+        response = await client.post(
+            "/api/v1/timing/best-hours",
+            json={
+                "birth": {"year": 1990, "month": 5, "day": 15, "hour": 14, "gender": "male"},
+                "target_year": 2027,
+                "target_month": 3,
+                "target_day": 3,
+                "interpret": False,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["interpretation"] is None
+        assert data["target_datetime"] == "2027-03-03"
+        hours = data["hour_scores"]
+        assert len(hours) == 12
+        assert hours[0]["shi_chen"].startswith("자시")
+        assert all(0 <= hour["score"] <= 100 for hour in hours)
+
+    async def test_interpretation_reuses_the_scores(
+        self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        calls = []
+        score = HourScorer.score
+
+        def counting_score(self, day_pillar, hour_pillars):
+            calls.append(day_pillar)
+            return score(self, day_pillar, hour_pillars)
+
+        async def generate(self, prompt, **kwargs):
+            return "## 총평\n좋은 시간대"
+
+        monkeypatch.setattr(HourScorer, "score", counting_score)
+        monkeypatch.setattr(LLMClient, "generate", generate)
+        response = await client.post(
+            "/api/v1/timing/best-hours",
+            json={
+                "birth": {"year": 1990, "month": 5, "day": 15, "hour": 14, "gender": "male"},
+                "target_year": 2027,
+                "target_month": 3,
+                "target_day": 3,
+            },
+        )
+        assert response.status_code == 200
+        assert response.json()["interpretation"] is not None
+        assert len(calls) == 1
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import pytest
+
+from app.engine.calculator import SajuCalculator
+from app.models.response import SajuCalculateResponse
+from app.services.saju_service import SajuService
+
+
+def _asdict_reference(saju) -> dict:
+    d = asdict(saju)
+    d["solar_date"] = f"{saju.solar_year}-{saju.solar_month:02d}-{saju.solar_day:02d}"
+    d["lunar_date"] = f"{saju.lunar_year}-{abs(saju.lunar_month):02d}-{saju.lunar_day:02d}"
+    for key in (
+        "solar_year", "solar_month", "solar_day", "solar_hour", "solar_minute",
+        "lunar_year", "lunar_month", "lunar_day",
+    ):
+        del d[key]
+    return d
+
+
+class TestSajuToDict:
+    @pytest.mark.parametrize("hour", [14, None])
+    def test_matches_asdict_output(self, calculator: SajuCalculator, hour: int | None):
+        saju = calculator.calculate(1990, 5, 15, hour, 0 if hour is not None else None)
+        service = SajuService(calculator, None, None)
+        d = service.saju_to_dict(saju)
+        assert d == _asdict_reference(saju)
+        assert SajuCalculateResponse(**d).day_pillar.gan == "庚"
+
+    def test_does_not_copy_chart_values(self, calculator: SajuCalculator):
+        saju = calculator.calculate(1990, 5, 15, 14, 0)
+        d = SajuService(calculator, None, None).saju_to_dict(saju)
+        assert d["element_counts"] is saju.element_counts
+        assert d["day_pillar"]["hide_gan"] is saju.day_pillar.hide_gan